@@ -0,0 +1,211 @@
+"""Microbenchmarks of the Genome and evolution hot paths.
+
+Run from the repository root with e.g.
+    python -m benchmarks.micro --output results.json
+    python -m benchmarks.micro --baseline results.json
+"""
+
+from argparse import ArgumentParser
+from itertools import cycle
+from pathlib import Path
+from typing import Callable, Iterator
+import random
+import sys
+import tempfile
+
+from neat.genome import Genome
+from neat.genome.activation_functions import sigmoid
+from neat.history import History
+from neat.evolution import crossover, crossover_compact, mutate, mutate_population_weights
+from neat.evolution.mutation import mutate_weights, add_connection
+from neat.population.species import Species
+from neat.numpy_support import numpy
+
+from benchmarks.synthetic import GENOME_SIZES, POPULATION_SIZES, synthetic_players, synthetic_settings, \
+    synthetic_population
+from benchmarks.results import time_per_call, save_results, load_results, compare_results
+
+
+# Each benchmark takes a Genome size, a Population size and the timing arguments, and yields
+# (parameters, timing) for each of the configurations it runs
+type Benchmark = Callable[[str, int, dict], Iterator[tuple[dict, dict]]]
+benchmarks: dict[str, Benchmark] = dict()
+
+
+def benchmark(function: Benchmark) -> Benchmark:
+    """Register the given benchmark under its name."""
+    benchmarks[function.__name__] = function
+    return function
+
+
+@benchmark
+def propagate(size: str, population_size: int, timing: dict) -> Iterator[tuple[dict, dict]]:
+    [player] = synthetic_players(size, 1, History())
+    inputs = [random.uniform(-1, 1) for _ in range(player.genome.input_count)]
+    yield {'size': size}, time_per_call(lambda: player.genome.propagate(inputs), **timing)
+
+
+@benchmark
+def clone(size: str, population_size: int, timing: dict) -> Iterator[tuple[dict, dict]]:
+    [player] = synthetic_players(size, 1, History())
+    yield {'size': size}, time_per_call(player.genome.clone, **timing)
+
+
+@benchmark
+def crossover_genomes(size: str, population_size: int, timing: dict) -> Iterator[tuple[dict, dict]]:
+    players = synthetic_players(size, 50, History())
+    pairs = cycle(zip(players, reversed(players)))
+    for compact in [False, True]:
+        function = crossover_compact if compact else crossover
+        def cross() -> None:
+            player1, player2 = next(pairs)
+            function(player1.genome, player2.genome, 0.75)
+        yield {'size': size, 'compact': compact}, time_per_call(cross, **timing)
+
+
+@benchmark
+def mutate_genome(size: str, population_size: int, timing: dict) -> Iterator[tuple[dict, dict]]:
+    history = History()
+    players = synthetic_players(size, 50, history)
+    prepare = lambda: random.choice(players).genome.clone()
+    function = lambda genome: mutate(genome, 0.8, 0.1, 0.1, 0.03, sigmoid, history)
+    yield {'size': size}, time_per_call(function, prepare, **timing)
+
+
+@benchmark
+def mutate_population(size: str, population_size: int, timing: dict) -> Iterator[tuple[dict, dict]]:
+    players = synthetic_players(size, population_size, History())
+    methods = ['sequential', 'vectorized'] if numpy is not None else ['sequential']
+    for method in methods:
+        for compact in [False, True]:
+            genomes = [player.genome.compact() if compact else player.genome.clone() for player in players]
+            if method == 'vectorized':
+                function = lambda: mutate_population_weights(genomes, 0.1)
+            else:
+                function = lambda: [mutate_weights(genome, 0.1) for genome in genomes]
+            parameters = {'size': size, 'population': population_size, 'method': method, 'compact': compact}
+            yield parameters, time_per_call(function, **timing)
+
+
+@benchmark
+def get_innovation_number(size: str, population_size: int, timing: dict) -> Iterator[tuple[dict, dict]]:
+    history = History()
+    [player] = synthetic_players(size, 1, history)
+
+    # Hits: the Genome as it was when each of its new Connections was made, and that Connection
+    genome = player.genome.clone()
+    mutations = []
+    for _ in range(50):
+        before = genome.clone()
+        add_connection(genome, history)
+        innovation = history.innovations[-1]
+        nodes = before.nodes_dict
+        mutations.append((before, nodes[innovation.from_node_number], nodes[innovation.to_node_number]))
+    hits = cycle(mutations)
+    def hit() -> None:
+        history.get_innovation_number(*next(hits))
+    yield {'size': size, 'lookup': 'hit'}, time_per_call(hit, **timing)
+
+    # Misses: the same mutations looked up in a fresh History, so each creates a new Innovation
+    misses = cycle(mutations)
+    def miss(fresh_history: History) -> None:
+        fresh_history.get_innovation_number(*next(misses))
+    yield {'size': size, 'lookup': 'miss'}, time_per_call(miss, History, **timing)
+
+
+@benchmark
+def is_same_species(size: str, population_size: int, timing: dict) -> Iterator[tuple[dict, dict]]:
+    players = synthetic_players(size, 50, History())
+    settings = synthetic_settings(size, 50, '')['species_settings']
+    for compact in [False, True]:
+        specie = Species(players[0], settings, compact)
+        others = cycle(players[1:])
+        yield {'size': size, 'compact': compact}, time_per_call(lambda: specie.is_same_species(next(others)), **timing)
+
+
+@benchmark
+def speciate(size: str, population_size: int, timing: dict) -> Iterator[tuple[dict, dict]]:
+    methods = ['sequential', 'bulk'] if numpy is not None else ['sequential']
+    for method in methods:
+        population = synthetic_population(size, population_size)
+        population._bulk_speciation = method == 'bulk'
+
+        def split() -> None:
+            population.species = []
+            population.speciate()
+
+        parameters = {'size': size, 'population': population_size, 'method': method}
+        yield parameters, time_per_call(split, **timing)
+
+
+@benchmark
+def save_and_load(size: str, population_size: int, timing: dict) -> Iterator[tuple[dict, dict]]:
+    [player] = synthetic_players(size, 1, History())
+    with tempfile.TemporaryDirectory() as folder:
+        folder = Path(folder)
+        for compact in [False, True]:
+            genome = player.genome.compact() if compact else player.genome
+            yield {'size': size, 'compact': compact, 'operation': 'save'}, \
+                  time_per_call(lambda: genome.save(folder, 'genome'), **timing)
+            yield {'size': size, 'compact': compact, 'operation': 'load'}, \
+                  time_per_call(lambda: Genome.load(folder / 'genome.pickle'), **timing)
+
+
+# Benchmarks whose cost depends on the Population size as well as the Genome size
+population_benchmarks: list[str] = ['mutate_population', 'speciate']
+
+
+def run_benchmarks(names: list[str], sizes: list[str], population_sizes: list[int], timing: dict) -> list[dict]:
+    """Run the named benchmarks with each of the given Genome (and Population) sizes, printing
+    and returning the results."""
+
+    results = []
+    for name in names:
+        for size in sizes:
+            for population_size in population_sizes if name in population_benchmarks else [None]:
+                random.seed(0)
+                for parameters, result in benchmarks[name](size, population_size, timing):
+                    result = {'benchmark': name, 'parameters': parameters, **result}
+                    results.append(result)
+                    print(f'{name:<24} {str(parameters):<70} {result['seconds_per_call'] * 1e6:>12.2f} us')
+
+    return results
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Run microbenchmarks of the Genome and evolution hot paths.')
+    parser.add_argument('benchmarks', nargs='*', help=f'the benchmarks to run from {list(benchmarks)} (default all)')
+    parser.add_argument('--sizes', default=','.join(GENOME_SIZES),
+                        help=f'comma separated synthetic Genome sizes from {list(GENOME_SIZES)}')
+    parser.add_argument('--populations', default=','.join(map(str, POPULATION_SIZES)),
+                        help='comma separated Population sizes')
+    parser.add_argument('--repeat', type=int, default=5, help='rounds of timing per benchmark (the best is kept)')
+    parser.add_argument('--min-time', type=float, default=.05, help='minimum number of seconds per round')
+    parser.add_argument('--output', type=Path, help='file to save the results to as JSON')
+    parser.add_argument('--baseline', type=Path, help='JSON results to compare against')
+    parser.add_argument('--tolerance', type=float, default=.1,
+                        help='fraction slower than the baseline that counts as a regression')
+    args = parser.parse_args()
+
+    for name in args.benchmarks:
+        if name not in benchmarks:
+            parser.error(f'Benchmark \'{name}\' must be one of {list(benchmarks)}.')
+    sizes = args.sizes.split(',')
+    for size in sizes:
+        if size not in GENOME_SIZES:
+            parser.error(f'Genome size \'{size}\' must be one of {list(GENOME_SIZES)}.')
+    population_sizes = [int(population_size) for population_size in args.populations.split(',')]
+    timing = {'repeat': args.repeat, 'min_time': args.min_time}
+
+    results = run_benchmarks(args.benchmarks or list(benchmarks), sizes, population_sizes, timing)
+
+    if args.output is not None:
+        save_results(results, args.output)
+    if args.baseline is not None:
+        regressions, _ = compare_results(results, load_results(args.baseline), 'seconds_per_call',
+                                         tolerance=args.tolerance)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
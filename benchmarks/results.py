@@ -0,0 +1,100 @@
+from pathlib import Path
+from typing import Callable, Any
+import json
+import time
+
+
+def time_per_call(
+    function: Callable[..., Any],
+    prepare: Callable[[], Any] | None = None,
+    repeat: int = 5,
+    min_time: float = .05,
+) -> dict[str, float | int]:
+    """Return the best and mean time per call of function, over repeat rounds of calls that each
+    take at least min_time seconds.
+
+    If prepare is given then function is called with a new result of prepare each time, and the
+    time spent preparing isn't counted.
+    """
+
+    def round_time(number: int) -> float:
+        if prepare is None:
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            return time.perf_counter() - start
+
+        arguments = [prepare() for _ in range(number)]
+        start = time.perf_counter()
+        for argument in arguments:
+            function(argument)
+        return time.perf_counter() - start
+
+    # Find how many calls make up a round
+    number = 1
+    while round_time(number) < min_time and number < 1 << 20:
+        number *= 2
+
+    timings = [round_time(number) / number for _ in range(repeat)]
+    return {
+        'seconds_per_call': min(timings),
+        'mean_seconds_per_call': sum(timings) / len(timings),
+        'calls': number * repeat,
+    }
+
+
+def result_key(result: dict) -> str:
+    """Return the name identifying a result, made of its benchmark and parameters."""
+
+    parameters = ','.join(f'{name}={value}' for name, value in result['parameters'].items())
+    return f'{result['benchmark']}[{parameters}]'
+
+
+def save_results(results: list[dict], destination: Path) -> None:
+    """Save the results as JSON to the given destination, overwriting any file already there."""
+
+    with destination.open('w') as dest:
+        json.dump(results, dest, indent=4)
+
+
+def load_results(source: Path) -> list[dict]:
+    """Return the results saved as JSON in the given source."""
+
+    try:
+        with source.open('r') as src:
+            return json.load(src)
+    except OSError:
+        raise OSError(f'Unable to open benchmark results \'{source}\'.')
+
+
+def compare_results(
+    results: list[dict],
+    baseline: list[dict],
+    metric: str,
+    higher_is_better: bool = False,
+    tolerance: float = .1,
+) -> tuple[list[str], list[str]]:
+    """Print a table comparing the given metric of the results with those of the same benchmark
+    and parameters in the baseline, and return the keys of the results that are more than
+    tolerance (as a fraction) worse and better than the baseline."""
+
+    baseline_values = {result_key(result): result[metric] for result in baseline}
+
+    regressions, improvements = [], []
+    print(f'\n{"benchmark":<60} {"baseline":>12} {"current":>12} {"change":>8}')
+    for result in results:
+        key = result_key(result)
+        if key not in baseline_values:
+            print(f'{key:<60} {"-":>12} {result[metric]:>12.4g} {"new":>8}')
+            continue
+
+        change = result[metric] / baseline_values[key] - 1 if baseline_values[key] else .0
+        worse = -change if higher_is_better else change
+        if worse > tolerance:
+            regressions.append(key)
+        elif worse < -tolerance:
+            improvements.append(key)
+        print(f'{key:<60} {baseline_values[key]:>12.4g} {result[metric]:>12.4g} {change:>+8.1%}')
+
+    print(f'\n{len(regressions)} regressions and {len(improvements)} improvements beyond {tolerance:.0%}.')
+    return regressions, improvements
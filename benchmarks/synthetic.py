@@ -0,0 +1,140 @@
+from contextlib import redirect_stdout
+import io
+import random
+
+from neat.base_player import BasePlayer
+from neat.genome import Genome
+from neat.genome.node import Node
+from neat.genome.activation_functions import sigmoid
+from neat.history import History
+from neat.evolution.mutation import mutate_weights, add_connection, add_node
+from neat.settings import settings_handler
+from neat.population import Population
+
+
+# The synthetic Genome sizes that benchmarks are run with
+GENOME_SIZES: dict[str, dict[str, int]] = {
+    'small': {'inputs': 4, 'outputs': 2, 'hidden': 8, 'connections': 30, 'layers': 3},
+    'medium': {'inputs': 16, 'outputs': 4, 'hidden': 40, 'connections': 200, 'layers': 5},
+    'large': {'inputs': 64, 'outputs': 8, 'hidden': 200, 'connections': 1000, 'layers': 8},
+}
+
+# The Population sizes that population level benchmarks are run with
+POPULATION_SIZES: list[int] = [50, 150, 500]
+
+
+class BenchmarkPlayer(BasePlayer):
+    """A Player that does nothing, for benchmarks that only need its Genome."""
+
+    def __init__(self, player_args: dict) -> None:
+        super().__init__()
+        self.fitness = 1.0
+
+    def look(self) -> None:
+        pass
+
+    def think(self) -> None:
+        pass
+
+    def move(self, move: None) -> None:
+        pass
+
+
+def synthetic_genome(
+    inputs: int,
+    outputs: int,
+    hidden: int,
+    connections: int,
+    layers: int,
+    history: History,
+) -> Genome:
+    """Return a Genome with the given numbers of input, output and hidden Nodes, the hidden
+    Nodes spread evenly over the layers between the inputs and outputs, and the given number of
+    random Connections between Nodes in different layers."""
+
+    if layers < 3 and hidden > 0:
+        raise Exception('A synthetic Genome with hidden Nodes must have at least 3 layers.')
+
+    genome = Genome(inputs, outputs)
+    genome.layers = layers
+
+    for _ in range(inputs + 1):
+        genome.nodes.append(Node(genome.next_node, 0))
+    for _ in range(outputs):
+        genome.nodes.append(Node(genome.next_node, layers - 1, sigmoid))
+    for i in range(hidden):
+        genome.nodes.append(Node(genome.next_node, 1 + i % (layers - 2), sigmoid))
+    genome.nodes.sort(key=lambda node: (node.layer, node.number))
+
+    pairs = [(from_node, to_node) for from_node in genome.nodes for to_node in genome.nodes
+             if from_node.layer < to_node.layer]
+    if connections > len(pairs):
+        raise Exception(f'A synthetic Genome of this shape can have at most {len(pairs)} Connections.')
+    for from_node, to_node in random.sample(pairs, connections):
+        genome.add_connection(from_node, to_node, history)
+
+    return genome
+
+
+def synthetic_players(size: str, total: int, history: History) -> list[BasePlayer]:
+    """Return total Players whose Genomes are variations of one synthetic Genome of the given
+    size, as if they had been evolving from it for a while."""
+
+    base = synthetic_genome(**GENOME_SIZES[size], history=history)
+
+    players = []
+    for _ in range(total):
+        player = BenchmarkPlayer(dict())
+        player.genome = base.clone()
+        mutate_weights(player.genome, 0.1)
+        for _ in range(random.randint(0, 3)):
+            add_connection(player.genome, history)
+        if random.uniform(0, 1) < 0.3:
+            add_node(player.genome, sigmoid, history)
+        player.fitness = random.uniform(0, 10)
+        players.append(player)
+
+    return players
+
+
+def synthetic_settings(size: str, total: int, folder: str) -> dict:
+    """Return complete settings for a Population of total Players with Genomes of the given
+    size, that saves to the given folder and doesn't report any progress."""
+
+    settings = {
+        'player_args': dict(),
+        'genome_settings': {
+            'input_count': GENOME_SIZES[size]['inputs'],
+            'output_count': GENOME_SIZES[size]['outputs'],
+        },
+        'population_settings': {
+            'size': total,
+            'save_folder': folder,
+        },
+        'progress_settings': {
+            'print_progress': False,
+        },
+        'playback_settings': {
+            'number': 0,
+        },
+    }
+    return settings_handler(settings, silent=True)
+
+
+def synthetic_population(size: str, total: int, folder: str = '') -> Population:
+    """Return a Population of total synthetic Players with Genomes of the given size, created
+    without printing the settings it uses."""
+
+    settings = synthetic_settings(size, total, folder)
+    with redirect_stdout(io.StringIO()):
+        population = Population(BenchmarkPlayer, settings)
+
+    population.generation = 1
+    population.history = History()
+    population.players = synthetic_players(size, total, population.history)
+    population.parent_species = [None] * total
+    population.species = []
+    population.staleness = 0
+    population.best_fitness = 0
+
+    return population
@@ -0,0 +1,147 @@
+"""Synthetic tasks that need no external resources, for benchmarking whole runs of neat.run.
+
+Each task's Player and simulate function are defined at module level, so that they can be sent
+to worker processes.
+"""
+
+from typing import Callable
+import math
+import random
+
+from neat.base_player import BasePlayer
+
+
+class XORPlayer(BasePlayer):
+    """A Player that learns the XOR function."""
+
+    def __init__(self, player_args: dict) -> None:
+        super().__init__()
+        self.vision: list[float]
+
+    def look(self) -> None:
+        pass
+
+    def think(self) -> float:
+        return self.genome.propagate(self.vision)[0]
+
+    def move(self, move: float) -> None:
+        pass
+
+
+XOR_CASES = [((0., 0.), 0.), ((0., 1.), 1.), ((1., 0.), 1.), ((1., 1.), 0.)]
+
+
+def simulate_xor(player: XORPlayer) -> XORPlayer:
+    """Give the Player the fitness (4 - squared error)^2 over the four XOR cases."""
+
+    error = .0
+    for inputs, target in XOR_CASES:
+        player.vision = list(inputs)
+        error += (player.think() - target) ** 2
+    player.fitness = (4 - error) ** 2
+    return player
+
+
+class CartPolePlayer(BasePlayer):
+    """A Player that balances a pole on a cart, with the classic cart-pole physics."""
+
+    GRAVITY = 9.8
+    CART_MASS = 1.0
+    POLE_MASS = 0.1
+    POLE_HALF_LENGTH = 0.5
+    FORCE = 10.0
+    TIME_STEP = 0.02
+    X_LIMIT = 2.4
+    THETA_LIMIT = 12 * 2 * math.pi / 360
+
+    def __init__(self, player_args: dict) -> None:
+        super().__init__()
+        self.max_steps: int = player_args.get('max_steps', 500)
+        self.x, self.x_dot, self.theta, self.theta_dot = .0, .0, .0, .0
+        self.steps: int = 0
+
+    @property
+    def failed(self) -> bool:
+        return abs(self.x) > self.X_LIMIT or abs(self.theta) > self.THETA_LIMIT
+
+    def look(self) -> None:
+        self.vision = [self.x / self.X_LIMIT, self.x_dot, self.theta / self.THETA_LIMIT, self.theta_dot]
+
+    def think(self) -> bool:
+        """Return True to push the cart right and False to push it left."""
+        return self.genome.propagate(self.vision)[0] > 0.5
+
+    def move(self, push_right: bool) -> None:
+        force = self.FORCE if push_right else -self.FORCE
+        total_mass = self.CART_MASS + self.POLE_MASS
+        cos_theta, sin_theta = math.cos(self.theta), math.sin(self.theta)
+
+        temp = (force + self.POLE_MASS * self.POLE_HALF_LENGTH * self.theta_dot ** 2 * sin_theta) / total_mass
+        theta_acc = (self.GRAVITY * sin_theta - cos_theta * temp) / \
+                    (self.POLE_HALF_LENGTH * (4 / 3 - self.POLE_MASS * cos_theta ** 2 / total_mass))
+        x_acc = temp - self.POLE_MASS * self.POLE_HALF_LENGTH * theta_acc * cos_theta / total_mass
+
+        self.x += self.TIME_STEP * self.x_dot
+        self.x_dot += self.TIME_STEP * x_acc
+        self.theta += self.TIME_STEP * self.theta_dot
+        self.theta_dot += self.TIME_STEP * theta_acc
+        self.steps += 1
+
+
+def simulate_cart_pole(player: CartPolePlayer) -> CartPolePlayer:
+    """Balance the pole from a fixed starting state until it falls or max_steps is reached, and
+    give the Player the number of steps survived as its fitness."""
+
+    start = random.Random(0)
+    player.x, player.x_dot, player.theta, player.theta_dot = [start.uniform(-0.05, 0.05) for _ in range(4)]
+
+    while player.steps < player.max_steps and not player.failed:
+        player.look()
+        player.move(player.think())
+
+    player.fitness = float(player.steps)
+    return player
+
+
+class CostPerStepPlayer(BasePlayer):
+    """A Player in a synthetic environment whose cost is set by player_args: the number of steps
+    per simulation, and the number of arithmetic operations per step on top of propagating the
+    Genome."""
+
+    def __init__(self, player_args: dict) -> None:
+        super().__init__()
+        self.steps: int = player_args.get('steps', 100)
+        self.cost: int = player_args.get('cost', 100)
+        self.state: list[float] = [.0] * player_args.get('input_count', 4)
+
+    def look(self) -> None:
+        pass
+
+    def think(self) -> tuple[float, ...]:
+        return self.genome.propagate(self.state)
+
+    def move(self, outputs: tuple[float, ...]) -> None:
+        work = .0
+        for i in range(self.cost):
+            work += (i * outputs[0]) % 1.0
+        self.state = [math.sin(value + work) for value in self.state]
+
+
+def simulate_cost_per_step(player: CostPerStepPlayer) -> CostPerStepPlayer:
+    """Step the Player steps times and give it a fitness based on its outputs."""
+
+    fitness = .0
+    for _ in range(player.steps):
+        outputs = player.think()
+        player.move(outputs)
+        fitness += outputs[0]
+    player.fitness = fitness
+    return player
+
+
+# The (PlayerClass, simulate function, player_args, input count, output count) of each task
+tasks: dict[str, tuple[type, Callable[[BasePlayer], BasePlayer], dict, int, int]] = {
+    'xor': (XORPlayer, simulate_xor, dict(), 2, 1),
+    'cart_pole': (CartPolePlayer, simulate_cart_pole, {'max_steps': 500}, 4, 1),
+    'cost_per_step': (CostPerStepPlayer, simulate_cost_per_step, {'steps': 100, 'cost': 100, 'input_count': 4}, 4, 1),
+}
@@ -0,0 +1,206 @@
+"""End-to-end throughput benchmarks of neat.run on the bundled synthetic tasks.
+
+Run from the repository root with e.g.
+    python -m benchmarks.throughput --output results.json
+    python -m benchmarks.throughput xor --populations 150,500 --workers 1,4 --baseline results.json
+"""
+
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from pathlib import Path
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+
+import neat
+from neat.history import History
+
+from benchmarks.tasks import tasks
+from benchmarks.results import save_results, load_results, compare_results
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def peak_rss_mb() -> float | None:
+    """Return the peak resident set size in MB of this process, plus the largest of its finished
+    child processes, or None if it can't be measured on this platform."""
+
+    if resource is None:
+        return None
+
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    scale = 1 / 2 ** 20 if sys.platform == 'darwin' else 1 / 2 ** 10
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss + resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return peak * scale
+
+
+def run_task(
+    task: str,
+    population_size: int,
+    executor: str,
+    workers: int,
+    generations: int,
+    seed: int,
+    task_args: dict,
+) -> dict:
+    """Evolve a Population on the given task with neat.run for the given number of generations,
+    and return its throughput.
+
+    Any task_args replace those of the task's player_args.
+    """
+
+    PlayerClass, simulate, player_args, input_count, output_count = tasks[task]
+    player_args = {**player_args, **task_args}
+
+    with tempfile.TemporaryDirectory() as folder:
+        folder = Path(folder)
+        timings_file = folder / 'timings.jsonl'
+        settings = {
+            'creation_type': 'new',
+            'total_generations': generations,
+            'player_args': player_args,
+            'genome_settings': {
+                'input_count': input_count,
+                'output_count': output_count,
+            },
+            'population_settings': {
+                'size': population_size,
+                'save_folder': str(folder / 'population'),
+            },
+            'progress_settings': {
+                'print_progress': False,
+                'timings': True,
+                'timings_filename': str(timings_file),
+            },
+            'playback_settings': {
+                'number': 0,
+            },
+            'evaluation_settings': {
+                'executor': executor,
+                'workers': workers,
+            },
+        }
+
+        random.seed(seed)
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            neat.run(PlayerClass, simulate, settings)
+        elapsed = time.perf_counter() - start
+
+        with timings_file.open('r') as timings_src:
+            timings = [json.loads(line) for line in timings_src]
+        innovations = len(History.load(folder / 'population' / 'history.pickle').innovations)
+
+    generation_seconds = [sum(value for key, value in timing.items() if key.endswith('_seconds'))
+                          for timing in timings]
+    evaluate_seconds = sum(timing['evaluate_seconds'] for timing in timings)
+
+    # Compare the last quarter of the run with the first to show any slowdown that builds up
+    quarter = max(len(generation_seconds) // 4, 1)
+    slowdown = (sum(generation_seconds[-quarter:]) / sum(generation_seconds[:quarter])) \
+               if sum(generation_seconds[:quarter]) else None
+
+    return {
+        'generations_per_second': len(timings) / elapsed,
+        'evaluations_per_second': population_size * len(timings) / evaluate_seconds if evaluate_seconds else None,
+        'seconds_per_generation': generation_seconds,
+        'slowdown': slowdown,
+        'innovations': innovations,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def run_task_in_process(connection: Connection, *args: int | str | dict) -> None:
+    """Run the task with the given arguments and send its result (or exception) back over the
+    connection."""
+
+    try:
+        connection.send(run_task(*args))
+    except BaseException as e:
+        connection.send(e)
+    finally:
+        connection.close()
+
+
+def run_isolated(*args: int | str | dict) -> dict:
+    """Run the task with the given arguments in a fresh process, so that its peak RSS is its own."""
+
+    context = get_context('spawn')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=run_task_in_process, args=(sender, *args))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        raise Exception(f'Benchmark process for {args} exited without a result.')
+    finally:
+        process.join()
+
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark the throughput of neat.run on synthetic tasks.')
+    parser.add_argument('tasks', nargs='*', help=f'the tasks to run from {list(tasks)} (default all)')
+    parser.add_argument('--populations', default='50,150,500', help='comma separated Population sizes')
+    parser.add_argument('--executors', default='serial,process', help='comma separated executors')
+    parser.add_argument('--workers', default='1,2,4',
+                        help='comma separated worker counts (the serial executor only runs with 1)')
+    parser.add_argument('--generations', type=int, default=20, help='generations to run each configuration for')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for each run')
+    parser.add_argument('--task-args', type=json.loads, default=dict(),
+                        help='JSON object replacing the tasks\' player_args, e.g. \'{"steps": 200, "cost": 1000}\'')
+    parser.add_argument('--output', type=Path, help='file to save the results to as JSON')
+    parser.add_argument('--baseline', type=Path, help='JSON results to compare against')
+    parser.add_argument('--tolerance', type=float, default=.1,
+                        help='fraction fewer generations per second than the baseline that counts as a regression')
+    args = parser.parse_args()
+
+    for task in args.tasks:
+        if task not in tasks:
+            parser.error(f'Task \'{task}\' must be one of {list(tasks)}.')
+    population_sizes = [int(population_size) for population_size in args.populations.split(',')]
+    worker_counts = [int(workers) for workers in args.workers.split(',')]
+
+    results = []
+    print(f'{"task":<14} {"population":>10} {"executor":>9} {"workers":>7} {"gens/s":>8} {"evals/s":>10} '
+          f'{"slowdown":>8} {"innovations":>11} {"peak MB":>8}')
+    for task in args.tasks or list(tasks):
+        for population_size in population_sizes:
+            for executor in args.executors.split(','):
+                for workers in [1] if executor == 'serial' else worker_counts:
+                    result = run_isolated(task, population_size, executor, workers, args.generations, args.seed,
+                                          args.task_args)
+                    parameters = {'task': task, 'population': population_size, 'executor': executor, 'workers': workers}
+                    if args.task_args:
+                        parameters['task_args'] = args.task_args
+                    results.append({'benchmark': 'throughput', 'parameters': parameters, **result})
+
+                    evaluations = f'{result['evaluations_per_second']:.0f}' if result['evaluations_per_second'] else '-'
+                    slowdown = f'{result['slowdown']:.2f}' if result['slowdown'] else '-'
+                    peak = f'{result['peak_rss_mb']:.0f}' if result['peak_rss_mb'] is not None else '-'
+                    print(f'{task:<14} {population_size:>10} {executor:>9} {workers:>7} '
+                          f'{result['generations_per_second']:>8.2f} {evaluations:>10} {slowdown:>8} '
+                          f'{result['innovations']:>11} {peak:>8}')
+
+    if args.output is not None:
+        save_results(results, args.output)
+    if args.baseline is not None:
+        regressions, _ = compare_results(results, load_results(args.baseline), 'generations_per_second',
+                                         higher_is_better=True, tolerance=args.tolerance)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
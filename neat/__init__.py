@@ -1,3 +1,5 @@
 from .base_player import BasePlayer
 from .run import run
-from .playback.playback_players import PlaybackPlayers
\ No newline at end of file
+from .run_async import run_async
+from .playback.playback_players import PlaybackPlayers
+from .population import PopulationNetwork
\ No newline at end of file
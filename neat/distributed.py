@@ -0,0 +1,360 @@
+from __future__ import annotations
+from collections import deque
+from multiprocessing import Process
+from multiprocessing.managers import BaseManager
+from typing import Callable, Iterable, Iterator, Any
+import os
+import pickle
+import socket
+import threading
+import time
+import uuid
+
+from neat.executors import Executor
+
+
+class WorkQueue:
+    """The queue of batches of work held by the coordinator's manager process, which workers take
+    batches from and return their results to.
+
+    Workers send a heartbeat while they are alive, and any batch taken by a worker that hasn't been
+    heard from for heartbeat_timeout seconds is put back on the queue for another worker to take.
+    A batch that has been lost like this more than max_requeues times is completed with an
+    Exception instead, so that a batch that kills every worker that takes it can't stall the run.
+    Results for a batch that has already been completed (by a worker that was presumed dead) are
+    ignored.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Condition()
+        self._pending: deque[int] = deque()
+        self._batches: dict[int, list[tuple[Callable[[Any], Any], Any]]] = dict()
+        self._assigned: dict[int, str] = dict()
+        self._results: dict[int, list[Any] | BaseException] = dict()
+        self._requeues: dict[int, int] = dict()
+        self._last_seen: dict[str, float] = dict()
+        self._next_batch_id: int = 0
+        self._closed: bool = False
+
+        self._initializer: Callable[..., None] | None = None
+        self._initargs: tuple = ()
+        self.heartbeat_timeout: float = 10.0
+        self.max_requeues: int = 3
+
+    def configure(
+        self,
+        initializer: Callable[..., None] | None,
+        initargs: tuple,
+        heartbeat_timeout: float,
+        max_requeues: int,
+    ) -> None:
+        """Set the initializer (and its arguments) that each worker calls before taking any work,
+        the time after which silent workers are presumed dead, and the number of times a batch can
+        be requeued."""
+
+        self._initializer = initializer
+        self._initargs = initargs
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_requeues = max_requeues
+
+    def config(self) -> tuple[Callable[..., None] | None, tuple, float]:
+        """Return the initializer, its arguments and the heartbeat timeout for a worker."""
+        return self._initializer, self._initargs, self.heartbeat_timeout
+
+    def submit(self, tasks: list[tuple[Callable[[Any], Any], Any]]) -> int:
+        """Add a batch of (function, item) tasks to the queue and return its ID."""
+
+        with self._lock:
+            batch_id = self._next_batch_id
+            self._next_batch_id += 1
+            self._batches[batch_id] = tasks
+            self._pending.append(batch_id)
+            return batch_id
+
+    def take(self, worker_id: str) -> tuple[int, list[tuple[Callable[[Any], Any], Any]]] | None:
+        """Return the next (batch ID, tasks) for the given worker, None if there aren't any right
+        now, or raise EOFError once the queue has been closed."""
+
+        with self._lock:
+            if self._closed:
+                raise EOFError
+            self._last_seen[worker_id] = time.monotonic()
+            if not self._pending:
+                return None
+            batch_id = self._pending.popleft()
+            self._assigned[batch_id] = worker_id
+            return batch_id, self._batches[batch_id]
+
+    def complete(self, worker_id: str, batch_id: int, results: list[Any] | BaseException) -> None:
+        """Store the results of the given batch, or the exception raised while working on it."""
+
+        with self._lock:
+            self._last_seen[worker_id] = time.monotonic()
+            if batch_id not in self._batches:
+                return
+            self._forget(batch_id)
+            self._results[batch_id] = results
+            self._lock.notify_all()
+
+    def cancel(self, batch_ids: Iterable[int]) -> None:
+        """Remove the given batches from the queue, ignoring any results they get."""
+
+        with self._lock:
+            for batch_id in batch_ids:
+                if batch_id in self._batches:
+                    self._forget(batch_id)
+                self._results.pop(batch_id, None)
+
+    def _forget(self, batch_id: int) -> None:
+        """Remove everything held about the given batch (the lock must be held)."""
+
+        del self._batches[batch_id]
+        self._assigned.pop(batch_id, None)
+        self._requeues.pop(batch_id, None)
+        if batch_id in self._pending:
+            self._pending.remove(batch_id)
+
+    def heartbeat(self, worker_id: str) -> None:
+        """Record that the given worker is still alive."""
+
+        with self._lock:
+            self._last_seen[worker_id] = time.monotonic()
+
+    def collect(self, timeout: float) -> list[tuple[int, list[Any] | BaseException]]:
+        """Return (and forget) the (batch ID, results or exception) of every completed batch,
+        waiting up to timeout seconds for one if there aren't any yet.
+
+        Also requeue the batches of any workers presumed dead.
+        """
+
+        with self._lock:
+            if not self._results:
+                self._lock.wait(timeout)
+
+            now = time.monotonic()
+            for batch_id, worker_id in list(self._assigned.items()):
+                if now - self._last_seen.get(worker_id, now) > self.heartbeat_timeout:
+                    requeues = self._requeues.get(batch_id, 0) + 1
+                    if requeues > self.max_requeues:
+                        self._forget(batch_id)
+                        self._results[batch_id] = Exception(f'A batch of work was lost by {requeues} distributed ' + \
+                                                            'workers that stopped responding while working on it.')
+                        continue
+                    del self._assigned[batch_id]
+                    self._requeues[batch_id] = requeues
+                    self._pending.appendleft(batch_id)
+
+            results = list(self._results.items())
+            self._results.clear()
+            return results
+
+    def close(self) -> None:
+        """Stop handing out work, so that the workers exit."""
+
+        with self._lock:
+            self._closed = True
+
+
+# The WorkQueue of the coordinator's manager process
+_work_queue: WorkQueue | None = None
+
+
+def _get_work_queue() -> WorkQueue:
+    global _work_queue
+    if _work_queue is None:
+        _work_queue = WorkQueue()
+    return _work_queue
+
+
+# The hosts that only accept connections from this machine
+LOOPBACK_HOSTS: list[str] = ['localhost', '127.0.0.1', '::1']
+
+
+class CoordinatorManager(BaseManager):
+    """Serves the WorkQueue to workers over TCP."""
+    pass
+
+
+class WorkerManager(BaseManager):
+    """Connects to a CoordinatorManager's WorkQueue."""
+    pass
+
+
+CoordinatorManager.register('get_work_queue', callable=_get_work_queue)
+WorkerManager.register('get_work_queue')
+
+
+def picklable(value: Any) -> bool:
+    """Return True if the given value can be pickled."""
+
+    try:
+        pickle.dumps(value)
+    except Exception:
+        return False
+    return True
+
+
+def run_worker(address: tuple[str, int], authkey: bytes, poll_interval: float = .05) -> None:
+    """Take batches of work from the coordinator at the given address and return the results until
+    the coordinator closes its queue or can no longer be reached.
+
+    Must be run in the main thread of a process that can import the functions and classes used in
+    the work (e.g. the PlayerClass and simulate function given to neat.run).
+    """
+
+    manager = WorkerManager(address=address, authkey=authkey)
+    manager.connect()
+    work_queue = manager.get_work_queue()
+    worker_id = f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}'
+
+    initializer, initargs, heartbeat_timeout = work_queue.config()
+    if initializer is not None:
+        initializer(*initargs)
+
+    # Keep sending heartbeats (over the heartbeat thread's own connection) while working
+    stop = threading.Event()
+    def send_heartbeats() -> None:
+        while not stop.wait(heartbeat_timeout / 4):
+            try:
+                work_queue.heartbeat(worker_id)
+            except (EOFError, OSError):
+                return
+    heartbeats = threading.Thread(target=send_heartbeats, daemon=True)
+    heartbeats.start()
+
+    try:
+        while True:
+            try:
+                work = work_queue.take(worker_id)
+            except (EOFError, OSError):
+                return
+            if work is None:
+                time.sleep(poll_interval)
+                continue
+
+            # Send back any exception raised by the work in place of the results, as a Pool does
+            batch_id, tasks = work
+            try:
+                results = [function(item) for function, item in tasks]
+            except Exception as e:
+                results = e
+            if isinstance(results, Exception) and not picklable(results):
+                results = Exception(f'{type(results).__name__}: {results}')
+            try:
+                work_queue.complete(worker_id, batch_id, results)
+            except (EOFError, OSError):
+                return
+    finally:
+        stop.set()
+
+
+class DistributedExecutor(Executor):
+    """Evaluates items on worker processes that connect to this one over TCP, on this machine or
+    on others.
+
+    This process serves batches of chunksize items from a WorkQueue at the given (host, port)
+    address, protected by authkey. It starts workers local processes itself (and replaces any that
+    die), and any number of other workers can join by calling neat.distributed.run_worker with the
+    same address and authkey. Batches taken by workers that stop sending heartbeats for
+    heartbeat_timeout seconds are given to other workers, up to max_requeues times.
+    An exception raised by the work is raised again by map and imap_unordered.
+
+    The WorkQueue unpickles whatever it is sent, so an authkey must be given to serve on any host
+    other than this machine's loopback address, otherwise a random one is used.
+    """
+
+    name = 'distributed'
+
+    def __init__(
+        self,
+        workers: int,
+        initializer: Callable[..., None] | None = None,
+        initargs: tuple = (),
+        chunksize: int = 1,
+        address: tuple[str, int] = ('localhost', 0),
+        authkey: bytes | None = None,
+        heartbeat_timeout: float = 10.0,
+        max_requeues: int = 3,
+    ) -> None:
+        super().__init__(workers, initializer, initargs, chunksize)
+
+        if authkey is None:
+            if address[0] not in LOOPBACK_HOSTS:
+                raise Exception(f'An authkey must be given to serve distributed work on host \'{address[0]}\'.')
+            authkey = os.urandom(32)
+
+        self.manager = CoordinatorManager(address=address, authkey=authkey)
+        self.manager.start()
+        self.work_queue = self.manager.get_work_queue()
+        self.work_queue.configure(initializer, initargs, heartbeat_timeout, max_requeues)
+        self.heartbeat_timeout: float = heartbeat_timeout
+        self._authkey: bytes = authkey
+
+        self.local_workers: list[Process] = [self._start_worker() for _ in range(workers)]
+
+    def _start_worker(self) -> Process:
+        """Start and return a local worker process."""
+
+        process = Process(target=run_worker, args=(self.manager.address, self._authkey), daemon=True)
+        process.start()
+        return process
+
+    def _replace_dead_workers(self) -> None:
+        """Start a new local worker in place of any that have died."""
+
+        for i, process in enumerate(self.local_workers):
+            if not process.is_alive():
+                process.join()
+                self.local_workers[i] = self._start_worker()
+
+    def _completed(self, function: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[tuple[int, list[Any]]]:
+        """Submit the items in batches and yield the (start index, results) of each batch as it
+        is completed.
+
+        If the work on any batch raised an exception the rest are cancelled and it is raised.
+        """
+
+        items = list(items)
+        starts = dict()
+        for start in range(0, len(items), self.chunksize):
+            tasks = [(function, item) for item in items[start:start + self.chunksize]]
+            starts[self.work_queue.submit(tasks)] = start
+
+        try:
+            while starts:
+                self._replace_dead_workers()
+                for batch_id, results in self.work_queue.collect(self.heartbeat_timeout / 4):
+                    # Ignore any results left over from an earlier call that was interrupted
+                    if batch_id not in starts:
+                        continue
+                    if isinstance(results, BaseException):
+                        raise results
+                    yield starts.pop(batch_id), results
+        finally:
+            if starts:
+                self.work_queue.cancel(list(starts))
+
+    def map(self, function: Callable[[Any], Any], items: Iterable[Any]) -> list[Any]:
+        """Return the results of calling function on each of the items, in order."""
+
+        results = []
+        for start, batch_results in sorted(self._completed(function, items), key=lambda completed: completed[0]):
+            results.extend(batch_results)
+        return results
+
+    def imap_unordered(self, function: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[Any]:
+        """Return an iterator over the results of calling function on each of the items, in the
+        order the batches are completed."""
+
+        for _, batch_results in self._completed(function, items):
+            yield from batch_results
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """Close the WorkQueue so that the workers exit, then stop serving it."""
+
+        self.work_queue.close()
+        for process in self.local_workers:
+            if cancel:
+                process.terminate()
+            process.join()
+        self.manager.shutdown()
@@ -0,0 +1,242 @@
+from __future__ import annotations
+from typing import Callable, Any
+
+from neat.base_player import BasePlayer
+from neat.genome import Genome, CompactGenome
+from neat.shared_arena import GenomeArena
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from neat.scheduler import Scheduler
+
+
+class GenomeEvaluator:
+    """Simulates Players in a worker process given only their Genomes.
+
+    A Player of class PlayerClass is built around each Genome and given to the simulate function,
+    and only its fitness and the values of the given observable attributes are returned.
+    CompactGenomes are expanded into full Genomes for the Players unless compact_players is True, 
+    in which case the Players are given them as they are (for Genomes read from a GenomeArena these 
+    are views into the arena, so the Players must not be kept after they have been simulated).
+    """
+
+    def __init__(
+        self,
+        PlayerClass: type,
+        player_args: dict,
+        simulate: Callable[[BasePlayer], BasePlayer],
+        observables: list[str],
+        compact_players: bool = False,
+    ) -> None:
+        self.PlayerClass: type = PlayerClass
+        self.player_args: dict = player_args
+        self.simulate: Callable[[BasePlayer], BasePlayer] = simulate
+        self.observables: list[str] = observables
+        self.compact_players: bool = compact_players
+
+    def player(self, genome: Genome | CompactGenome) -> BasePlayer:
+        """Return a new Player with the given Genome."""
+
+        player = self.PlayerClass(self.player_args)
+        if isinstance(genome, CompactGenome) and not self.compact_players:
+            genome = Genome.from_compact(genome)
+        player.genome = genome
+        return player
+
+    def evaluate(self, genome: Genome | CompactGenome) -> tuple[float, dict[str, Any]]:
+        """Return the fitness and observed attributes of a Player with the given Genome after it
+        has been simulated."""
+
+        player = self.simulate(self.player(genome))
+
+        return player.fitness, {attribute: getattr(player, attribute) for attribute in self.observables}
+
+    def evaluate_batch(self, genomes: list[Genome | CompactGenome]) -> list[tuple[float, dict[str, Any]]]:
+        """Return the fitnesses and observed attributes of Players with the given Genomes after they
+        have been simulated together, with simulate taking and returning a list of Players."""
+
+        players = self.simulate([self.player(genome) for genome in genomes])
+
+        return [(player.fitness, {attribute: getattr(player, attribute) for attribute in self.observables})
+                for player in players]
+
+
+# The GenomeEvaluator of this worker process
+_evaluator: GenomeEvaluator | None = None
+
+# The GenomeArena this worker process last attached to
+_arena: GenomeArena | None = None
+
+
+def init_worker(
+    evaluator: GenomeEvaluator,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+) -> None:
+    """Store the given GenomeEvaluator for this worker process and then call the given
+    initializer (if any)."""
+
+    global _evaluator
+    _evaluator = evaluator
+
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def evaluate_genome(genome: Genome | CompactGenome) -> tuple[float, dict[str, Any]]:
+    """Return the fitness and observed attributes of a Player with the given Genome using this
+    worker process' GenomeEvaluator."""
+
+    if _evaluator is None:
+        raise Exception('evaluate_genome must be called in a worker process started with init_worker.')
+    return _evaluator.evaluate(genome)
+
+
+def evaluate_genomes(genomes: list[Genome | CompactGenome]) -> list[tuple[float, dict[str, Any]]]:
+    """Return the fitnesses and observed attributes of Players with the given Genomes, simulated 
+    together using this worker process' GenomeEvaluator."""
+
+    if _evaluator is None:
+        raise Exception('evaluate_genomes must be called in a worker process started with init_worker.')
+    return _evaluator.evaluate_batch(genomes)
+
+
+def _attach_arena(name: str) -> GenomeArena:
+    """Return the GenomeArena with the given name, attaching to each generation's arena once."""
+
+    global _arena
+    if _arena is None or _arena.name != name:
+        if _arena is not None:
+            _arena.close()
+        _arena = GenomeArena.attach(name)
+    return _arena
+
+
+def evaluate_shared(task: tuple[str, int]) -> None:
+    """Simulate a Player with the Genome at the given index of the GenomeArena with the given name 
+    using this worker process' GenomeEvaluator, and write its fitness and observed attributes back 
+    into the arena."""
+
+    name, index = task
+
+    if _evaluator is None:
+        raise Exception('evaluate_shared must be called in a worker process started with init_worker.')
+
+    arena = _attach_arena(name)
+    fitness, observations = _evaluator.evaluate(arena.genome(index))
+    arena.write_results(index, [fitness, *observations.values()])
+
+
+def evaluate_shared_batch(task: tuple[str, int, int]) -> None:
+    """Simulate Players with the Genomes from the start up to the stop index of the GenomeArena with 
+    the given (name, start, stop) together using this worker process' GenomeEvaluator, and write 
+    their fitnesses and observed attributes back into the arena."""
+
+    name, start, stop = task
+
+    if _evaluator is None:
+        raise Exception('evaluate_shared_batch must be called in a worker process started with init_worker.')
+
+    arena = _attach_arena(name)
+    results = _evaluator.evaluate_batch([arena.genome(index) for index in range(start, stop)])
+    for index, (fitness, observations) in enumerate(results, start):
+        arena.write_results(index, [fitness, *observations.values()])
+
+
+def split_batches(items: list[Any], batch_size: int) -> list[list[Any]]:
+    """Return the items split into consecutive batches of batch_size (the last may be smaller)."""
+    return [items[start:start + batch_size] for start in range(0, len(items), batch_size)]
+
+
+def map_batches(
+    scheduler: Scheduler,
+    function: Callable[[Any], Any],
+    items: list[Any],
+    keys: list[Any] | None = None,
+    batch_size: int | None = None,
+) -> tuple[list[Any], list[int]]:
+    """Return the results of calling function on each of the items with the given Scheduler, along 
+    with the indices of the items that exceeded its budget (whose results are None).
+
+    If batch_size is given then function is called on batches of that many items at a time and must 
+    return a list of their results, and every item in a batch that exceeds the budget is counted as 
+    having exceeded it. Each batch is given the key of its first item.
+    """
+
+    if batch_size is None:
+        return scheduler.map(function, items, keys)
+
+    starts = range(0, len(items), batch_size)
+    batch_keys = [keys[start] for start in starts] if keys is not None else None
+    batch_results, batch_exceeded = scheduler.map(function, split_batches(items, batch_size), batch_keys)
+
+    results, exceeded = [], []
+    for start, result in zip(starts, batch_results):
+        stop = min(start + batch_size, len(items))
+        if result is None:
+            result = [None] * (stop - start)
+        results.extend(result)
+    for i in batch_exceeded:
+        exceeded.extend(range(starts[i], min(starts[i] + batch_size, len(items))))
+
+    return results, exceeded
+
+
+def evaluate_in_arena(
+    scheduler: Scheduler,
+    players: list[BasePlayer],
+    observables: list[str],
+    keys: list[Any] | None = None,
+    batch_size: int | None = None,
+) -> list[int]:
+    """Simulate the given Players with the given Scheduler, whose (process) workers were started 
+    with init_worker, by packing their Genomes into a GenomeArena, and assign them their fitnesses 
+    and observed attributes.
+    If batch_size is given then the Players are simulated together in batches of that many.
+    
+    Return the indices of the Players that exceeded the Scheduler's budget, which are left as they are.
+    """
+
+    arena = GenomeArena.pack([player.genome for player in players], 1 + len(observables))
+    try:
+        if batch_size is None:
+            _, exceeded = scheduler.map(evaluate_shared, [(arena.name, i) for i in range(len(players))], keys)
+        else:
+            starts = range(0, len(players), batch_size)
+            tasks = [(arena.name, start, min(start + batch_size, len(players))) for start in starts]
+            batch_keys = [keys[start] for start in starts] if keys is not None else None
+            _, batch_exceeded = scheduler.map(evaluate_shared_batch, tasks, batch_keys)
+            exceeded = [index for i in batch_exceeded for index in range(tasks[i][1], tasks[i][2])]
+        results = [(values[0], dict(zip(observables, values[1:]))) for values in arena.results()]
+    finally:
+        arena.close()
+        arena.unlink()
+
+    for i in exceeded:
+        results[i] = None
+    merge_results(players, results)
+
+    return exceeded
+
+
+def merge_results(players: list[BasePlayer], results: list[tuple[float, dict[str, Any]] | None]) -> None:
+    """Assign the fitnesses and observed attributes returned for each Player back to it, skipping 
+    any Players without results."""
+
+    for player, result in zip(players, results):
+        if result is None:
+            continue
+        fitness, observations = result
+        player.fitness = fitness
+        for attribute, value in observations.items():
+            setattr(player, attribute, value)
+
+
+def assign_fallback(player: BasePlayer, fallback_fitness: float, observables: list[str]) -> None:
+    """Give the Player, whose simulation was interrupted, the fallback fitness, and also use it for 
+    any observed attributes the Player doesn't have."""
+
+    player.fitness = fallback_fitness
+    for attribute in observables:
+        if not hasattr(player, attribute):
+            setattr(player, attribute, fallback_fitness)
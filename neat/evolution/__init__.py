@@ -1,3 +1,3 @@
 from .selection import fitness_weighted_selection
-from .crossover import crossover
-from .mutation import mutate
\ No newline at end of file
+from .crossover import crossover, crossover_compact
+from .mutation import mutate, mutate_structure, mutate_weights_vectorized, mutate_population_weights
\ No newline at end of file
@@ -1,6 +1,9 @@
+from array import array
+from math import inf
 import random
 
-from neat.genome import Genome
+from neat.genome import Genome, CompactGenome
+from neat.genome.activation_functions import activation_id
 
 
 def crossover(genome1: Genome, genome2: Genome, disabled_rate: float) -> Genome:
@@ -22,7 +25,7 @@ def crossover(genome1: Genome, genome2: Genome, disabled_rate: float) -> Genome:
 
     # Add (clones of) Connections from both Genomes
     genome2_connections = genome2.connections_dict
-    result_nodes = result.nodes_dict
+    result_nodes = {node.number: node for node in result.nodes}
     for connection1 in genome1.connections:
 
         enabled = True
@@ -51,4 +54,113 @@ def crossover(genome1: Genome, genome2: Genome, disabled_rate: float) -> Genome:
             result_connection.enabled = enabled
             result_connection.from_node.output_connections.append(result_connection)
 
-    return result
\ No newline at end of file
+    result.invalidate()
+
+    return result
+
+
+def sorted_genes(genome: Genome | CompactGenome) -> tuple[list[int], list[int], list[int], list[float], list[bool]]:
+    """Return the innovation numbers, from-Node numbers, to-Node numbers, weights and enabled
+    flags of the given Genome's Connections as arrays in ascending order of innovation number."""
+
+    if isinstance(genome, CompactGenome):
+        order = genome.innovation_order
+        return (
+            [genome.connection_innovations[i] for i in order],
+            [genome.connection_from[i] for i in order],
+            [genome.connection_to[i] for i in order],
+            [genome.connection_weights[i] for i in order],
+            [bool(genome.connection_enabled[i]) for i in order],
+        )
+
+    connections = genome.sorted_connections
+    return (
+        [connection.innovation_number for connection in connections],
+        [connection.from_node.number for connection in connections],
+        [connection.to_node.number for connection in connections],
+        [connection.weight for connection in connections],
+        [connection.enabled for connection in connections],
+    )
+
+
+def crossover_compact(
+    genome1: Genome | CompactGenome,
+    genome2: Genome | CompactGenome,
+    disabled_rate: float,
+) -> CompactGenome:
+    """Return the CompactGenome that is the result of crossing over the given Genomes, with the 
+    same inheritance as crossover.
+
+    Both Genomes' Connections are walked in order of innovation number in a single merge pass, 
+    the random choices for all the matching Connections are drawn at once, and the result is 
+    written straight into the CompactGenome's arrays without creating any Nodes or Connections.
+    """
+
+    innovations1, from_numbers, to_numbers, weights1, enabled1 = sorted_genes(genome1)
+    innovations2, _, _, weights2, enabled2 = sorted_genes(genome2)
+    total = len(innovations1)
+
+    # Draw 32 random bits for each Connection that could be in both Genomes, the top one chooses 
+    # which Genome to take its weight from and the rest are compared with the disabled_rate
+    draws = memoryview(random.randbytes(4 * min(total, len(innovations2)))).cast('I')
+    disable_below = disabled_rate * 2 ** 31
+
+    # Excess and disjoint Connections are inherited (enabled) from genome1
+    weights = weights1
+    enabled = [True] * total
+
+    # Walk both Genomes' Connections in order of innovation number to find those in both
+    innovations2.append(inf)
+    j, match = 0, 0
+    for i, innovation_number in enumerate(innovations1):
+        while innovations2[j] < innovation_number:
+            j += 1
+        if innovations2[j] == innovation_number:
+            draw = draws[match]
+            match += 1
+
+            # Consider disabling it if its disabled in either Genome
+            if not (enabled1[i] and enabled2[j]) and draw & 0x7FFFFFFF < disable_below:
+                enabled[i] = False
+
+            if draw >> 31:
+                weights[i] = weights2[j]
+
+    # Since excess and disjoint Connections come from genome1, the resulting crossover 
+    # can only have Nodes from it (and hence also has the same number of layers)
+    result = CompactGenome(genome1.input_count, genome1.output_count, genome1.layers)
+    result.bias_node_idx = genome1.bias_node_idx
+    if isinstance(genome1, CompactGenome):
+        result.node_numbers = array('q', genome1.node_numbers)
+        result.node_layers = array('q', genome1.node_layers)
+        result.node_activations = array('B', genome1.node_activations)
+    else:
+        activation_ids = {node.activation: activation_id(node.activation) for node in genome1.nodes}
+        result.node_numbers = array('q', [node.number for node in genome1.nodes])
+        result.node_layers = array('q', [node.layer for node in genome1.nodes])
+        result.node_activations = array('B', [activation_ids[node.activation] for node in genome1.nodes])
+
+    # Rows are grouped by their from-Node in the order of the Nodes, so find the row of each 
+    # Connection with a counting sort
+    positions = {number: position for position, number in enumerate(result.node_numbers)}
+    from_positions = [positions[from_number] for from_number in from_numbers]
+    starts = [0] * (len(positions) + 1)
+    for position in from_positions:
+        starts[position + 1] += 1
+    for position in range(len(positions)):
+        starts[position + 1] += starts[position]
+
+    rows, order = [0] * total, [0] * total
+    for i, position in enumerate(from_positions):
+        rows[i] = starts[position]
+        order[starts[position]] = i
+        starts[position] += 1
+
+    result.connection_from = array('q', [from_numbers[i] for i in order])
+    result.connection_to = array('q', [to_numbers[i] for i in order])
+    result.connection_weights = array('d', [weights[i] for i in order])
+    result.connection_innovations = array('q', [innovations1[i] for i in order])
+    result.connection_enabled = array('b', [enabled[i] for i in order])
+    result._innovation_order = rows
+
+    return result
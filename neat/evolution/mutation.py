@@ -1,18 +1,29 @@
 import random
 
-from neat.genome import Genome
+from neat.numpy_support import require_numpy
+from neat.genome import Genome, CompactGenome
 from neat.genome.activation_functions import ActivationFunction
 from neat.history import History
 
 
 
-def mutate_weights(genome: Genome, weight_replacement_rate: float) -> None:
+def mutate_weights(genome: Genome | CompactGenome, weight_replacement_rate: float) -> None:
     """Mutate the weights of the given Genome.
     
     weight_replacement_rate is the rate at which a weight will be replaced over 
     perturbing it.
     """
 
+    if isinstance(genome, CompactGenome):
+        weights = genome.connection_weights
+        for i, weight in enumerate(weights):
+            if random.uniform(0, 1) < weight_replacement_rate:
+                weights[i] = random.uniform(-1, 1)
+            else:
+                weights[i] = min(1, max(-1, weight + random.gauss(0,1) * 0.2))
+        genome.invalidate()
+        return
+
     for connection in genome.connections:
         if random.uniform(0, 1) < weight_replacement_rate:
             connection.weight = random.uniform(-1, 1)
@@ -21,21 +32,75 @@ def mutate_weights(genome: Genome, weight_replacement_rate: float) -> None:
             connection.weight = max(-1, connection.weight)
             connection.weight = min(1, connection.weight)
 
+    genome.invalidate(weights_only=True)
+
+
+def mutate_weights_vectorized(genome: Genome | CompactGenome, weight_replacement_rate: float) -> None:
+    """Mutate the weights of the given Genome with the same distribution as mutate_weights, but 
+    drawing the replacements and perturbations for all of them at once.
+
+    A CompactGenome's weight array is mutated in place.
+    Requires NumPy.
+    """
+    mutate_population_weights([genome], weight_replacement_rate)
+
+
+def mutate_population_weights(genomes: list[Genome | CompactGenome], weight_replacement_rate: float) -> None:
+    """Mutate the weights of all the given Genomes, with the same distribution as calling 
+    mutate_weights on each of them, as one batched operation on all of their weights.
+
+    The random numbers are drawn with NumPy from a generator seeded by the random module, so 
+    seeding it still makes the results repeatable.
+    Requires NumPy.
+    """
+
+    np = require_numpy('vectorized weight mutation')
+
+    # Gather every Genome's weights into one array, CompactGenomes' straight from their arrays
+    connections = [None if isinstance(genome, CompactGenome) else list(genome.connections) for genome in genomes]
+    weights = np.concatenate([np.array(genome.connection_weights) if isinstance(genome, CompactGenome) else
+                              np.array([connection.weight for connection in genome_connections], dtype=float)
+                              for genome, genome_connections in zip(genomes, connections)] + [np.empty(0)])
+
+    generator = np.random.default_rng(random.getrandbits(64))
+    replace = generator.random(weights.size) < weight_replacement_rate
+    weights = np.where(
+        replace,
+        generator.uniform(-1, 1, weights.size),
+        np.clip(weights + generator.normal(0, 1, weights.size) * 0.2, -1, 1),
+    )
+
+    # Give each Genome back its mutated weights
+    start = 0
+    for genome, genome_connections in zip(genomes, connections):
+        if genome_connections is None:
+            stop = start + len(genome.connection_weights)
+            np.frombuffer(genome.connection_weights, dtype=float)[:] = weights[start:stop]
+        else:
+            stop = start + len(genome_connections)
+            for connection, weight in zip(genome_connections, weights[start:stop].tolist()):
+                connection.weight = weight
+        genome.invalidate(weights_only=True)
+        start = stop
+
 
 def add_connection(genome: Genome, history: History) -> None:
     """Add a new Connection with random weight ~U[-1,1] between two random Nodes in the 
     given Genome.
     
+    Every pair of unconnected Nodes in different layers is equally likely to be chosen.
     If the Genome is fully-connected then it will be left unchanged.
     """
 
     if genome.fully_connected:
         return
 
-    # Get two Nodes in different layers that are not connected, in the correct order
-    from_node, to_node = sorted(random.choices(genome.nodes, k = 2), key=lambda node: node.layer)
-    while from_node.layer == to_node.layer or from_node.connected_to(to_node):
-        from_node, to_node = sorted(random.choices(genome.nodes, k = 2), key=lambda node: node.layer)
+    # Choose the from_node in proportion to the number of Nodes it could be connected to, then 
+    # one of those Nodes
+    derived = genome.derived
+    [from_node] = random.choices(genome.nodes, weights=[derived.available_targets(node) for node in genome.nodes])
+    targets = derived.targets[from_node.number]
+    to_node = random.choice([node for node in genome.nodes if node.layer > from_node.layer and node.number not in targets])
 
     # Add the Connection
     genome.add_connection(from_node, to_node, history)
@@ -47,10 +112,13 @@ def add_node(genome: Genome, node_activation: ActivationFunction, history: Histo
     The weight of the Connection from the original from_node to the new Node will be 1.
     The weight of the Connection from the new Node to the original to_node will be the weight 
     of the original Connection.
+    If the Genome has no enabled Connections then it will be left unchanged.
     """
 
     # Get a random Connection
     viable_connections = [connection for connection in genome.connections if connection.enabled]
+    if not viable_connections:
+        return
     connection = random.choice(viable_connections)
 
     # Add a Node in the middle of the Connection
@@ -58,15 +126,15 @@ def add_node(genome: Genome, node_activation: ActivationFunction, history: Histo
 
 
 def mutate(
-    genome: Genome,
+    genome: Genome | CompactGenome,
     weights_rate: float,
     weight_replacement_rate: float,
     connection_rate: float,
     node_rate: float,
     node_activation: ActivationFunction,
     history: History,
-) -> None:
-    """Mutate the given Genome in place.
+) -> Genome | CompactGenome:
+    """Mutate the given Genome in place and return it.
 
     The given Genome must have had genome.prepare_network() called at some point
     in its lifetime.
@@ -83,13 +151,39 @@ def mutate(
     Each Connection selected for mutation will have a value ~N(0,0.2) added 
     to its weight.
     If a weight becomes out of the range [-1,1] it will be clipped to it.
+
+    A CompactGenome only has its weights mutated in place, if a Connection or Node is to be 
+    added to it then the full Genome it describes is mutated and returned instead.
     """
 
     if random.uniform(0, 1) < weights_rate:
         mutate_weights(genome, weight_replacement_rate)
 
+    return mutate_structure(genome, connection_rate, node_rate, node_activation, history)
+
+
+def mutate_structure(
+    genome: Genome | CompactGenome,
+    connection_rate: float,
+    node_rate: float,
+    node_activation: ActivationFunction,
+    history: History,
+) -> Genome | CompactGenome:
+    """Add a new Connection and/or Node to the given Genome at the given rates, as mutate does 
+    after mutating its weights, and return it.
+
+    If a Connection or Node is to be added to a CompactGenome then the full Genome it describes 
+    is mutated and returned instead.
+    """
+
     if random.uniform(0, 1) < connection_rate:
+        if isinstance(genome, CompactGenome):
+            genome = Genome.from_compact(genome)
         add_connection(genome, history)
                 
     if random.uniform(0, 1) < node_rate:
-        add_node(genome, node_activation, history)
\ No newline at end of file
+        if isinstance(genome, CompactGenome):
+            genome = Genome.from_compact(genome)
+        add_node(genome, node_activation, history)
+
+    return genome
\ No newline at end of file
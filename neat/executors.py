@@ -0,0 +1,156 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Iterator, Any
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+import time
+
+
+class Executor(ABC):
+    """Base class for the backends that neat.run evaluates Players with.
+
+    An Executor is created once for the whole run and calls the initializer (if any) with initargs
+    once in each of its workers before they are used. Items are handed out to the workers in
+    chunks of chunksize.
+    """
+
+    name: str
+
+    def __init__(
+        self,
+        workers: int,
+        initializer: Callable[..., None] | None = None,
+        initargs: tuple = (),
+        chunksize: int = 1,
+    ) -> None:
+        self.workers: int = workers
+        self.chunksize: int = chunksize
+
+    @abstractmethod
+    def map(self, function: Callable[[Any], Any], items: Iterable[Any]) -> list[Any]:
+        """Return the results of calling function on each of the items, in order."""
+        pass
+
+    @abstractmethod
+    def imap_unordered(self, function: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[Any]:
+        """Return an iterator over the results of calling function on each of the items, in the 
+        order they finish, handing the next chunk of items to each worker as soon as it is free."""
+        pass
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """Stop the workers, waiting for any outstanding work to finish unless cancel is True."""
+        pass
+
+
+class SerialExecutor(Executor):
+    """Evaluates every item one after another in this process, which is useful for profiling."""
+
+    name = 'serial'
+
+    def __init__(
+        self,
+        workers: int,
+        initializer: Callable[..., None] | None = None,
+        initargs: tuple = (),
+        chunksize: int = 1,
+    ) -> None:
+        super().__init__(workers, initializer, initargs, chunksize)
+        if initializer is not None:
+            initializer(*initargs)
+
+    def map(self, function: Callable[[Any], Any], items: Iterable[Any]) -> list[Any]:
+        """Return the results of calling function on each of the items, in order."""
+        return [function(item) for item in items]
+
+    def imap_unordered(self, function: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[Any]:
+        """Return an iterator over the results of calling function on each of the items (which 
+        finish in order)."""
+        return (function(item) for item in items)
+
+
+class PoolExecutor(Executor):
+    """Evaluates items in a pool of workers that is kept until shutdown."""
+
+    PoolClass: type
+
+    def __init__(
+        self,
+        workers: int,
+        initializer: Callable[..., None] | None = None,
+        initargs: tuple = (),
+        chunksize: int = 1,
+    ) -> None:
+        super().__init__(workers, initializer, initargs, chunksize)
+        self.pool = self.PoolClass(processes=workers, initializer=initializer, initargs=initargs)
+
+    def map(self, function: Callable[[Any], Any], items: Iterable[Any]) -> list[Any]:
+        """Return the results of calling function on each of the items, in order."""
+        return self.pool.map(function, items, chunksize=self.chunksize)
+
+    def imap_unordered(self, function: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[Any]:
+        """Return an iterator over the results of calling function on each of the items, in the 
+        order they finish, handing the next chunk of items to each worker as soon as it is free."""
+        return self.pool.imap_unordered(function, items, chunksize=self.chunksize)
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """Stop the workers, waiting for any outstanding work to finish unless cancel is True."""
+
+        if cancel:
+            self.pool.terminate()
+        else:
+            self.pool.close()
+        self.pool.join()
+
+
+class ThreadExecutor(PoolExecutor):
+    """Evaluates items in a pool of threads, for simulations that release the GIL (e.g. NumPy
+    heavy ones, or on free-threaded builds of Python).
+
+    The initializer is called once in each thread, so anything it stores globally is shared.
+    """
+
+    name = 'thread'
+    PoolClass = ThreadPool
+
+
+class ProcessExecutor(PoolExecutor):
+    """Evaluates items in a pool of processes, for pure Python simulations.
+
+    The function and items must be picklable.
+    """
+
+    name = 'process'
+    PoolClass = Pool
+
+
+executors: dict[str, type[Executor]] = {
+    SerialExecutor.name: SerialExecutor,
+    ThreadExecutor.name: ThreadExecutor,
+    ProcessExecutor.name: ProcessExecutor,
+}
+
+
+def fastest_executor(
+    candidates: list[Executor],
+    function: Callable[[Any], Any],
+    sample: Callable[[], list[Any]],
+) -> Executor:
+    """Return the Executor in candidates that takes the shortest time to map function over a 
+    sample of items, shutting down all the others.
+
+    sample is called for a new sample for each candidate, since function may change the items.
+    """
+
+    timings = []
+    for executor in candidates:
+        items = sample()
+        start = time.perf_counter()
+        executor.map(function, items)
+        timings.append(time.perf_counter() - start)
+
+    fastest = candidates[timings.index(min(timings))]
+    for executor in candidates:
+        if executor is not fastest:
+            executor.shutdown()
+
+    return fastest
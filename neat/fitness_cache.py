@@ -0,0 +1,99 @@
+from __future__ import annotations
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any
+
+from neat.base_player import BasePlayer
+from neat.genome import Genome, CompactGenome
+
+
+def genome_hash(genome: Genome | CompactGenome) -> bytes:
+    """Return a hash of the given Genome's contents (its Nodes, and its Connections' weights,
+    innovation numbers and enabled flags) that is the same for any Genome with the same contents."""
+
+    compact = genome.compact()
+    digest = blake2b(digest_size=16)
+    digest.update(array('q', [
+        compact.input_count,
+        compact.output_count,
+        compact.layers,
+        compact.bias_node_idx,
+        len(compact.node_numbers),
+        len(compact.connection_innovations),
+    ]).tobytes())
+    for column in ('node_numbers', 'node_layers', 'node_activations', 'connection_from', 'connection_to',
+                   'connection_weights', 'connection_innovations', 'connection_enabled'):
+        digest.update(getattr(compact, column).tobytes())
+    return digest.digest()
+
+
+class FitnessCache:
+    """Remembers the fitness and observed attributes of simulated Players by the contents of their
+    Genomes, so that Players with the same Genome as one simulated before don't need simulating.
+
+    Only valid for deterministic simulations. Holds at most size results, discarding the least
+    recently used ones first.
+    """
+
+    def __init__(self, size: int, observables: list[str]) -> None:
+        self.size: int = size
+        self.observables: list[str] = observables
+        self._results: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def lookup(self, players: list[BasePlayer], keys: list[bytes]) -> list[int]:
+        """Assign the cached results to the Players whose Genomes have the given keys, and return
+        the indices of those that still need simulating.
+
+        Only the first of any Players with the same uncached key is returned.
+        """
+
+        pending, pending_keys = [], set()
+        for i, (player, key) in enumerate(zip(players, keys)):
+            if self.assign(player, key):
+                self.hits += 1
+            elif key not in pending_keys:
+                pending.append(i)
+                pending_keys.add(key)
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return pending
+
+    def assign(self, player: BasePlayer, key: bytes) -> bool:
+        """Assign the cached result for the given key to the given Player, and return whether 
+        there was one."""
+
+        result = self._results.get(key)
+        if result is None:
+            return False
+
+        self._results.move_to_end(key)
+        fitness, observations = result
+        player.fitness = fitness
+        for attribute, value in observations.items():
+            setattr(player, attribute, value)
+        return True
+
+    def complete(self, players: list[BasePlayer], keys: list[bytes], simulated: list[int]) -> list[int]:
+        """Cache the results of the Players at the simulated indices, give them to any other Players 
+        with the same keys, and return the indices of the Players still without results.
+        
+        To be used after lookup once the Players it returned have been simulated.
+        """
+
+        for i in simulated:
+            player, key = players[i], keys[i]
+            observations = {attribute: getattr(player, attribute) for attribute in self.observables}
+            self._results[key] = (player.fitness, observations)
+            self._results.move_to_end(key)
+
+        missing = [i for i, (player, key) in enumerate(zip(players, keys)) if not self.assign(player, key)]
+
+        while len(self._results) > self.size:
+            self._results.popitem(last=False)
+
+        return missing
@@ -1 +1,2 @@
-from .genome import Genome
\ No newline at end of file
+from .genome import Genome
+from .compact_genome import CompactGenome
\ No newline at end of file
@@ -1,8 +1,11 @@
 import math
-from typing import Callable, Literal
+from typing import Any, Callable, Literal
+
+from neat.numpy_support import require_numpy
 
 
 type ActivationFunction = Callable[[float], float]
+type VectorActivationFunction = Callable[[Any], Any]
 
 def sigmoid(x: float) -> float:
     # Use modified sigmoid that is optimized to be close to linear between activations
@@ -15,18 +18,125 @@ def relu(x: float) -> float:
 def linear(x: float) -> float:
     return x
 
-def activation_by_name(name: Literal['sigmoid', 'relu', 'linear']) -> ActivationFunction:
-    """Return activation function from name."""
+def sigmoid_vector(x: Any) -> Any:
+    np = require_numpy('vectorized activation functions')
+    with np.errstate(over='ignore'):
+        return 1.0 / (1.0 + np.exp(-4.9*x))
 
-    activations = {
-        'sigmoid': sigmoid,
-        'relu': relu,
-        'linear': linear,
-    }
+def relu_vector(x: Any) -> Any:
+    np = require_numpy('vectorized activation functions')
+    return np.maximum(0, x)
 
-    try:
-        activation = activations[name]
-    except KeyError:
+def linear_vector(x: Any) -> Any:
+    return x
+
+
+class SigmoidTable:
+    """Lookup table approximation of the (vectorized) sigmoid activation function.
+
+    The sigmoid is sampled at size evenly spaced points in [-limit, limit] and linearly
+    interpolated between them, with inputs outside the range clamped to it. The absolute
+    error is never more than self.max_error.
+    Whether this is faster than sigmoid_vector depends on how fast NumPy's exp is on the 
+    machine, so it is only used when asked for.
+    """
+
+    # Bound on the magnitude of the second derivative of sigmoid(x) = 1/(1+exp(-4.9x))
+    _CURVATURE = 4.9 ** 2 / (6 * math.sqrt(3))
+
+    def __init__(self, size: int = 4097, limit: float = 4.0) -> None:
+        np = require_numpy('SigmoidTable')
+
+        self.limit: float = limit
+        self.step: float = 2 * limit / (size - 1)
+        self.points = np.linspace(-limit, limit, size)
+        self.values = sigmoid_vector(self.points)
+        self.slopes = np.append(np.diff(self.values), 0)
+
+        interpolation_error = self.step ** 2 / 8 * self._CURVATURE
+        clamping_error = sigmoid(-limit)
+        self.max_error: float = max(interpolation_error, clamping_error)
+
+    def __call__(self, x: Any) -> Any:
+        np = require_numpy('SigmoidTable')
+
+        position = np.clip(np.asarray(x, dtype=float), -self.limit, self.limit)
+        position += self.limit
+        position *= 1 / self.step
+        index = position.astype(np.intp)
+        position -= index
+        return self.values[index] + position * self.slopes[index]
+
+
+# All known activation functions, with their position being their ID
+_activations: list[tuple[str, ActivationFunction, VectorActivationFunction]] = [
+    ('sigmoid', sigmoid, sigmoid_vector),
+    ('relu', relu, relu_vector),
+    ('linear', linear, linear_vector),
+]
+_sigmoid_table: SigmoidTable | None = None
+
+def register_activation(name: str, function: ActivationFunction, vector_function: VectorActivationFunction) -> int:
+    """Make a new activation function available by name and return its ID.
+
+    vector_function must compute the same values as function, element-wise on NumPy arrays.
+    Both must be defined at the top level of a module so that Genomes using them can be pickled.
+    """
+
+    if any(name == existing for existing, _, _ in _activations):
+        raise ValueError(f'An activation function named {name} is already registered.')
+
+    _activations.append((name, function, vector_function))
+    return len(_activations) - 1
+
+def activation_id(activation: ActivationFunction | str) -> int:
+    """Return the ID of the given (scalar) activation function or activation function name."""
+
+    for number, (name, function, _) in enumerate(_activations):
+        if activation == name or activation == function:
+            return number
+
+    raise TypeError(f'Invalid activation function {activation}.')
+
+def activation_name(number: int) -> str:
+    """Return the name of the activation function with the given ID."""
+
+    if not 0 <= number < len(_activations):
+        raise TypeError(f'Invalid activation function ID {number}.')
+    return _activations[number][0]
+
+def activation_by_name(
+    name: Literal['sigmoid', 'relu', 'linear'] | str | int,
+    vectorized: bool = False,
+) -> ActivationFunction | VectorActivationFunction:
+    """Return activation function from name or ID.
+
+    If vectorized is True the form that acts element-wise on NumPy arrays will be returned.
+    """
+
+    number = name if isinstance(name, int) else activation_id(name)
+    if not 0 <= number < len(_activations):
         raise TypeError(f"Invalid activation function {name}.")
+    _, function, vector_function = _activations[number]
+
+    return vector_function if vectorized else function
+
+def vectorize(activation: ActivationFunction, approximate: bool = False) -> VectorActivationFunction:
+    """Return the vectorized form of the given activation function.
 
-    return activation
\ No newline at end of file
+    If approximate is True the sigmoid will be given by a (shared) SigmoidTable.
+    Unregistered functions are wrapped with numpy.vectorize.
+    """
+
+    global _sigmoid_table
+
+    if approximate and activation is sigmoid:
+        if _sigmoid_table is None:
+            _sigmoid_table = SigmoidTable()
+        return _sigmoid_table
+
+    try:
+        return activation_by_name(activation_id(activation), vectorized=True)
+    except TypeError:
+        np = require_numpy('vectorized activation functions')
+        return np.vectorize(activation, otypes=[float])
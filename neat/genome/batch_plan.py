@@ -0,0 +1,124 @@
+from __future__ import annotations
+from typing import Any
+
+from neat.numpy_support import require_numpy
+from neat.genome.activation_functions import ActivationFunction, VectorActivationFunction, vectorize
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from neat.genome import Genome, CompactGenome
+
+
+class LayerStep:
+    """The Nodes in one layer of a Genome that have enabled outgoing Connections, and a dense
+    matrix of the weights from them to the Nodes they feed."""
+
+    def __init__(
+        self,
+        sources: Any,
+        groups: list[tuple[VectorActivationFunction, Any]],
+        targets: Any,
+        weights: Any,
+    ) -> None:
+        self.sources = sources
+        self.groups: list[tuple[VectorActivationFunction, Any]] = groups
+        self.targets = targets
+        self.weights = weights
+
+
+class BatchPlan:
+    """Description of a Genome that evaluates it on a whole matrix of inputs at once.
+
+    Values move through the Genome one layer at a time, each as a single matrix product
+    with the Nodes' activation functions applied column-wise.
+    If approximate is True sigmoid activations are computed with a lookup table.
+    Requires NumPy.
+    """
+
+    def __init__(self, genome: Genome | CompactGenome, approximate: bool = False) -> None:
+        np = require_numpy('Genome.propagate_batch')
+
+        self.approximate: bool = approximate
+        self.input_count: int = genome.input_count
+        self.output_count: int = genome.output_count
+        self.bias_node_idx: int = genome.bias_node_idx
+        nodes = genome.nodes
+        self.size: int = len(nodes)
+
+        positions = {node.number: i for i, node in enumerate(nodes)}
+
+        # One step for each layer that feeds another
+        self.steps: list[LayerStep] = []
+        for layer in range(genome.layers - 1):
+            sources = [i for i, node in enumerate(nodes) if node.layer == layer and
+                       any(connection.enabled for connection in node.output_connections)]
+            if not sources:
+                continue
+
+            connections = [(row, positions[connection.to_node.number], connection.weight)
+                           for row, i in enumerate(sources)
+                           for connection in nodes[i].output_connections if connection.enabled]
+            targets = sorted({target for _, target, _ in connections})
+            columns = {target: column for column, target in enumerate(targets)}
+
+            weights = np.zeros((len(sources), len(targets)))
+            for row, target, weight in connections:
+                weights[row, columns[target]] += weight
+
+            activations = [nodes[i].activation for i in sources]
+            self.steps.append(LayerStep(
+                sources = np.array(sources),
+                groups = self._group(activations),
+                targets = np.array(targets),
+                weights = weights,
+            ))
+
+        # The output Nodes are always the last in the Genome
+        self.outputs = np.arange(self.size - self.output_count, self.size)
+        self.output_groups = self._group([node.activation for node in nodes[self.size - self.output_count:]])
+
+    def _group(self, activations: list[ActivationFunction]) -> list[tuple[VectorActivationFunction, Any]]:
+        """Return the given activation functions as (vectorized function, positions) pairs."""
+
+        np = require_numpy('Genome.propagate_batch')
+
+        positions = {}
+        for i, activation in enumerate(activations):
+            positions.setdefault(activation, []).append(i)
+
+        return [(vectorize(activation, self.approximate), np.array(indices)) for activation, indices in positions.items()]
+
+    def _activate(self, values: Any, groups: list[tuple[VectorActivationFunction, Any]]) -> Any:
+        """Return the given matrix of Node inputs with the activation functions applied."""
+
+        np = require_numpy('Genome.propagate_batch')
+
+        outputs = np.empty_like(values)
+        for activation, columns in groups:
+            outputs[:, columns] = activation(values[:, columns])
+        return outputs
+
+    def propagate(self, inputs: Any) -> Any:
+        """Feed in an (N, input_count) array of input values and return the (N, output_count)
+        array of outputs.
+
+        Each row of input must already be in order and normalised.
+        """
+
+        np = require_numpy('Genome.propagate_batch')
+
+        inputs = np.asarray(inputs, dtype=float)
+        if inputs.ndim != 2 or inputs.shape[1] != self.input_count:
+            raise ValueError(f'Batched input must have shape (N, {self.input_count}), not {inputs.shape}.')
+
+        # Node input values, with layer zero set
+        values = np.zeros((inputs.shape[0], self.size))
+        values[:, :self.input_count] = inputs
+        values[:, self.bias_node_idx] = 1
+
+        # Propagate the values
+        for step in self.steps:
+            outputs = self._activate(values[:, step.sources], step.groups)
+            values[:, step.targets] += outputs @ step.weights
+
+        return self._activate(values[:, self.outputs], self.output_groups)
@@ -0,0 +1,362 @@
+from __future__ import annotations
+from array import array
+from typing import Iterable, Generator, Any
+from pathlib import Path
+import pickle
+
+from neat.genome.node import Node
+from neat.genome.connection import Connection
+from neat.genome.activation_functions import ActivationFunction, activation_by_name, activation_id, activation_name
+from neat.genome.evaluation_plan import EvaluationPlan
+from neat.genome.batch_plan import BatchPlan
+from neat.instrumentation import instrumentation
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from neat.genome import Genome
+
+
+class NodeView:
+    """Read-only view of a Node in a CompactGenome, with the same interface as a Node."""
+
+    __slots__ = ('_genome', '_index')
+
+    def __init__(self, genome: CompactGenome, index: int) -> None:
+        self._genome: CompactGenome = genome
+        self._index: int = index
+
+    @property
+    def number(self) -> int:
+        return self._genome.node_numbers[self._index]
+
+    @property
+    def layer(self) -> int:
+        return self._genome.node_layers[self._index]
+
+    @property
+    def activation(self) -> ActivationFunction:
+        return activation_by_name(self._genome.node_activations[self._index])
+
+    @property
+    def output_connections(self) -> list[ConnectionView]:
+        return [ConnectionView(self._genome, i) for i in self._genome.outgoing(self.number)]
+
+    def connected_to(self, other: Node | NodeView) -> bool:
+        """Return True if the other Node is in this Node's list of outputs."""
+        return other.number in [connection.to_node.number for connection in self.output_connections]
+
+    def clone(self) -> Node:
+        """Return a (full) Node copy of this Node."""
+        return Node(self.number, self.layer, self.activation)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, NodeView) and other._genome is self._genome and other._index == self._index
+
+    def __hash__(self) -> int:
+        return hash((id(self._genome), self._index))
+
+    def __repr__(self) -> str:
+        """Return representation of this Node."""
+        return f'<Node: Number = {self.number}, Layer = {self.layer}, Activation = {self.activation.__name__}>'
+
+
+class ConnectionView:
+    """View of a Connection in a CompactGenome, with the same interface as a Connection.
+
+    Setting the weight or enabled flag writes through to the CompactGenome.
+    """
+
+    __slots__ = ('_genome', '_index')
+
+    def __init__(self, genome: CompactGenome, index: int) -> None:
+        self._genome: CompactGenome = genome
+        self._index: int = index
+
+    @property
+    def from_node(self) -> NodeView:
+        return self._genome.node(self._genome.connection_from[self._index])
+
+    @property
+    def to_node(self) -> NodeView:
+        return self._genome.node(self._genome.connection_to[self._index])
+
+    @property
+    def weight(self) -> float:
+        return self._genome.connection_weights[self._index]
+
+    @weight.setter
+    def weight(self, value: float) -> None:
+        self._genome.connection_weights[self._index] = value
+        self._genome.invalidate()
+
+    @property
+    def innovation_number(self) -> int:
+        return self._genome.connection_innovations[self._index]
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._genome.connection_enabled[self._index])
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._genome.connection_enabled[self._index] = value
+        self._genome.invalidate()
+
+    def clone(self, from_node: Node, to_node: Node) -> Connection:
+        """Return a (full) Connection copy of this Connection but between the given Nodes."""
+        return Connection(from_node, to_node, self.weight, self.innovation_number, self.enabled)
+
+    def __repr__(self) -> str:
+        """Return representation of this Connection."""
+        return f'<Connection: From = {self.from_node.number}, To = {self.to_node.number}, ' + \
+               f'Weight = {self.weight}, Innovation = {self.innovation_number}, Enabled = {self.enabled}>'
+
+
+# The (name, typecode) of each of the typed array columns of a CompactGenome
+COLUMNS = [('node_numbers', 'q'), ('node_layers', 'q'), ('node_activations', 'B'), ('connection_from', 'q'),
+           ('connection_to', 'q'), ('connection_weights', 'd'), ('connection_innovations', 'q'),
+           ('connection_enabled', 'b')]
+
+
+class CompactGenome:
+    """A Genome stored as typed arrays (struct-of-arrays) rather than Node and Connection objects.
+
+    Nodes are rows of (number, layer, activation ID) in topological order and Connections are
+    rows of (from Node number, to Node number, weight, innovation number, enabled), grouped by
+    their from-Node in the same order.
+    It can be propagated, pickled and cloned cheaply, and provides the read-side of the Genome
+    interface through NodeViews and ConnectionViews. Structural mutation requires the full
+    Genome, see Genome.from_compact.
+    """
+
+    def __init__(self, input_count: int, output_count: int, layers: int) -> None:
+        self.input_count: int = input_count
+        self.output_count: int = output_count
+        self.bias_node_idx: int = input_count
+        self.layers: int = layers
+
+        self.node_numbers: array[int] = array('q')
+        self.node_layers: array[int] = array('q')
+        self.node_activations: array[int] = array('B')
+
+        self.connection_from: array[int] = array('q')
+        self.connection_to: array[int] = array('q')
+        self.connection_weights: array[float] = array('d')
+        self.connection_innovations: array[int] = array('q')
+        self.connection_enabled: array[int] = array('b')
+
+        self._positions: dict[int, int] | None = None
+        self._outgoing: dict[int, list[int]] | None = None
+        self._innovation_order: list[int] | None = None
+        self._plan: EvaluationPlan | None = None
+        self._batch_plan: BatchPlan | None = None
+
+    @classmethod
+    def from_genome(cls, genome: Genome) -> CompactGenome:
+        """Return the CompactGenome holding the same Nodes and Connections as the given Genome."""
+
+        compact = cls(genome.input_count, genome.output_count, genome.layers)
+        compact.bias_node_idx = genome.bias_node_idx
+
+        for node in genome.nodes:
+            compact.node_numbers.append(node.number)
+            compact.node_layers.append(node.layer)
+            compact.node_activations.append(activation_id(node.activation))
+            for connection in node.output_connections:
+                compact.connection_from.append(node.number)
+                compact.connection_to.append(connection.to_node.number)
+                compact.connection_weights.append(connection.weight)
+                compact.connection_innovations.append(connection.innovation_number)
+                compact.connection_enabled.append(connection.enabled)
+
+        return compact
+
+    def compact(self) -> CompactGenome:
+        """Return this CompactGenome, for symmetry with Genome.compact."""
+        return self
+
+    def outgoing(self, number: int) -> list[int]:
+        """Return the row indices of the Connections leaving the Node with the given number."""
+
+        if self._outgoing is None:
+            self._outgoing = {number: [] for number in self.node_numbers}
+            for i, from_number in enumerate(self.connection_from):
+                self._outgoing[from_number].append(i)
+        return self._outgoing[number]
+
+    def node(self, number: int) -> NodeView:
+        """Return a view of the Node with the given number."""
+
+        if self._positions is None:
+            self._positions = {number: i for i, number in enumerate(self.node_numbers)}
+        return NodeView(self, self._positions[number])
+
+    @property
+    def nodes(self) -> list[NodeView]:
+        """Return views of the Nodes in the Genome."""
+        return [NodeView(self, i) for i in range(len(self.node_numbers))]
+
+    @property
+    def connections(self) -> Generator[ConnectionView,None,None]:
+        """Return views of the Connections in the Genome."""
+        for i in range(len(self.connection_innovations)):
+            yield ConnectionView(self, i)
+
+    @property
+    def connection_count(self) -> int:
+        """Return the number of Connections in the Genome."""
+        return len(self.connection_innovations)
+
+    @property
+    def sorted_connections(self) -> list[ConnectionView]:
+        """Return views of the Connections in the Genome in ascending order of innovation number."""
+        return [ConnectionView(self, i) for i in self.innovation_order]
+
+    @property
+    def innovation_order(self) -> list[int]:
+        """Return the row indices of the Connections in ascending order of innovation number."""
+
+        if self._innovation_order is None:
+            self._innovation_order = sorted(range(len(self.connection_innovations)),
+                                            key=self.connection_innovations.__getitem__)
+        return self._innovation_order
+
+    @property
+    def innovation_numbers(self) -> set[int]:
+        """Return the innovation numbers found in the this Genome's Connections."""
+        return set(self.connection_innovations)
+
+    @property
+    def next_node(self) -> int:
+        """The number to assign to the next Node that is added to this Genome."""
+        return len(self.node_numbers)
+
+    @property
+    def nodes_dict(self) -> dict[int, NodeView]:
+        """Return views of this Genome's Nodes as a dictionary with their numbers as the keys."""
+        return {node.number: node for node in self.nodes}
+
+    @property
+    def connections_dict(self) -> dict[int, ConnectionView]:
+        """Return views of this Genome's Connections as a dictionary with their innovation numbers
+        as the keys."""
+        return {connection.innovation_number: connection for connection in self.connections}
+
+    @property
+    def plan(self) -> EvaluationPlan:
+        """Return the compiled EvaluationPlan for this Genome, building it if it isn't cached."""
+
+        if self._plan is None:
+            positions = {number: i for i, number in enumerate(self.node_numbers)}
+            counts = [0] * len(self.node_numbers)
+            targets, weights = [], []
+            for from_number, to_number, weight, enabled in zip(
+                self.connection_from, self.connection_to, self.connection_weights, self.connection_enabled,
+            ):
+                if enabled:
+                    counts[positions[from_number]] += 1
+                    targets.append(positions[to_number])
+                    weights.append(weight)
+
+            starts = [0]
+            for count in counts:
+                starts.append(starts[-1] + count)
+
+            self._plan = EvaluationPlan(
+                activations = [activation_by_name(activation) for activation in self.node_activations],
+                starts = starts,
+                targets = targets,
+                weights = weights,
+                input_count = self.input_count,
+                output_count = self.output_count,
+                bias_node_idx = self.bias_node_idx,
+            )
+
+        return self._plan
+
+    def propagate(self, input: Iterable[float]) -> tuple[float, ...]:
+        """Feed in input values for the NN and return output.
+
+        The input must already be in order and normalised.
+        """
+        return self.plan.propagate(input)
+
+    def propagate_batch(self, inputs: Any, approximate: bool = False) -> Any:
+        """Feed in an (N, input_count) NumPy array of input values and return the (N, output_count) 
+        array of outputs, as Genome.propagate_batch does.
+        
+        Requires NumPy.
+        """
+
+        if self._batch_plan is None or self._batch_plan.approximate != approximate:
+            self._batch_plan = BatchPlan(self, approximate)
+        return self._batch_plan.propagate(inputs)
+
+    def invalidate(self, weights_only: bool = True) -> None:
+        """Discard the cached evaluation plans, called whenever a weight or enabled flag changes.
+        
+        The structure of a CompactGenome can't change, so weights_only makes no difference.
+        """
+        self._plan = None
+        self._batch_plan = None
+
+    def clone(self) -> CompactGenome:
+        """Return a copy of this CompactGenome, whose columns are always arrays (even if this one's
+        are views into a GenomeArena)."""
+
+        clone = self.__class__(self.input_count, self.output_count, self.layers)
+        clone.bias_node_idx = self.bias_node_idx
+        for column, typecode in COLUMNS:
+            setattr(clone, column, array(typecode, getattr(self, column)))
+        clone._innovation_order = self._innovation_order
+        return clone
+
+    def save(self, folder: Path, filename: str) -> None:
+        """Save this CompactGenome instance in the given folder with the given filename using pickle.
+
+        If a save already exists in the same folder with the same filename it will be overwritten.
+        Genome.load will load it back in as a CompactGenome.
+        """
+
+        if instrumentation.enabled:
+            instrumentation.count('genomes_serialized')
+
+        destination = folder / f'{filename}.pickle'
+        with destination.open('wb') as dest:
+            pickle.dump(self, dest)
+
+    def __getstate__(self) -> dict:
+        """Return the state to pickle, leaving out anything that is cached.
+
+        Activation IDs depend on the order activation functions were registered in each process, so 
+        the Nodes' activations are pickled as positions in a table of activation function names.
+        """
+
+        state = self.__dict__.copy()
+        names = [activation_name(id) for id in sorted(set(self.node_activations))]
+        positions = {activation_id(name): i for i, name in enumerate(names)}
+        state['node_activations'] = array('B', [positions[id] for id in self.node_activations])
+        state['activation_names'] = names
+        state['_positions'] = None
+        state['_outgoing'] = None
+        state['_innovation_order'] = None
+        state['_plan'] = None
+        state['_batch_plan'] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the pickled state, which may come from before some of it was cached or before 
+        activations were pickled by name."""
+
+        names = state.pop('activation_names', None)
+        if names is not None:
+            ids = [activation_id(name) for name in names]
+            state['node_activations'] = array('B', [ids[i] for i in state['node_activations']])
+        self.__dict__.update(state)
+        self._innovation_order = None
+        self._batch_plan = None
+
+    def __repr__(self) -> str:
+        """Return representation of this CompactGenome."""
+        return f'<CompactGenome: Layers = {self.layers}, Nodes = {len(self.node_numbers)}, ' + \
+               f'Connections = {len(self.connection_innovations)}>'
@@ -7,6 +7,8 @@ from neat.genome.node import Node
 class Connection:
     """Connection between two Nodes in the Neural Network of a Genome."""
 
+    __slots__ = ('from_node', 'to_node', 'weight', 'innovation_number', 'enabled')
+
     def __init__(self,
                  from_node: Node,
                  to_node: Node,
@@ -34,6 +36,15 @@ class Connection:
         """
         return self.__class__(from_node, to_node, self.weight, self.innovation_number, self.enabled)
 
+    def __getstate__(self) -> dict:
+        """Return the state to pickle."""
+        return {attribute: getattr(self, attribute) for attribute in self.__slots__}
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the pickled state, which may come from before Connections had slots."""
+        for attribute, value in state.items():
+            setattr(self, attribute, value)
+
     def __repr__(self) -> str:
         """Return representation of this Connection."""
         return f'<Connection: From = {self.from_node.number}, To = {self.to_node.number}, ' + \
@@ -0,0 +1,94 @@
+from __future__ import annotations
+from bisect import insort
+
+from neat.genome.node import Node
+from neat.genome.connection import Connection
+
+
+class DerivedState:
+    """Views of a Genome's Nodes and Connections that are expensive to recompute.
+
+    They are built together from the Genome's Nodes and then kept up to date by the Genome
+    as Connections and Nodes are added. They only depend on which Nodes and Connections exist,
+    not on weights or enabled flags.
+
+    A Node can be connected to any Node in a later layer, so the number of new Connections each
+    Node could still make (its available targets) is tracked, along with their total.
+    """
+
+    def __init__(self, nodes: list[Node], layers: int) -> None:
+        connections = [connection for node in nodes for connection in node.output_connections]
+
+        self.connection_count: int = len(connections)
+        self.innovation_numbers: set[int] = {connection.innovation_number for connection in connections}
+        self.connections_dict: dict[int, Connection] = {connection.innovation_number: connection for connection in connections}
+        self.nodes_dict: dict[int, Node] = {node.number: node for node in nodes}
+
+        # Connections in ascending order of innovation number (ties kept in Genome order)
+        self.sorted_connections: list[Connection] = sorted(connections, key=lambda connection: connection.innovation_number)
+
+        # The numbers of the Nodes each Node has a Connection to
+        self.targets: dict[int, set[int]] = {node.number: set() for node in nodes}
+        for connection in connections:
+            self.targets[connection.from_node.number].add(connection.to_node.number)
+
+        self.layer_counts: list[int]
+        self.nodes_after: list[int]
+        self.available_connections: int
+        self.count_layers(nodes, layers)
+
+    @property
+    def sorted_innovations(self) -> list[int]:
+        """Return the innovation numbers of the Genome's Connections in ascending order."""
+        return [connection.innovation_number for connection in self.sorted_connections]
+
+    def count_layers(self, nodes: list[Node], layers: int) -> None:
+        """Recount the number of Nodes in (and after) each layer, and the number of Connections
+        that could still be added."""
+
+        self.layer_counts = [0] * layers
+        for node in nodes:
+            self.layer_counts[node.layer] += 1
+
+        self.count_nodes_after()
+        self.available_connections = sum(self.available_targets(node) for node in nodes)
+
+    def count_nodes_after(self) -> None:
+        """Recount the number of Nodes after each layer from the number in each layer."""
+
+        self.nodes_after = [0] * len(self.layer_counts)
+        for layer in reversed(range(len(self.layer_counts) - 1)):
+            self.nodes_after[layer] = self.nodes_after[layer + 1] + self.layer_counts[layer + 1]
+
+    def available_targets(self, node: Node) -> int:
+        """Return the number of Nodes the given Node could have a new Connection to."""
+        return self.nodes_after[node.layer] - len(self.targets[node.number])
+
+    def add_connection(self, connection: Connection) -> None:
+        """Update the views after the given Connection has been added to the Genome."""
+
+        self.connection_count += 1
+        targets = self.targets[connection.from_node.number]
+        if connection.to_node.number not in targets:
+            targets.add(connection.to_node.number)
+            self.available_connections -= 1
+        self.innovation_numbers.add(connection.innovation_number)
+        self.connections_dict[connection.innovation_number] = connection
+        insort(self.sorted_connections, connection, key=lambda connection: connection.innovation_number)
+
+    def add_node(self, node: Node, layer_inserted: bool) -> None:
+        """Update the views after the given Node has been added to the Genome, in a new layer that
+        was inserted for it if layer_inserted is True.
+
+        Inserting a layer doesn't change which Nodes come after which, so only the new Node and 
+        the Nodes before it gain available targets.
+        """
+
+        self.nodes_dict[node.number] = node
+        self.targets[node.number] = set()
+
+        if layer_inserted:
+            self.layer_counts.insert(node.layer, 0)
+        self.layer_counts[node.layer] += 1
+        self.count_nodes_after()
+        self.available_connections += self.nodes_after[node.layer] + sum(self.layer_counts[:node.layer])
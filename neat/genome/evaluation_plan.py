@@ -0,0 +1,99 @@
+from __future__ import annotations
+from typing import Iterable
+
+from neat.genome.activation_functions import ActivationFunction, linear
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from neat.genome import Genome
+
+
+class EvaluationPlan:
+    """Flat, index-based description of how values propagate through a Genome.
+
+    Nodes are referred to by their position in the Genome's list of Nodes, which is always in
+    topological order. The enabled Connections leaving the Node at position i are stored in
+    targets[starts[i]:starts[i + 1]] and weights[starts[i]:starts[i + 1]] (compressed sparse
+    row format), in the same order as that Node's output_connections.
+    """
+
+    def __init__(
+        self,
+        activations: list[ActivationFunction],
+        starts: list[int],
+        targets: list[int],
+        weights: list[float],
+        input_count: int,
+        output_count: int,
+        bias_node_idx: int,
+    ) -> None:
+        self.activations: list[ActivationFunction] = activations
+        self.starts: list[int] = starts
+        self.targets: list[int] = targets
+        self.weights: list[float] = weights
+        self.input_count: int = input_count
+        self.output_count: int = output_count
+        self.bias_node_idx: int = bias_node_idx
+
+        # Only Nodes with at least one enabled outgoing Connection need to engage, and each
+        # does so through pre-zipped (target, weight) pairs
+        self._engaging: list[tuple[int, ActivationFunction | None, tuple[tuple[int, float], ...]]] = []
+        for i, activation in enumerate(activations):
+            start, end = starts[i], starts[i + 1]
+            if start == end:
+                continue
+            edges = tuple(zip(targets[start:end], weights[start:end]))
+            self._engaging.append((i, None if activation is linear else activation, edges))
+
+    @property
+    def size(self) -> int:
+        """Return the number of Nodes in the plan."""
+        return len(self.activations)
+
+    @classmethod
+    def from_genome(cls, genome: Genome) -> EvaluationPlan:
+        """Return the plan for the given Genome's current Nodes and enabled Connections."""
+
+        positions = {node.number: i for i, node in enumerate(genome.nodes)}
+
+        activations, starts, targets, weights = [], [], [], []
+        for node in genome.nodes:
+            activations.append(node.activation)
+            starts.append(len(targets))
+            for connection in node.output_connections:
+                if connection.enabled:
+                    targets.append(positions[connection.to_node.number])
+                    weights.append(connection.weight)
+        starts.append(len(targets))
+
+        return cls(
+            activations = activations,
+            starts = starts,
+            targets = targets,
+            weights = weights,
+            input_count = genome.input_count,
+            output_count = genome.output_count,
+            bias_node_idx = genome.bias_node_idx,
+        )
+
+    def propagate(self, input: Iterable[float]) -> tuple[float, ...]:
+        """Feed in input values for the NN and return output.
+
+        The input must already be in order and normalised.
+        """
+
+        # Node input values, with layer zero set
+        values = [0] * self.size
+        for i, value in enumerate(input):
+            values[i] = value
+        values[self.bias_node_idx] = 1
+
+        # Propagate the values
+        for i, activation, edges in self._engaging:
+            output = values[i] if activation is None else activation(values[i])
+            for target, weight in edges:
+                values[target] += output * weight
+
+        # Return the output Node output values
+        activations = self.activations
+        return tuple([activations[i](values[i]) for i in range(self.size - self.output_count, self.size)])
@@ -1,18 +1,31 @@
 from __future__ import annotations
-from typing import Iterable, Generator
+from typing import Iterable, Generator, Any
 from pathlib import Path, PosixPath
+from bisect import bisect_right
 import random
 import pickle
 
 from neat.genome.node import Node
 from neat.genome.connection import Connection
-from neat.genome.activation_functions import ActivationFunction, sigmoid
+from neat.genome.activation_functions import ActivationFunction, sigmoid, activation_by_name
+from neat.genome.evaluation_plan import EvaluationPlan
+from neat.genome.batch_plan import BatchPlan
+from neat.genome.compact_genome import CompactGenome
+from neat.genome.derived_state import DerivedState
 from neat.history import History
+from neat.instrumentation import instrumentation
 
 
 class Genome:
     """A Neural Network described by lists of Nodes and the Connections 
-    between them."""
+    between them.
+    
+    Views derived from the Nodes and Connections are cached, so the dictionaries and sets returned 
+    by the properties below must not be modified.
+    The Nodes are kept in the order they engage in, ascending by layer then number.
+    topology_version is increased whenever Nodes or Connections are added (or the Genome is 
+    invalidated), so anything compiled from this Genome's structure can check if it is out of date.
+    """
 
     def __init__(self, input_count: int, output_count: int) -> None:
         self.nodes: list[Node] = list()
@@ -20,6 +33,18 @@ class Genome:
         self.input_count: int = input_count
         self.output_count: int = output_count
         self.bias_node_idx: int = input_count
+        self.topology_version: int = 0
+        self._plan: EvaluationPlan | None = None
+        self._batch_plan: BatchPlan | None = None
+        self._derived: DerivedState | None = None
+
+    @property
+    def derived(self) -> DerivedState:
+        """Return the cached DerivedState of this Genome, building it if it isn't cached."""
+
+        if self._derived is None:
+            self._derived = DerivedState(self.nodes, self.layers)
+        return self._derived
 
     @property
     def connections(self) -> Generator[Connection,None,None]:
@@ -27,10 +52,20 @@ class Genome:
         for node in self.nodes:
             yield from node.output_connections
 
+    @property
+    def connection_count(self) -> int:
+        """Return the number of Connections in the Genome."""
+        return self.derived.connection_count
+
+    @property
+    def sorted_connections(self) -> list[Connection]:
+        """Return the Connections in the Genome in ascending order of innovation number."""
+        return self.derived.sorted_connections
+
     @property
     def innovation_numbers(self) -> set[int]:
         """Return the innovation numbers found in the this Genome's Connections."""
-        return {connection.innovation_number for connection in self.connections}
+        return self.derived.innovation_numbers
 
     @property
     def next_node(self) -> int:
@@ -40,32 +75,26 @@ class Genome:
     @property
     def fully_connected(self) -> bool:
         """Return True if the NN is fully connected."""
-
-        # Create a dictionary containing the number of Nodes in each layer
-        nodes_in_layers = {layer: 0 for layer in range(self.layers)}
-        for node in self.nodes:
-            nodes_in_layers[node.layer] += 1
-
-        # Create a dictionary containing the number of Nodes in front of a layer
-        nodes_in_front = {layer: sum([nodes_in_layers[i] for i in range(layer + 1, self.layers)]) for layer in range(self.layers)}
-
-        # Compute the number of connections a fully connected NN would have
-        max_connections = 0
-        for layer in range(self.layers):
-            max_connections += nodes_in_front[layer] * nodes_in_layers[layer]
-
-        return max_connections == len(list(self.connections))
+        return self.derived.available_connections == 0
 
     @property
     def nodes_dict(self) -> dict[int, Node]:
         """Return this Genome's Nodes as a dictionary with their numbers as the keys."""
-        return {node.number: node for node in self.nodes}
+        return self.derived.nodes_dict
     
     @property
     def connections_dict(self) -> dict[int, Connection]:
         """Return this Genome's Connections as a dictionary with their innovation numbers 
         as the keys."""
-        return {connection.innovation_number: connection for connection in self.connections}
+        return self.derived.connections_dict
+
+    @property
+    def plan(self) -> EvaluationPlan:
+        """Return the compiled EvaluationPlan for this Genome, building it if it isn't cached."""
+
+        if self._plan is None:
+            self._plan = EvaluationPlan.from_genome(self)
+        return self._plan
     
     @classmethod
     def new(cls, input_count: int, output_count: int, history: History) -> Genome:
@@ -95,6 +124,36 @@ class Genome:
         genome.add_connection(from_node, to_node, history)
 
         return genome
+
+    @classmethod
+    def from_compact(cls, compact: CompactGenome) -> Genome:
+        """Return the full Genome, made of Node and Connection objects, that the given CompactGenome 
+        describes."""
+
+        genome = cls(compact.input_count, compact.output_count)
+        genome.layers = compact.layers
+        genome.bias_node_idx = compact.bias_node_idx
+
+        for number, layer, activation in zip(compact.node_numbers, compact.node_layers, compact.node_activations):
+            genome.nodes.append(Node(number, layer, activation_by_name(activation)))
+
+        nodes = {node.number: node for node in genome.nodes}
+        for from_number, to_number, weight, innovation_number, enabled in zip(
+            compact.connection_from,
+            compact.connection_to,
+            compact.connection_weights,
+            compact.connection_innovations,
+            compact.connection_enabled,
+        ):
+            from_node = nodes[from_number]
+            connection = Connection(from_node, nodes[to_number], weight, innovation_number, bool(enabled))
+            from_node.output_connections.append(connection)
+
+        return genome
+
+    def compact(self) -> CompactGenome:
+        """Return a CompactGenome copy of this Genome."""
+        return CompactGenome.from_genome(self)
     
     def add_connection(self, from_node: Node, to_node: Node, history: History, weight: float | None = None) -> None:
         """Add a Connection between the specified Nodes.
@@ -110,6 +169,11 @@ class Genome:
             new_connection = Connection.random_weight(from_node, to_node, innovation_number)
         new_connection.from_node.output_connections.append(new_connection)
 
+        self.topology_version += 1
+        self.invalidate_plans()
+        if self._derived is not None:
+            self._derived.add_connection(new_connection)
+
     def add_node(self, connection: Connection, activation_function: ActivationFunction, history: History) -> None:
         """Disable the given Connection and then insert a Node inbetween the previous from- and 
         to-nodes and add new Connections between them.
@@ -121,20 +185,25 @@ class Genome:
         """
         
         connection.enabled = False
+        self.topology_version += 1
+        self.invalidate_plans()
 
-        # Increment Node layer numbers if there is no space for a new Node
-        if connection.to_node.layer - connection.from_node.layer == 1:
-            for node in self.nodes:
-                if node.layer > connection.from_node.layer:
-                    node.layer += 1
+        # The Nodes after the from_node's layer start here, as the Nodes are in order of layer
+        start = bisect_right(self.nodes, connection.from_node.layer, key=lambda node: node.layer)
+
+        # Increment their layer numbers if there is no space for a new Node
+        layer_inserted = connection.to_node.layer - connection.from_node.layer == 1
+        if layer_inserted:
+            for i in range(start, len(self.nodes)):
+                self.nodes[i].layer += 1
             self.layers += 1
 
-        # Create a new Node one layer on from the from_node
+        # Create a new Node one layer on from the from_node, and as it has the highest number insert 
+        # it after the rest of that layer so the Nodes stay in the order they engage in
         new_node = Node(self.next_node, connection.from_node.layer + 1, activation_function)
-        self.nodes.append(new_node)
-
-        # Reorder the Nodes so they engage in the correct order
-        self.nodes.sort(key=lambda node: (node.layer, node.number))
+        self.nodes.insert(bisect_right(self.nodes, new_node.layer, lo=start, key=lambda node: node.layer), new_node)
+        if self._derived is not None:
+            self._derived.add_node(new_node, layer_inserted)
 
         # Connect to the original Nodes and the bias Node
         self.add_connection(connection.from_node, new_node, history, weight=1)
@@ -146,21 +215,40 @@ class Genome:
         The input must already be in order and normalised.
         """
 
-        # Clear all Node input values
-        for node in self.nodes:
-            node.input = 0
+        return self.plan.propagate(input)
 
-        # Set layer zero Nodes input values
-        for i, value in enumerate(input):
-            self.nodes[i].input = value
-        self.nodes[self.bias_node_idx].input = 1
+    def propagate_batch(self, inputs: Any, approximate: bool = False) -> Any:
+        """Feed in an (N, input_count) NumPy array of input values and return the (N, output_count) 
+        array of outputs, computed layer by layer.
+        
+        Each row of input must already be in order and normalised, the bias is added automatically.
+        If approximate is True sigmoid activations are computed with a lookup table.
+        Requires NumPy.
+        """
 
-        # Propagate the values
-        for node in self.nodes:
-            node.engage()
+        if self._batch_plan is None or self._batch_plan.approximate != approximate:
+            self._batch_plan = BatchPlan(self, approximate)
+        return self._batch_plan.propagate(inputs)
 
-        # Return the output Node output values
-        return tuple([node.output for node in self.nodes[len(self.nodes) - self.output_count:]])
+    def invalidate_plans(self) -> None:
+        """Discard the cached evaluation plans, which depend on the Connections' weights and 
+        enabled flags."""
+        self._plan = None
+        self._batch_plan = None
+
+    def invalidate(self, weights_only: bool = False) -> None:
+        """Discard everything cached about this Genome's Nodes and Connections.
+        
+        Must be called after changing a Node or Connection directly (e.g. a Connection's weight), 
+        the methods of this class call it themselves.
+        If weights_only is True then only the weights or enabled flags have changed, so the 
+        DerivedState is kept.
+        """
+
+        self.invalidate_plans()
+        if not weights_only:
+            self.topology_version += 1
+            self._derived = None
     
     def clone(self) -> Genome:
         """Return a copy of this Genome."""
@@ -172,7 +260,7 @@ class Genome:
             clone.nodes.append(node.clone())
 
         # Add copies of Connections so they connect the new Nodes
-        clone_nodes = clone.nodes_dict
+        clone_nodes = {node.number: node for node in clone.nodes}
         for connection in self.connections:
             from_node = clone_nodes[connection.from_node.number]
             to_node = clone_nodes[connection.to_node.number]
@@ -191,6 +279,9 @@ class Genome:
         overwritten.
         """
 
+        if instrumentation.enabled:
+            instrumentation.count('genomes_serialized')
+
         destination = folder / f'{filename}.pickle'
         with destination.open('wb') as dest:
             pickle.dump(self, dest)
@@ -214,7 +305,25 @@ class Genome:
                 raise OSError(f'Unable to open Genome save \'{filename}\' in \'{path}\'.')
             else:
                 raise OSError(f'Unable to open Genome save \'{path}\'.')
+
+    def __getstate__(self) -> dict:
+        """Return the state to pickle, leaving out anything that is cached."""
+
+        state = self.__dict__.copy()
+        state['_plan'] = None
+        state['_batch_plan'] = None
+        state['_derived'] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the pickled state, which may come from before caching was introduced."""
+
+        self.__dict__.update(state)
+        self.topology_version = state.get('topology_version', 0)
+        self._plan = None
+        self._batch_plan = None
+        self._derived = None
             
     def __repr__(self) -> str:
         """Return representation of this Genome."""
-        return f'<Genome: Layers = {self.layers}, Nodes = {len(self.nodes)}, Connections = {len(list(self.connections))}>'
\ No newline at end of file
+        return f'<Genome: Layers = {self.layers}, Nodes = {len(self.nodes)}, Connections = {self.connection_count}>'
\ No newline at end of file
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 class Node:
     """Node in the Neural Network of a Genome."""
 
+    __slots__ = ('number', 'layer', 'activation', 'input', 'output_connections')
+
     def __init__(self, number: int, layer: int, activation: ActivationFunction = linear) -> None:
         self.number: int = number
         self.layer: int = layer
@@ -38,6 +40,15 @@ class Node:
         """Return a copy of this Node."""
         return self.__class__(self.number, self.layer, self.activation)
 
+    def __getstate__(self) -> dict:
+        """Return the state to pickle."""
+        return {attribute: getattr(self, attribute) for attribute in self.__slots__}
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the pickled state, which may come from before Nodes had slots."""
+        for attribute, value in state.items():
+            setattr(self, attribute, value)
+
     def __repr__(self) -> str:
         """Return representation of this Node."""
         return f'<Node: Number = {self.number}, Layer = {self.layer}, Activation = {self.activation.__name__}>'
\ No newline at end of file
@@ -4,16 +4,22 @@ import pickle
 
 from neat.history.innovation import Innovation
 from neat.genome.node import Node
+from neat.instrumentation import instrumentation
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from neat.genome import Genome
 
 class History:
-    """Contains all previous Innovations."""
+    """Contains all previous Innovations.
+    
+    The Innovations are also indexed by (from Node number, to Node number, present innovation 
+    numbers) so that matching a mutation to a previous Innovation takes constant time.
+    """
 
     def __init__(self) -> None:
         self.innovations: list[Innovation] = []
+        self._index: dict[tuple[int, int, frozenset[int]], int] = dict()
 
     @property
     def next_innovation_number(self) -> int:
@@ -28,14 +34,28 @@ class History:
         it will be matched up with a previous Innovation.
         """
 
-        # Check all current Innovations
-        for innovation in self.innovations:
-            if innovation.match(genome, from_node, to_node):
-                return innovation.number
+        if instrumentation.enabled:
+            instrumentation.count('innovation_lookups')
+
+        # Look up the current Innovations
+        present_connections = frozenset(genome.innovation_numbers)
+        if len(present_connections) == genome.connection_count:
+            try:
+                return self._index[(from_node.number, to_node.number, present_connections)]
+            except KeyError:
+                pass
+
+        # Genomes with repeated innovation numbers can match Innovations that the index can't, 
+        # so check all current Innovations
+        else:
+            for innovation in self.innovations:
+                if innovation.match(genome, from_node, to_node):
+                    return innovation.number
             
         # Create a new Innovation
         new_innovation = Innovation(self.next_innovation_number, genome, from_node, to_node)
         self.innovations.append(new_innovation)
+        self._index.setdefault(new_innovation.key, new_innovation.number)
         return new_innovation.number
     
     def save(self, destination: Path) -> None:
@@ -55,4 +75,19 @@ class History:
         """
 
         with source.open('rb') as src:
-            return pickle.load(src)
\ No newline at end of file
+            return pickle.load(src)
+
+    def __getstate__(self) -> dict:
+        """Return the state to pickle, leaving out the index as it can be rebuilt."""
+
+        state = self.__dict__.copy()
+        del state['_index']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the pickled state and rebuild the index."""
+
+        self.__dict__.update(state)
+        self._index = dict()
+        for innovation in self.innovations:
+            self._index.setdefault(innovation.key, innovation.number)
\ No newline at end of file
@@ -19,6 +19,12 @@ class Innovation:
         self.from_node_number: int = from_node.number
         self.to_node_number: int = to_node.number
 
+    @property
+    def key(self) -> tuple[int, int, frozenset[int]]:
+        """Return the (from Node number, to Node number, present innovation numbers) that identify 
+        this Innovation."""
+        return (self.from_node_number, self.to_node_number, frozenset(self.present_connections))
+
     def match(self, genome: 'Genome', from_node: Node, to_node: Node) -> bool:
         """Return True if a Genome that is about to make a new Connection matches 
         this Innovation."""
@@ -26,7 +32,7 @@ class Innovation:
         if not (self.from_node_number == from_node.number and self.to_node_number == to_node.number):
             return False
         
-        if len(self.present_connections) != len(list(genome.connections)):
+        if len(self.present_connections) != genome.connection_count:
             return False
         
         for connection in genome.connections:
@@ -0,0 +1,72 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterator, Any
+import time
+
+
+class Instrumentation:
+    """Times the phases of each generation and counts the expensive operations made during them.
+
+    Does nothing while disabled, so phases and counts can be left in hot code. The ProgressHandler
+    enables it (with progress_settings['timings']) and reports and resets it after each generation.
+    """
+
+    # The phases of a generation and operations counted, in the order they are reported
+    PHASES: list[str] = ['evaluate', 'speciate', 'rank_species', 'check_improving', 'fitness_share', 'save_playback',
+                         'remove_stale_species', 'remove_bad_species', 'mass_extinction_event', 'next_generation', 'save']
+    COUNTERS: list[str] = ['innovation_lookups', 'distance_computations', 'genomes_serialized']
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.timings: dict[str, float] = dict()
+        self.counters: dict[str, int] = dict()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the time spent in the with block to the given phase's timing."""
+
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, .0) + time.perf_counter() - start
+
+    def timed(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Decorate a method so that the time spent in it is added to the timing of the phase with
+        the method's name."""
+
+        name = method.__name__
+
+        @wraps(method)
+        def timed_method(*args: Any, **kwargs: Any) -> Any:
+            if not self.enabled:
+                return method(*args, **kwargs)
+            with self.phase(name):
+                return method(*args, **kwargs)
+
+        return timed_method
+
+    def count(self, name: str, number: int = 1) -> None:
+        """Add number to the given counter.
+
+        Check enabled before calling this in hot code, to avoid the call when disabled.
+        """
+
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + number
+
+    def collect(self) -> tuple[dict[str, float], dict[str, int]]:
+        """Return the timings and counters so far and reset them for the next generation."""
+
+        timings, counters = self.timings, self.counters
+        self.timings, self.counters = dict(), dict()
+        return timings, counters
+
+
+# The Instrumentation used throughout neat
+instrumentation = Instrumentation()
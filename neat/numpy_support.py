@@ -0,0 +1,14 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def require_numpy(feature: str):
+    """Return the numpy module, or raise an Exception naming the feature that needs it if 
+    NumPy isn't installed."""
+
+    if numpy is None:
+        raise Exception(f'NumPy is required to use {feature}, please install it with the numpy extra (e.g. ' + \
+                        '`pip install neat[numpy]` or `poetry install --extras numpy`).')
+    return numpy
@@ -2,7 +2,7 @@ from pathlib import Path
 from typing import Generator
 
 from neat.base_player import BasePlayer
-from neat.genome import Genome
+from neat.genome import Genome, CompactGenome
 
 
 class PlaybackPlayers:
@@ -47,7 +47,7 @@ class PlaybackPlayers:
                 genomes = [Genome.load(file_path) for file_path in genomes_source.iterdir()]
                 for genome in genomes:
                     player = self._PlayerClass(self._player_args)
-                    player.genome = genome
+                    player.genome = Genome.from_compact(genome) if isinstance(genome, CompactGenome) else genome
                     specie.append(player)
                 self.species.append(specie)
             except OSError:
@@ -1 +1,2 @@
-from .population import Population
\ No newline at end of file
+from .population import Population
+from .population_network import PopulationNetwork
\ No newline at end of file
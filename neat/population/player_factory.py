@@ -3,8 +3,9 @@ import random
 from neat.base_player import BasePlayer
 from neat.genome import Genome
 from neat.history import History
-from neat.genome.activation_functions import activation_by_name
-from neat.evolution import fitness_weighted_selection, crossover, mutate
+from neat.genome.activation_functions import activation_by_name, activation_id, activation_name
+from neat.evolution import fitness_weighted_selection, crossover, crossover_compact, mutate, mutate_structure, \
+    mutate_population_weights
 
 
 class PlayerFactory:
@@ -35,6 +36,8 @@ class PlayerFactory:
             self._weight_replacement_rate = reproduction_settings['weight_replacement_rate']
             self._connection_rate = reproduction_settings['connection_rate']
             self._node_rate = reproduction_settings['node_rate']
+            self._compact_crossover = reproduction_settings['compact_crossover']
+            self._vectorized_mutation = reproduction_settings['vectorized_mutation']
         except KeyError as e:
             raise Exception(f'Setting \'{e.args[0]}\' not found in reproduction_settings.')
         
@@ -45,7 +48,7 @@ class PlayerFactory:
         genome_settings = {
             'input_count': self._genome_input_count,
             'output_count': self._genome_output_count,
-            'hidden_activation': self._hidden_activation.__name__,
+            'hidden_activation': activation_name(activation_id(self._hidden_activation)),
         }
         return genome_settings
     
@@ -60,6 +63,8 @@ class PlayerFactory:
             'weight_replacement_rate': self._weight_replacement_rate,
             'connection_rate': self._connection_rate,
             'node_rate': self._node_rate,
+            'compact_crossover': self._compact_crossover,
+            'vectorized_mutation': self._vectorized_mutation,
         }
         return reproduction_settings
         
@@ -92,6 +97,7 @@ class PlayerFactory:
         the given parents."""
 
         offspring = []
+        weight_mutations = []
 
         # Generate the offspring
         while len(offspring) < total:
@@ -102,22 +108,41 @@ class PlayerFactory:
                 if parent1.fitness < parent2.fitness:
                     parent1, parent2 = parent2, parent1
                 child = self.empty_player()
-                child.genome = crossover(parent1.genome, parent2.genome, self._disabled_rate)
+                if self._compact_crossover:
+                    child.genome = crossover_compact(parent1.genome, parent2.genome, self._disabled_rate)
+                else:
+                    child.genome = crossover(parent1.genome, parent2.genome, self._disabled_rate)
             else:
                 [parent] = fitness_weighted_selection(parents, 1)
                 child = self.clone(parent)
 
-            # Mutate the child
-            mutate(
-                genome = child.genome,
-                weights_rate = self._weights_rate,
-                weight_replacement_rate = self._weight_replacement_rate,
-                connection_rate = self._connection_rate,
-                node_rate = self._node_rate,
-                node_activation = self._hidden_activation,
-                history = history
-            )
+            # Mutate the child, or choose whether to mutate its weights along with the rest
+            if self._vectorized_mutation:
+                if random.uniform(0, 1) < self._weights_rate:
+                    weight_mutations.append(child.genome)
+            else:
+                child.genome = mutate(
+                    genome = child.genome,
+                    weights_rate = self._weights_rate,
+                    weight_replacement_rate = self._weight_replacement_rate,
+                    connection_rate = self._connection_rate,
+                    node_rate = self._node_rate,
+                    node_activation = self._hidden_activation,
+                    history = history
+                )
 
             offspring.append(child)
 
+        # Mutate all the chosen weights at once, then add Nodes and Connections as mutate would
+        if self._vectorized_mutation:
+            mutate_population_weights(weight_mutations, self._weight_replacement_rate)
+            for child in offspring:
+                child.genome = mutate_structure(
+                    genome = child.genome,
+                    connection_rate = self._connection_rate,
+                    node_rate = self._node_rate,
+                    node_activation = self._hidden_activation,
+                    history = history
+                )
+
         return offspring
\ No newline at end of file
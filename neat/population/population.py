@@ -4,12 +4,14 @@ import pickle
 import shutil
 
 from neat.base_player import BasePlayer
-from neat.genome import Genome
+from neat.genome import Genome, CompactGenome
 from neat.population.species import Species
+from neat.population.speciation import bulk_speciate
 from neat.history import History
 from neat.settings import settings_handler
 from neat.population.player_factory import PlayerFactory
 from neat.population.progress_handler import ProgressHandler
+from neat.instrumentation import instrumentation
 
 
 class Population:
@@ -21,6 +23,9 @@ class Population:
         self.players: list[BasePlayer]
         self.species: list[Species]
 
+        # The Species each Player was bred from (None if it wasn't)
+        self.parent_species: list[Species | None]
+
         self.staleness: int
         self.best_fitness: int
 
@@ -34,8 +39,10 @@ class Population:
         self._cull_percentage: float = population_settings['cull_percentage']
         self._max_staleness: int = population_settings['max_staleness']
         self._save_folder: str = population_settings['save_folder']
+        self._compact_genomes: bool = population_settings['compact_genomes']
 
         self._species_settings: dict = settings['species_settings']
+        self._bulk_speciation: bool = self._species_settings['bulk_speciation']
         reproduction_settings = settings['reproduction_settings']
 
         progress_settings = settings['progress_settings']
@@ -73,33 +80,39 @@ class Population:
         population.generation = 1
         population.history = History()
         population.players = population.player_factory.new_players(population._size, population.history)
+        population.parent_species = [None] * len(population.players)
         population.species = []
         population.staleness = 0
         population.best_fitness = 0
 
         return population
 
+    @instrumentation.timed
     def speciate(self) -> None:
         """Split the players into Species.
         
         They will be split based on how similar they are to leaders of the previous generation.
         """
 
-        for player in self.players:
-            species_found = False
-            for specie in self.species:
-                if specie.is_same_species(player):
-                    specie.players.append(player)
-                    species_found = True
-                    break
-
-            if not species_found:
-                new_species = Species(player, self._species_settings)
-                self.species.append(new_species)
+        if self._bulk_speciation:
+            bulk_speciate(self.players, self.species, self._species_settings, self._compact_genomes)
+        else:
+            for player in self.players:
+                species_found = False
+                for specie in self.species:
+                    if specie.is_same_species(player):
+                        specie.players.append(player)
+                        species_found = True
+                        break
+
+                if not species_found:
+                    new_species = Species(player, self._species_settings, self._compact_genomes)
+                    self.species.append(new_species)
 
         # Remove any that were in the last generation but have no players this generation
         self.species = [specie for specie in self.species if len(specie.players) > 0]
 
+    @instrumentation.timed
     def rank_species(self) -> None:
         """Sort the Species in the Population by their best fitness in descending order."""
 
@@ -108,6 +121,7 @@ class Population:
 
         self.species.sort(key = lambda specie: specie.champ.fitness, reverse=True)
 
+    @instrumentation.timed
     def check_improving(self) -> None:
         """Check whether the Population is improving on both a Specie and overall level."""
 
@@ -120,12 +134,14 @@ class Population:
         else:
             self.staleness += 1
 
+    @instrumentation.timed
     def fitness_share(self) -> None:
         """Compute the adjusted fitness for each Player in each Species."""
 
         for specie in self.species:
             specie.fitness_share()
 
+    @instrumentation.timed
     def remove_stale_species(self) -> None:
         """Remove Species which haven't improved for too many generations."""
         self.species = [specie for specie in self.species if not specie.gone_stale]
@@ -133,6 +149,7 @@ class Population:
             raise Exception('Training has stagnated too badly, please try again with changed set-up, or ' + \
                             'increase the \'max_staleness\' in species_settings')
 
+    @instrumentation.timed
     def remove_bad_species(self) -> None:
         """Remove Species which are deemed too bad to reproduce.
         
@@ -144,16 +161,19 @@ class Population:
         self.species =  [specie for specie in self.species if (specie.total_adjusted_fitness /
                          total_population_adjusted_fitness) * self._size >= 1]
         
+    @instrumentation.timed
     def mass_extinction_event(self) -> None:
         """Remove all but the top two perfoming Species."""
 
         self.species = self.species[:2]
         self.staleness = 0
 
+    @instrumentation.timed
     def next_generation(self) -> None:
         """Populate self.players with the next generation."""
 
         self.players = []
+        self.parent_species = []
         self.generation += 1
 
         total_population_adjusted_fitness = self.total_adjusted_fitness
@@ -179,6 +199,7 @@ class Population:
 
             # Add offspring to self.players
             self.players.extend(offspring)
+            self.parent_species.extend([specie] * (len(self.players) - len(self.parent_species)))
 
             # Clear the Species
             specie.players = []
@@ -205,6 +226,9 @@ class Population:
 
         self.save()
 
+        self.progress_handler.report_timings(self.generation - 1)
+
+    @instrumentation.timed
     def save_playback(self) -> None:
         """Save the current top self._playback_number Genomes from each Species to 
         self._playback_folder/{self.generation}.
@@ -232,8 +256,10 @@ class Population:
             destination.mkdir()
             num_to_save = min(self._playback_number, specie.size) if self._playback_number != -1 else specie.size
             for j, player in enumerate(specie.players[:num_to_save]):
-                player.genome.save(destination, str(j))
+                genome = player.genome.compact() if self._compact_genomes else player.genome
+                genome.save(destination, str(j))
 
+    @instrumentation.timed
     def save(self) -> None:
         """Save the Population and its attributes to self._save_folder.
         
@@ -252,6 +278,7 @@ class Population:
             'cull_percentage': self._cull_percentage,
             'max_staleness': self._max_staleness,
             'save_folder': self._save_folder,
+            'compact_genomes': self._compact_genomes,
         }
         playback_settings = {
             'save_folder': self._playback_folder,
@@ -290,7 +317,8 @@ class Population:
             shutil.rmtree(genomes_destination)
         genomes_destination.mkdir()
         for i, player in enumerate(self.players):
-            player.genome.save(genomes_destination, str(i))
+            genome = player.genome.compact() if self._compact_genomes else player.genome
+            genome.save(genomes_destination, str(i))
 
         # Species
         species_destination = save_folder / 'species'
@@ -359,8 +387,9 @@ class Population:
         population.players = []
         for genome in loaded_genomes:
             player = population.player_factory.empty_player()
-            player.genome = genome
+            player.genome = Genome.from_compact(genome) if isinstance(genome, CompactGenome) else genome
             population.players.append(player)
+        population.parent_species = [None] * len(population.players)
 
         population.species = loaded_species
 
@@ -0,0 +1,140 @@
+from __future__ import annotations
+from typing import Any
+
+from neat.numpy_support import require_numpy
+from neat.base_player import BasePlayer
+from neat.genome import Genome
+from neat.genome.activation_functions import ActivationFunction, VectorActivationFunction, vectorize
+
+
+class DepthStep:
+    """The Nodes at one layer depth across all packed Genomes, and the enabled Connections
+    leaving them.
+
+    All positions are flat indices into the (Genomes x widest Genome) matrix of Node values.
+    """
+
+    def __init__(
+        self,
+        groups: list[tuple[VectorActivationFunction, Any]],
+        sources: Any,
+        targets: Any,
+        weights: Any,
+    ) -> None:
+        self.groups: list[tuple[VectorActivationFunction, Any]] = groups
+        self.sources = sources
+        self.targets = targets
+        self.weights = weights
+
+
+class PopulationNetwork:
+    """The Genomes of many Players packed into one padded representation, so that all of their
+    networks can be evaluated in lockstep with a single call.
+
+    Row i of every input and output matrix belongs to the i-th Genome. Genomes may have different
+    topologies, numbers of layers and activation functions, but must all have the same number of
+    inputs and outputs.
+    The network is a snapshot: it must be rebuilt if any of the Genomes change.
+    If approximate is True sigmoid activations are computed with a lookup table.
+    Requires NumPy.
+    """
+
+    def __init__(self, genomes: list[Genome], approximate: bool = False) -> None:
+        np = require_numpy('PopulationNetwork')
+
+        self.approximate: bool = approximate
+        if not genomes:
+            raise ValueError('A PopulationNetwork must contain at least one Genome.')
+        self.input_count: int = genomes[0].input_count
+        self.output_count: int = genomes[0].output_count
+        for genome in genomes:
+            if genome.input_count != self.input_count or genome.output_count != self.output_count:
+                raise ValueError('All Genomes in a PopulationNetwork must have the same number of inputs and outputs.')
+
+        self.genome_count: int = len(genomes)
+        self.width: int = max(len(genome.nodes) for genome in genomes)
+        depth = max(genome.layers for genome in genomes)
+
+        # Sort every Node and enabled Connection into the step of its (from) layer
+        nodes_at = [[] for _ in range(depth)]
+        connections_at = [[] for _ in range(depth)]
+        for row, genome in enumerate(genomes):
+            offset = row * self.width
+            positions = {node.number: offset + i for i, node in enumerate(genome.nodes)}
+            for i, node in enumerate(genome.nodes):
+                enabled = [connection for connection in node.output_connections if connection.enabled]
+                if not enabled:
+                    continue
+                nodes_at[node.layer].append((offset + i, node.activation))
+                for connection in enabled:
+                    connections_at[node.layer].append(
+                        (offset + i, positions[connection.to_node.number], connection.weight)
+                    )
+
+        self.steps: list[DepthStep] = []
+        for nodes, connections in zip(nodes_at, connections_at):
+            if not nodes:
+                continue
+            sources, targets, weights = zip(*connections)
+            self.steps.append(DepthStep(
+                groups = self._group(nodes),
+                sources = np.array(sources),
+                targets = np.array(targets),
+                weights = np.array(weights),
+            ))
+
+        # The output Nodes are always the last in each Genome
+        outputs = []
+        for row, genome in enumerate(genomes):
+            offset = row * self.width + len(genome.nodes) - self.output_count
+            outputs.extend((offset + k, node.activation) for k, node in enumerate(genome.nodes[-self.output_count:]))
+        self.outputs = np.array([position for position, _ in outputs])
+        self.output_groups = self._group(list(enumerate(activation for _, activation in outputs)))
+
+    @classmethod
+    def from_players(cls, players: list[BasePlayer], approximate: bool = False) -> PopulationNetwork:
+        """Return the PopulationNetwork of the given Players' Genomes, in the same order."""
+        return cls([player.genome for player in players], approximate)
+
+    def _group(self, nodes: list[tuple[int, ActivationFunction]]) -> list[tuple[VectorActivationFunction, Any]]:
+        """Return the given (position, activation function) pairs as (vectorized function, positions)
+        pairs with one entry per distinct activation function."""
+
+        np = require_numpy('PopulationNetwork')
+
+        positions = {}
+        for position, activation in nodes:
+            positions.setdefault(activation, []).append(position)
+
+        return [(vectorize(activation, self.approximate), np.array(indices)) for activation, indices in positions.items()]
+
+    def propagate(self, inputs: Any) -> Any:
+        """Feed in a (Genomes, input_count) array of input values, one row per Genome, and return
+        the (Genomes, output_count) array of outputs.
+
+        Each row of input must already be in order and normalised, the bias is added automatically.
+        """
+
+        np = require_numpy('PopulationNetwork')
+
+        inputs = np.asarray(inputs, dtype=float)
+        if inputs.shape != (self.genome_count, self.input_count):
+            raise ValueError(f'Input must have shape {(self.genome_count, self.input_count)}, not {inputs.shape}.')
+
+        # Node input values, with layer zero set
+        values = np.zeros((self.genome_count, self.width))
+        values[:, :self.input_count] = inputs
+        values[:, self.input_count] = 1
+        values = values.reshape(-1)
+
+        # Propagate the values one depth at a time
+        outputs = np.zeros_like(values)
+        for step in self.steps:
+            for activation, positions in step.groups:
+                outputs[positions] = activation(values[positions])
+            values += np.bincount(step.targets, weights=outputs[step.sources] * step.weights, minlength=values.size)
+
+        result = np.empty(self.outputs.size)
+        for activation, positions in self.output_groups:
+            result[positions] = activation(values[self.outputs[positions]])
+        return result.reshape(self.genome_count, self.output_count)
@@ -1,9 +1,11 @@
 from collections import OrderedDict
 from pathlib import Path
 from csv import writer, reader, DictWriter
+import json
 
 from neat.base_player import BasePlayer
 from neat.population.species import Species
+from neat.instrumentation import Instrumentation, instrumentation
 
 
 class ProgressHandler:
@@ -27,10 +29,17 @@ class ProgressHandler:
 
         self.include_species: bool = settings['include_species']
 
+        # Time each generation's phases if needed
+        self.timings: bool = settings['timings']
+        self.timings_filename: str | None = settings['timings_filename']
+        instrumentation.enabled = self.timings
+
         # Initiate the record and column headers if needed.
         self.fieldnames: list
         if self.record_progress:    
             self.create_record(generation)
+        if self.timings and self.timings_filename is not None:
+            self.create_timings_record(generation)
 
     @property
     def settings(self) -> dict:
@@ -43,6 +52,8 @@ class ProgressHandler:
             'bests': [attribute for attribute, measures in self.observables.items() if 'best' in measures],
             'averages': [attribute for attribute, measures in self.observables.items() if 'average' in measures],
             'include_species': self.include_species,
+            'timings': self.timings,
+            'timings_filename': self.timings_filename,
         }
         return settings
     
@@ -141,4 +152,61 @@ class ProgressHandler:
         if self.print_progress:
             self.print_report(generation, report, no_of_species)
         if self.record_progress:
-            self.record_report(generation, report, no_of_species)
\ No newline at end of file
+            self.record_report(generation, report, no_of_species)
+
+    @property
+    def timings_fieldnames(self) -> list[str]:
+        """The column headers (or keys) of the timings record."""
+        return ['generation'] + [f'{phase}_seconds' for phase in Instrumentation.PHASES] + Instrumentation.COUNTERS
+
+    def create_timings_record(self, generation: int) -> None:
+        """Create the timings record if it doesn't exist, if it does exist and generation=1 then an 
+        Exception will be thrown.
+
+        The record is a CSV file with column headers or a JSONL file, depending on its suffix.
+        """
+
+        record = Path(self.timings_filename)
+
+        if record.suffix not in ['.csv', '.jsonl']:
+            raise Exception('Setting \'timings_filename\' in progress_settings must end in .csv or .jsonl.')
+
+        if generation == 1 and record.exists():
+            raise Exception(f'A timings record already exists in {record}, please move it or change ' + \
+                            '\'timings_filename\' in progress_settings.')
+
+        if not record.exists() and record.suffix == '.csv':
+            with record.open('w+') as csv_file:
+                csv_writer = writer(csv_file, delimiter=',')
+                csv_writer.writerow(self.timings_fieldnames)
+
+    def report_timings(self, generation: int) -> None:
+        """Print out and record the timings of the given (just finished) generation's phases and 
+        the operations counted during it as required."""
+
+        if not self.timings:
+            return
+
+        timings, counters = instrumentation.collect()
+        if self.print_progress:
+            INDENT = " " * 4
+            phase_timings = [f'{phase} = {timings[phase]:.4f}s' for phase in Instrumentation.PHASES if phase in timings]
+            counts = [f'{counter} = {counters.get(counter, 0)}' for counter in Instrumentation.COUNTERS]
+            print(f'{INDENT}timings: {", ".join(phase_timings)}')
+            print(f'{INDENT}counts: {", ".join(counts)}')
+
+        if self.timings_filename is None:
+            return
+
+        row = {'generation': generation}
+        for phase in Instrumentation.PHASES:
+            row[f'{phase}_seconds'] = timings.get(phase, .0)
+        for counter in Instrumentation.COUNTERS:
+            row[counter] = counters.get(counter, 0)
+
+        record = Path(self.timings_filename)
+        with record.open('a') as record_file:
+            if record.suffix == '.csv':
+                DictWriter(record_file, self.timings_fieldnames).writerow(row)
+            else:
+                record_file.write(json.dumps(row) + '\n')
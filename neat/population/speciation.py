@@ -0,0 +1,141 @@
+from typing import Any
+
+from neat.numpy_support import require_numpy
+from neat.base_player import BasePlayer
+from neat.genome import Genome, CompactGenome
+from neat.population.species import Species
+from neat.instrumentation import instrumentation
+
+
+# Matrices are built for this many Players at a time to bound memory use
+CHUNK_SIZE = 1024
+
+
+def gene_table(genomes: list[Genome | CompactGenome], columns: Any) -> tuple[Any, Any]:
+    """Return the (Genomes, innovation numbers) presence and weight matrices of the given
+    Genomes, where the innovation numbers are the sorted array columns."""
+
+    np = require_numpy('bulk speciation')
+
+    rows, innovation_numbers, weights = [], [], []
+    for row, genome in enumerate(genomes):
+        for connection in genome.sorted_connections:
+            rows.append(row)
+            innovation_numbers.append(connection.innovation_number)
+            weights.append(connection.weight)
+    positions = np.searchsorted(columns, innovation_numbers)
+
+    presence = np.zeros((len(genomes), columns.size))
+    presence[rows, positions] = 1
+    weight_table = np.zeros((len(genomes), columns.size))
+    weight_table[rows, positions] = weights
+
+    return presence, weight_table
+
+
+def compatibility_matrix(genomes: list[Genome | CompactGenome], species: list[Species], settings: dict) -> Any:
+    """Return the (Genomes, Species) matrix of compatibility distances between the given Genomes
+    and the reps of the given Species, computed with the same formula as Species.is_same_species.
+
+    None of the Genomes or reps may have repeated innovation numbers.
+    """
+
+    np = require_numpy('bulk speciation')
+
+    c1 = settings['excess_coefficient']
+    c2 = settings['disjoint_coefficient']
+    c3 = settings['weight_difference_coefficient']
+
+    reps = [specie.rep for specie in species]
+    columns = np.array(sorted(set().union(*[genome.innovation_numbers for genome in genomes + reps])))
+
+    rep_presence, rep_weights = gene_table(reps, columns)
+    rep_max_innovation_numbers = np.array([max(rep.innovation_numbers, default=-1) for rep in reps])
+    genome_normalizers = np.maximum(rep_presence.sum(axis=1) - 20, 1)
+
+    # Which innovation numbers are beyond each rep's, and which each rep doesn't have
+    beyond = (columns[np.newaxis, :] > rep_max_innovation_numbers[:, np.newaxis]).astype(float)
+    missing = 1 - rep_presence
+
+    distances = np.empty((len(genomes), len(reps)))
+    for start in range(0, len(genomes), CHUNK_SIZE):
+        presence, weights = gene_table(genomes[start:start + CHUNK_SIZE], columns)
+
+        excess = presence @ beyond.T
+        disjoint = presence @ missing.T - excess
+        matching = presence @ rep_presence.T
+
+        total_differences = np.empty_like(matching)
+        for s in range(len(reps)):
+            total_differences[:, s] = (np.abs(rep_weights[s] - weights) * presence * rep_presence[s]).sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            average_weight_differences = np.where(matching > 0, total_differences / matching, 100)
+
+        distances[start:start + CHUNK_SIZE] = (c1 * excess + c2 * disjoint) / genome_normalizers + \
+                                              c3 * average_weight_differences
+
+    return distances
+
+
+def bulk_speciate(players: list[BasePlayer], species: list[Species], settings: dict, compact: bool = False) -> None:
+    """Split the given Players into the given Species, adding new Species to the list as needed.
+
+    Gives exactly the same result as checking each Player against each Species in turn with
+    Species.is_same_species: each Player joins the first Species it matches, and if there are none
+    it starts a new Species that later Players are also checked against.
+    The distances to all the existing Species' reps are computed at once as a matrix, with
+    distances too close to the threshold for rounding to be ruled out rechecked exactly.
+    The distance_computations counter counts the distances checking in turn would have computed, 
+    so that it can be compared between the two.
+    """
+
+    np = require_numpy('bulk speciation')
+
+    # Repeated innovation numbers can't be represented in the matrices
+    genomes = [player.genome for player in players]
+    if any(len(genome.innovation_numbers) != genome.connection_count for genome in genomes) or \
+       any(len(specie.rep.innovation_numbers) != specie.rep.connection_count for specie in species):
+        candidates = []
+    else:
+        candidates = species.copy()
+
+    if candidates:
+        threshold = settings['compatibility_threshold']
+        tolerance = 1e-9 * (1 + abs(threshold))
+        distances = compatibility_matrix(genomes, candidates, settings)
+        matches = distances < threshold - tolerance
+        uncertain = np.abs(distances - threshold) <= tolerance
+        possible = matches | uncertain
+
+    new_species = []
+    for p, player in enumerate(players):
+
+        # Check the existing Species (in order) through the matrix
+        species_found = False
+        if candidates:
+            checked, rechecked = len(candidates), 0
+            for s in np.flatnonzero(possible[p]):
+                if not matches[p, s]:
+                    rechecked += 1
+                if matches[p, s] or candidates[s].is_same_species(player):
+                    candidates[s].players.append(player)
+                    species_found = True
+                    checked = int(s) + 1
+                    break
+
+            # Rechecks are already counted by is_same_species
+            if instrumentation.enabled:
+                instrumentation.count('distance_computations', checked - rechecked)
+
+        # Then the Species created so far during this call, or all of them without the matrix
+        if not species_found:
+            for specie in new_species if candidates else species:
+                if specie.is_same_species(player):
+                    specie.players.append(player)
+                    species_found = True
+                    break
+
+        if not species_found:
+            specie = Species(player, settings, compact)
+            new_species.append(specie)
+            species.append(specie)
@@ -3,7 +3,8 @@ from pathlib import Path
 import pickle
 
 from neat.base_player import BasePlayer
-from neat.genome import Genome
+from neat.genome import Genome, CompactGenome
+from neat.instrumentation import instrumentation
 
 
 class Species:
@@ -13,13 +14,17 @@ class Species:
     best fitness in the previous generations.
     The staleness of a species counts how many generations have gone without any improvement in the 
     best fitness.
+    If compact is True the rep will be stored as a CompactGenome.
+    Whenever the rep is set its innovation numbers and weights are stored in ascending order of 
+    innovation number, so that the compatibility distance to a Genome is a single merge.
     """
 
-    def __init__(self, player: BasePlayer, settings: dict) -> None:
+    def __init__(self, player: BasePlayer, settings: dict, compact: bool = False) -> None:
 
         # When creating a new Species the given Player will always be the only option
         # for a rep 
-        self.rep: Genome = player.genome.clone()
+        self._compact: bool = compact
+        self.rep: Genome | CompactGenome = self.copy_genome(player.genome)
         self.players: list[BasePlayer] = [player]
 
         self.staleness: int = 0
@@ -58,34 +63,85 @@ class Species:
         """Return True if no improvements have been made for too many generations."""
         return self.staleness >= self._max_staleness
 
-    def excess_and_disjoint(self, genome: Genome) -> tuple[int, int]:
+    @property
+    def rep(self) -> Genome | CompactGenome:
+        return self._rep
+
+    @rep.setter
+    def rep(self, genome: Genome | CompactGenome) -> None:
+        """Set self._rep and store its Connections' innovation numbers, weights and positions in 
+        ascending order of innovation number."""
+
+        self._rep = genome
+
+        rep_connections = sorted(
+            enumerate(genome.connections), 
+            key=lambda position_connection: position_connection[1].innovation_number,
+        )
+        self._rep_positions: list[int] = [position for position, _ in rep_connections]
+        self._rep_innovations: list[int] = [connection.innovation_number for _, connection in rep_connections]
+        self._rep_weights: list[float] = [connection.weight for _, connection in rep_connections]
+    
+    def copy_genome(self, genome: Genome) -> Genome | CompactGenome:
+        """Return a copy of the given Genome to use as a rep."""
+        return genome.compact() if self._compact else genome.clone()
+
+    def compare(self, genome: Genome | CompactGenome) -> tuple[int, int, float]:
         """Return the number of excess and disjoint Connections the given Genome has with this 
-        Species' rep."""
+        Species' rep, and the average weight difference between their matching Connections.
+
+        Both Genomes' Connections are walked once in ascending order of innovation number. The 
+        weight differences are still summed in the order of the rep's Connections.
+        """
+
+        rep_innovations, rep_weights = self._rep_innovations, self._rep_weights
+        rep_count = len(rep_innovations)
+        rep_max_innovation_number = rep_innovations[-1] if rep_count else -1
+
+        excess, disjoint, matching = 0, 0, 0
+        differences = [.0] * rep_count
+        i, last_matched = 0, None
+        for connection in genome.sorted_connections:
+            innovation_number = connection.innovation_number
+
+            # Skip the rep's Connections that the Genome doesn't have
+            while i < rep_count and rep_innovations[i] < innovation_number:
+                i += 1
+
+            # Match every rep Connection with this innovation number to the Genome's first one
+            if i < rep_count and rep_innovations[i] == innovation_number:
+                while i < rep_count and rep_innovations[i] == innovation_number:
+                    differences[self._rep_positions[i]] = abs(rep_weights[i] - connection.weight)
+                    matching += 1
+                    i += 1
+                last_matched = innovation_number
+
+            elif innovation_number == last_matched:
+                continue
+            elif innovation_number > rep_max_innovation_number:
+                excess += 1
+            else:
+                disjoint += 1
 
-        excess, disjoint = 0, 0
-        rep_max_innovation_number = max(self.rep.innovation_numbers)
-        for connection in genome.connections:
-            if connection.innovation_number not in self.rep.innovation_numbers:
-                if connection.innovation_number > rep_max_innovation_number:
-                    excess += 1
-                else:
-                    disjoint += 1
+        total_difference = .0
+        for difference in differences:
+            total_difference += difference
 
+        return excess, disjoint, total_difference/matching if matching else 100
+
+    def excess_and_disjoint(self, genome: Genome | CompactGenome) -> tuple[int, int]:
+        """Return the number of excess and disjoint Connections the given Genome has with this 
+        Species' rep."""
+
+        excess, disjoint, _ = self.compare(genome)
         return excess, disjoint
 
-    def average_weight_difference(self, genome: Genome) -> float:
+    def average_weight_difference(self, genome: Genome | CompactGenome) -> float:
         """Return the average weight difference between this Species' rep and the given 
         Genome."""
 
-        matching, total_difference = 0, .0
-        for connection1 in self.rep.connections:
-            for connection2 in genome.connections:
-                if connection1.innovation_number == connection2.innovation_number:
-                    matching += 1
-                    total_difference += abs(connection1.weight - connection2.weight)
-                    break
-
-        return total_difference/matching if matching else 100
+        _, _, average_weight_difference = self.compare(genome)
+        return average_weight_difference
 
     def is_same_species(self, player: BasePlayer) -> bool:
         """Return True if the given player's Genome is considered to be a part of this Species.
@@ -94,9 +150,11 @@ class Species:
         and comparing it to the chosen compatibility threshold.
         """
 
-        excess, disjoint = self.excess_and_disjoint(player.genome)
-        average_weight_difference = self.average_weight_difference(player.genome)
-        genome_normalizer = max(len(list(self.rep.connections)) - 20, 1)
+        if instrumentation.enabled:
+            instrumentation.count('distance_computations')
+
+        excess, disjoint, average_weight_difference = self.compare(player.genome)
+        genome_normalizer = max(len(self._rep_innovations) - 20, 1)
 
         compatibility = (self._c1 * excess + self._c2 * disjoint) / genome_normalizer + \
                         self._c3 * average_weight_difference
@@ -113,7 +171,7 @@ class Species:
         if self.champ.fitness > self.best_fitness:
             self.staleness = 0
             self.best_fitness = self.champ.fitness
-            self.rep = self.champ.genome.clone()
+            self.rep = self.copy_genome(self.champ.genome)
         else:
             self.staleness += 1
 
@@ -152,4 +210,22 @@ class Species:
         """
 
         with source.open('rb') as src:
-            return pickle.load(src)
\ No newline at end of file
+            return pickle.load(src)
+
+    def __getstate__(self) -> dict:
+        """Return the state to pickle, leaving out the rep's sorted Connections."""
+
+        state = self.__dict__.copy()
+        for attribute in ['_rep_positions', '_rep_innovations', '_rep_weights']:
+            del state[attribute]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the pickled state, which may come from before compact or sorted reps were 
+        introduced."""
+
+        state = state.copy()
+        rep = state.pop('_rep') if '_rep' in state else state.pop('rep')
+        self.__dict__.update(state)
+        self._compact = state.get('_compact', False)
+        self.rep = rep
\ No newline at end of file
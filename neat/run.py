@@ -1,14 +1,45 @@
 from typing import Callable
 from pathlib import Path
-from multiprocessing import Pool, cpu_count
+import signal
 
 from neat.base_player import BasePlayer
 from neat.population import Population
+from neat.settings import evaluation_settings_handler
+from neat.evaluation import GenomeEvaluator, init_worker, evaluate_genome, evaluate_genomes, evaluate_in_arena, \
+    merge_results, assign_fallback, split_batches, map_batches
+from neat.executors import ProcessExecutor, ThreadExecutor, executors, fastest_executor
+from neat.distributed import DistributedExecutor
+from neat.scheduler import Scheduler
+from neat.fitness_cache import FitnessCache, genome_hash
+from neat.instrumentation import instrumentation
+
+
+def create_population(PlayerClass: type, settings: dict) -> Population:
+    """Return a new Population of Players of class PlayerClass, or one loaded from 
+    population_settings['save_folder'], depending on settings['creation_type']."""
+
+    try:
+        creation_type = settings['creation_type']
+    except KeyError:
+        creation_type = 'new'
+
+    match(creation_type):
+        case 'new':
+            population = Population.new(PlayerClass, settings)
+        case 'load':
+            try:
+                load_folder = Path(settings['population_settings']['save_folder'])
+                population = Population.load(PlayerClass, settings, load_folder)
+            except KeyError:
+                raise Exception('Setting population_settings[\'save_folder\'] must be present (and contain a viable save) ' + \
+                    'to load a Population.')
+
+    return population
 
 
 def run(
     PlayerClass: type,
-    simulate: Callable[[BasePlayer], BasePlayer],
+    simulate: Callable[[BasePlayer], BasePlayer] | Callable[[list[BasePlayer]], list[BasePlayer]],
     settings: dict,
 ) -> None:
     """Apply the NEAT algorithm to a Population of Players.
@@ -22,24 +53,25 @@ def run(
      - genome_settings: describing the Player's Genome architecture.
      - population_settings: describing the Population characteristics.
      - playback_settings: determining where and what to save each generation.
+    It may also contain evaluation_settings, determining the Executor (serial, a pool of threads or 
+    a pool of processes) the Players are simulated with. The same Executor is used for every 
+    generation, and is shut down once total_generations is reached or an exception is raised.
+    With evaluation_settings['transport'] = 'genomes' only CompactGenomes are sent to the workers, 
+    and only the Players' fitnesses and progress_settings attributes are sent back.
+    With evaluation_settings['transport'] = 'shared_memory' the Genomes are instead packed into a 
+    GenomeArena in shared memory that the workers read from and write the results back into.
+    With either, evaluation_settings['compact_players'] = True gives the Players built by the workers 
+    the CompactGenomes as they are rather than full Genomes.
+    With evaluation_settings['scheduling'] = 'dynamic' Players are handed to workers as they become 
+    free, longest expected runtime first, and with evaluation_settings['budget'] set any simulation 
+    that runs for too long is interrupted and the Player is given evaluation_settings['fallback_fitness'].
+    With evaluation_settings['deterministic'] = True the results are cached by the contents of the 
+    Players' Genomes, and Players with Genomes that have been simulated before aren't simulated again.
+    With evaluation_settings['batched'] = True simulate is instead given a list of (batch_size) Players 
+    to simulate together, and must return the list of them once they have been assigned fitnesses.
     """
 
-    # Create the Population
-    try:
-        creation_type = settings['creation_type']
-    except KeyError:
-        creation_type = 'new'
-
-    match(creation_type):
-        case 'new':
-            population = Population.new(PlayerClass, settings)
-        case 'load':
-            try:
-                load_folder = Path(settings['population_settings']['save_folder'])
-                population = Population.load(PlayerClass, settings, load_folder)
-            except KeyError:
-                raise Exception('Setting population_settings[\'save_folder\'] must be present (and contain a viable save) ' + \
-                    'to load a Population.')
+    population = create_population(PlayerClass, settings)
 
     # Evolve the Population to the desired generation
     try:
@@ -47,11 +79,148 @@ def run(
     except KeyError as e:
         raise Exception(f'Setting {e.args[0]} not found in settings.')
     
-    cores_to_use = cpu_count() // 2
+    evaluation_settings = evaluation_settings_handler(settings)['evaluation_settings']
+    transport = evaluation_settings['transport']
+    initializer = evaluation_settings['initializer']
+    initargs = evaluation_settings['initargs']
+    observables = list(population.progress_handler.observables.keys())
+    batched = evaluation_settings['batched']
+    match(transport):
+        case 'players':
+            function = simulate
+        case 'genomes' | 'shared_memory':
+            # Workers build their own Players, so get the GenomeEvaluator to them first
+            evaluator = GenomeEvaluator(
+                PlayerClass = PlayerClass,
+                player_args = population.player_factory.player_args,
+                simulate = simulate,
+                observables = observables,
+                compact_players = evaluation_settings['compact_players'],
+            )
+            initializer, initargs = init_worker, (evaluator, initializer, initargs)
+            function = evaluate_genomes if batched else evaluate_genome
+        case _:
+            raise Exception(f'Setting \'transport\' in evaluation_settings must be one of [\'players\', \'genomes\', ' + \
+                            '\'shared_memory\'].')
+
+    if evaluation_settings['scheduling'] not in ['static', 'dynamic']:
+        raise Exception('Setting \'scheduling\' in evaluation_settings must be one of [\'static\', \'dynamic\'].')
+
+    # Budgets interrupt simulations with SIGALRM, which only works in the main thread of a process
+    budget = evaluation_settings['budget']
+    if budget is not None and not hasattr(signal, 'setitimer'):
+        raise Exception('Setting \'budget\' in evaluation_settings is not supported on this platform.')
+
+    # Create the Executor, timing a sample of the Players on each backend if choosing automatically
+    executor_name = evaluation_settings['executor']
+    if transport == 'shared_memory' and executor_name not in ['process', 'auto']:
+        raise Exception('The \'shared_memory\' transport can only be used with the \'process\' executor.')
+    if budget is not None and executor_name == 'thread':
+        raise Exception('Setting \'budget\' in evaluation_settings can\'t be used with the \'thread\' executor.')
+    executor_args = {
+        'workers': evaluation_settings['workers'],
+        'initializer': initializer,
+        'initargs': initargs,
+        'chunksize': evaluation_settings['chunksize'],
+    }
+    match(executor_name):
+        case 'auto' if transport == 'shared_memory':
+            executor = ProcessExecutor(**executor_args)
+        case 'auto':
+            candidates = [ExecutorClass(**executor_args) for ExecutorClass in executors.values()
+                          if budget is None or ExecutorClass is not ThreadExecutor]
+            # Time copies of the first Players, so that simulating them doesn't change the Population's
+            def sample() -> list:
+                players = population.players[:2 * evaluation_settings['workers']]
+                if transport == 'genomes':
+                    players = [player.genome.compact() for player in players]
+                else:
+                    players = [population.player_factory.clone(player) for player in players]
+                return split_batches(players, 2) if batched else players
+            executor = fastest_executor(candidates, function, sample)
+        case 'distributed':
+            executor = DistributedExecutor(
+                **executor_args,
+                address = (evaluation_settings['host'], evaluation_settings['port']),
+                authkey = evaluation_settings['authkey'].encode() if evaluation_settings['authkey'] is not None else None,
+                heartbeat_timeout = evaluation_settings['heartbeat_timeout'],
+            )
+        case _ if executor_name in executors:
+            executor = executors[executor_name](**executor_args)
+        case _:
+            raise Exception(f'Setting \'executor\' in evaluation_settings must be one of ' + \
+                            f'{list(executors) + ["distributed", "auto"]}.')
+
+    # Only other processes need the Players' Genomes serialized to be sent to them
+    serializes = isinstance(executor, (ProcessExecutor, DistributedExecutor))
+
+    scheduler = Scheduler(
+        executor = executor,
+        dynamic = evaluation_settings['scheduling'] == 'dynamic',
+        budget = budget,
+    )
+
+    # Give each worker one batch of Players, or several to balance between if scheduling dynamically
+    workers = evaluation_settings['workers']
+    batches_per_worker = 4 if scheduler.dynamic else 1
+    def batch_size(players: int) -> int | None:
+        if not batched:
+            return None
+        if evaluation_settings['batch_size'] is not None:
+            return evaluation_settings['batch_size']
+        return max(-(-players // (workers * batches_per_worker)), 1)
+
+    # Only deterministic simulations give the same fitness every time for the same Genome
+    fitness_cache = None
+    if evaluation_settings['deterministic']:
+        fitness_cache = FitnessCache(evaluation_settings['cache_size'], observables)
+
+    try:
+        while population.generation <= total_generations:
+
+            with instrumentation.phase('evaluate'):
+
+                # Find the Players that need simulating (one of each Genome not in the cache)
+                pending = list(range(len(population.players)))
+                if fitness_cache is not None:
+                    genome_hashes = [genome_hash(player.genome) for player in population.players]
+                    pending = fitness_cache.lookup(population.players, genome_hashes)
+                players = [population.players[i] for i in pending]
+
+                # Expect Players to take as long as those bred from the same Species last generation
+                keys = [population.parent_species[i] for i in pending]
+
+                match(transport):
+                    case 'players':
+                        if instrumentation.enabled and serializes:
+                            instrumentation.count('genomes_serialized', len(players))
+                        results, exceeded = map_batches(scheduler, function, players, keys, batch_size(len(players)))
+                        for i, result in zip(pending, results):
+                            if result is not None:
+                                population.players[i] = result
+                    case 'genomes':
+                        if instrumentation.enabled and serializes:
+                            instrumentation.count('genomes_serialized', len(players))
+                        genomes = [player.genome.compact() for player in players]
+                        results, exceeded = map_batches(scheduler, function, genomes, keys, batch_size(len(players)))
+                        merge_results(players, results)
+                    case 'shared_memory':
+                        if instrumentation.enabled:
+                            instrumentation.count('genomes_serialized', len(players))
+                        exceeded = evaluate_in_arena(scheduler, players, observables, keys, batch_size(len(players)))
+                exceeded = [pending[i] for i in exceeded]
 
-    while population.generation <= total_generations:
+                # Cache the results, then give them to any Players with the same Genomes
+                if fitness_cache is not None:
+                    simulated = sorted(set(pending) - set(exceeded))
+                    exceeded = fitness_cache.complete(population.players, genome_hashes, simulated)
 
-        with Pool(cores_to_use) as pool:
-            population.players = pool.map(simulate, population.players, chunksize=1)
+                for i in exceeded:
+                    assign_fallback(population.players[i], evaluation_settings['fallback_fitness'], observables)
 
-        population.evolve()
\ No newline at end of file
+            population.evolve()
+    except BaseException:
+        scheduler.shutdown(cancel=True)
+        raise
+    else:
+        scheduler.shutdown()
@@ -0,0 +1,95 @@
+from typing import Callable, Awaitable
+import asyncio
+
+from neat.base_player import BasePlayer
+from neat.settings import evaluation_settings_handler
+from neat.evaluation import assign_fallback
+from neat.fitness_cache import FitnessCache, genome_hash
+from neat.instrumentation import instrumentation
+from neat.run import create_population
+
+
+async def run_async(
+    PlayerClass: type,
+    simulate: Callable[[BasePlayer], Awaitable[BasePlayer | None]],
+    settings: dict,
+) -> None:
+    """Apply the NEAT algorithm to a Population of Players, simulating them concurrently on the
+    running event loop.
+
+    The same as neat.run, except that simulate is a coroutine function (an async def) that assigns
+    the given Player its fitness, for simulations that spend most of their time waiting (e.g. on
+    simulators in other processes). Up to evaluation_settings['concurrency'] Players are simulated
+    at once, all in this process, so the 'workers', 'transport', 'executor' and 'scheduling'
+    evaluation_settings are ignored.
+    With evaluation_settings['budget'] set any simulation that runs for too long is cancelled and
+    the Player is given evaluation_settings['fallback_fitness'].
+    With evaluation_settings['deterministic'] = True the results are cached by the contents of the
+    Players' Genomes, and Players with Genomes that have been simulated before aren't simulated again.
+
+    Run with e.g. asyncio.run(neat.run_async(PlayerClass, simulate, settings)).
+    """
+
+    population = create_population(PlayerClass, settings)
+
+    # Evolve the Population to the desired generation
+    try:
+        total_generations = settings['total_generations']
+    except KeyError as e:
+        raise Exception(f'Setting {e.args[0]} not found in settings.')
+
+    evaluation_settings = evaluation_settings_handler(settings)['evaluation_settings']
+    budget = evaluation_settings['budget']
+    observables = list(population.progress_handler.observables.keys())
+    semaphore = asyncio.Semaphore(evaluation_settings['concurrency'])
+
+    async def simulate_within_budget(player: BasePlayer) -> bool:
+        """Simulate the Player once a slot is free, and return whether it exceeded the budget."""
+
+        async with semaphore:
+            timeout = asyncio.timeout(budget)
+            try:
+                async with timeout:
+                    await simulate(player)
+            except TimeoutError:
+                if not timeout.expired():
+                    raise
+                return True
+        return False
+
+    # Only deterministic simulations give the same fitness every time for the same Genome
+    fitness_cache = None
+    if evaluation_settings['deterministic']:
+        fitness_cache = FitnessCache(evaluation_settings['cache_size'], observables)
+
+    while population.generation <= total_generations:
+
+        with instrumentation.phase('evaluate'):
+
+            # Find the Players that need simulating (one of each Genome not in the cache)
+            pending = list(range(len(population.players)))
+            if fitness_cache is not None:
+                genome_hashes = [genome_hash(player.genome) for player in population.players]
+                pending = fitness_cache.lookup(population.players, genome_hashes)
+
+            # Players are simulated in place, so whatever simulate returns is ignored. If any simulation
+            # raises an exception the rest are cancelled
+            tasks = [asyncio.create_task(simulate_within_budget(population.players[i])) for i in pending]
+            try:
+                outcomes = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            exceeded = [i for i, budget_exceeded in zip(pending, outcomes) if budget_exceeded]
+
+            # Cache the results, then give them to any Players with the same Genomes
+            if fitness_cache is not None:
+                simulated = sorted(set(pending) - set(exceeded))
+                exceeded = fitness_cache.complete(population.players, genome_hashes, simulated)
+
+            for i in exceeded:
+                assign_fallback(population.players[i], evaluation_settings['fallback_fitness'], observables)
+
+        population.evolve()
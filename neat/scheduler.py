@@ -0,0 +1,117 @@
+from __future__ import annotations
+from typing import Callable, Hashable, Any
+import signal
+import time
+
+from neat.executors import Executor
+
+
+class BudgetExceeded(BaseException):
+    """Raised inside a simulation that has run for longer than its wall-clock budget.
+
+    Like KeyboardInterrupt it isn't an Exception, so a simulation that catches Exception can't 
+    swallow it and keep running.
+    """
+    pass
+
+
+def _budget_exceeded(signum: int, frame: Any) -> None:
+    raise BudgetExceeded
+
+
+def timed_call(task: tuple[Callable[[Any], Any], int, Any, float | None]) -> tuple[int, Any, float, bool]:
+    """Call the function in the given (function, index, item, budget) task on the item, and return
+    the index, the result, the time taken and whether the budget was exceeded.
+
+    If budget is not None the call is interrupted (with SIGALRM) once it has run for that many
+    seconds, and the result is None. Must be called in the main thread of a process.
+    """
+
+    function, index, item, budget = task
+    start = time.perf_counter()
+
+    if budget is not None:
+        previous_handler = signal.signal(signal.SIGALRM, _budget_exceeded)
+        signal.setitimer(signal.ITIMER_REAL, budget)
+
+    try:
+        result, exceeded = function(item), False
+        if budget is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    except BudgetExceeded:
+        result, exceeded = None, True
+    finally:
+        if budget is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+    return index, result, time.perf_counter() - start, exceeded
+
+
+class Scheduler:
+    """Hands out items to an Executor's workers and keeps track of how long they take.
+
+    With dynamic scheduling each item is handed to the next worker to become free (rather than
+    being assigned up front), in descending order of expected runtime, so that long simulations
+    start first and don't hold up the end of a generation. The expected runtime of an item is the
+    average runtime in the previous generation of items with the same key (e.g. Players bred from
+    the same Species), falling back to the overall average.
+    If budget is given then any call that runs for longer than that many seconds is interrupted.
+    """
+
+    def __init__(self, executor: Executor, dynamic: bool = False, budget: float | None = None) -> None:
+        self.executor: Executor = executor
+        self.dynamic: bool = dynamic
+        self.budget: float | None = budget
+        self._runtimes: dict[Hashable, float] = dict()
+        self._average_runtime: float = .0
+
+    def expected_runtime(self, key: Hashable) -> float:
+        """Return the expected runtime of an item with the given key."""
+        return self._runtimes.get(key, self._average_runtime)
+
+    def map(
+        self,
+        function: Callable[[Any], Any],
+        items: list[Any],
+        keys: list[Hashable] | None = None,
+    ) -> tuple[list[Any], list[int]]:
+        """Return the results of calling function on each of the items in order, along with the
+        indices of the items that exceeded the budget (whose results are None).
+
+        Each item's key is used to record its runtime and estimate the runtime of items with the
+        same key in the next call.
+        """
+
+        keys = keys if keys is not None else [None] * len(items)
+
+        order = list(range(len(items)))
+        if self.dynamic:
+            order.sort(key=lambda i: self.expected_runtime(keys[i]), reverse=True)
+        tasks = [(function, i, items[i], self.budget) for i in order]
+
+        if self.dynamic:
+            outcomes = self.executor.imap_unordered(timed_call, tasks)
+        else:
+            outcomes = self.executor.map(timed_call, tasks)
+
+        results = [None] * len(items)
+        exceeded = []
+        totals, counts = dict(), dict()
+        for index, result, runtime, budget_exceeded in outcomes:
+            results[index] = result
+            if budget_exceeded:
+                exceeded.append(index)
+            totals[keys[index]] = totals.get(keys[index], .0) + runtime
+            counts[keys[index]] = counts.get(keys[index], 0) + 1
+
+        # Remember the runtimes for the next call
+        self._runtimes = {key: totals[key] / counts[key] for key in totals}
+        if items:
+            self._average_runtime = sum(totals.values()) / len(items)
+
+        return results, sorted(exceeded)
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """Shut down the Executor."""
+        self.executor.shutdown(cancel)
@@ -1,3 +1,7 @@
+from collections.abc import Callable
+from multiprocessing import cpu_count
+
+
 defaults = {
 
     'genome_settings': {
@@ -7,6 +11,7 @@ defaults = {
     'population_settings': {
         'cull_percentage': 0.5, 
         'max_staleness': 20,
+        'compact_genomes': False,
     },
 
     'species_settings': {
@@ -15,6 +20,7 @@ defaults = {
         'weight_difference_coefficient': 0.4,
         'compatibility_threshold': 3,
         'max_staleness': 15,
+        'bulk_speciation': False,
     },
 
     'reproduction_settings': {
@@ -24,6 +30,8 @@ defaults = {
         'weight_replacement_rate': 0.1,
         'connection_rate': 0.1,
         'node_rate': 0.03,
+        'compact_crossover': False,
+        'vectorized_mutation': False,
     },
 
     'progress_settings': {
@@ -33,6 +41,8 @@ defaults = {
         'bests': ['fitness'],
         'averages': ['fitness'],
         'include_species': True,
+        'timings': False,
+        'timings_filename': None,
     },
 
     'playback_settings': {
@@ -40,6 +50,28 @@ defaults = {
         'number': 1,
     },
 
+    'evaluation_settings': {
+        'workers': max(cpu_count() // 2, 1),
+        'initializer': None,
+        'initargs': (),
+        'transport': 'players',
+        'executor': 'process',
+        'chunksize': 1,
+        'scheduling': 'static',
+        'budget': None,
+        'fallback_fitness': 0.0,
+        'deterministic': False,
+        'cache_size': 10000,
+        'host': 'localhost',
+        'port': 0,
+        'authkey': None,
+        'heartbeat_timeout': 10.0,
+        'concurrency': 100,
+        'batched': False,
+        'batch_size': None,
+        'compact_players': False,
+    },
+
 }
 
 
@@ -56,6 +88,7 @@ types = {
         'cull_percentage': float, 
         'max_staleness': int,
         'save_folder': str,
+        'compact_genomes': bool,
     },
 
     'species_settings': {
@@ -64,6 +97,7 @@ types = {
         'weight_difference_coefficient': float | int,
         'compatibility_threshold': float | int,
         'max_staleness': int,
+        'bulk_speciation': bool,
     },
 
     'reproduction_settings': {
@@ -73,6 +107,8 @@ types = {
         'weight_replacement_rate': float,
         'connection_rate': float,
         'node_rate': float,
+        'compact_crossover': bool,
+        'vectorized_mutation': bool,
     },
 
     'progress_settings': {
@@ -82,6 +118,8 @@ types = {
         'bests': list,
         'averages': list,
         'include_species': bool,
+        'timings': bool,
+        'timings_filename': str | None,
     },
 
     'playback_settings': {
@@ -89,6 +127,28 @@ types = {
         'number': int,
     },
 
+    'evaluation_settings': {
+        'workers': int,
+        'initializer': Callable | None,
+        'initargs': tuple,
+        'transport': str,
+        'executor': str,
+        'chunksize': int,
+        'scheduling': str,
+        'budget': float | int | None,
+        'fallback_fitness': float | int,
+        'deterministic': bool,
+        'cache_size': int,
+        'host': str,
+        'port': int,
+        'authkey': str | None,
+        'heartbeat_timeout': float | int,
+        'concurrency': int,
+        'batched': bool,
+        'batch_size': int | None,
+        'compact_players': bool,
+    },
+
 }
 
 
@@ -98,6 +158,7 @@ def settings_handler(settings: dict, silent: bool = False) -> dict:
     
     Also set default values where settings do not exist (if applicable).
     Print to console all default values used if silent is False.
+    The evaluation_settings are left to evaluation_settings_handler.
     """
 
     # Check the settings has the necessary sub-dictionaries
@@ -116,54 +177,82 @@ def settings_handler(settings: dict, silent: bool = False) -> dict:
         except KeyError:
             settings[setting + '_settings'] = dict()
 
-    # Verify they are dictionaries
     for name in types.keys():
-        settings_dict = settings[name]
-        if not isinstance(settings_dict, dict):
-            raise Exception(f'Settings {settings_dict} must be a dictionary')
+        if name != 'evaluation_settings':
+            sub_settings_handler(settings, name, silent)
+            
+    return settings
+
+
+def evaluation_settings_handler(settings: dict, silent: bool = False) -> dict:
+    """Make sure the evaluation_settings exist, are of the right type and in their viable range, 
+    setting default values where they do not exist.
+    
+    These are only used by neat.run (and neat.run_async) and not saved with the Population, so need handling even when 
+    the Population is loaded.
+    Print to console all default values used if silent is False.
+    """
+
+    try:
+        settings['evaluation_settings']
+    except KeyError:
+        settings['evaluation_settings'] = dict()
+
+    sub_settings_handler(settings, 'evaluation_settings', silent)
+
+    return settings
+
+
+def sub_settings_handler(settings: dict, name: str, silent: bool = False) -> None:
+    """Make sure the settings in the sub-dictionary settings[name] exist, are of the right type 
+    and in their viable range, setting default values where applicable."""
+
+    # Verify it is a dictionary
+    settings_dict = settings[name]
+    if not isinstance(settings_dict, dict):
+        raise Exception(f'Settings {settings_dict} must be a dictionary')
         
     # Set default values where appropriate
-    for name, default in defaults.items():
-        for key, default_value in default.items():
-            try:
-                setting = settings[name][key]
-                if setting is None:
-                    raise TypeError
-            except (KeyError, TypeError):
-                settings[name][key] = default_value
-                if not silent:
-                    print(f'Using default value {default_value} for \'{key}\' in {name}.')
+    for key, default_value in defaults.get(name, dict()).items():
+        try:
+            setting = settings_dict[key]
+            if setting is None:
+                raise TypeError
+        except (KeyError, TypeError):
+            settings_dict[key] = default_value
+            if not silent and default_value is not None:
+                print(f'Using default value {default_value} for \'{key}\' in {name}.')
 
     # Check values exist, are of right type and in their viable range
-    for name, type_dict in types.items():
-        settings_dict = settings[name]
-        for key, type_value in type_dict.items():
-
-            # Exists
-            try:
-                setting = settings[name][key]
-
-                # Type
-                if not isinstance(setting, type_value):
-                    raise TypeError(f'Setting \'{key}\' in {name} must be of type {type_value}.')
-                if isinstance(setting, list):
-                    # All lists are lists of strings
-                    for value in setting:
-                        if not isinstance(value, str):
-                            raise TypeError(f'Attribute in {name}[{key}] must be of type str.')
-                
-                # Range
-                if isinstance(setting, int) and name != 'progress_settings':
-                    # bools set to False in progress settings register as int = 0
-                    # All ints > 0 except playback_settings['number']
-                    if setting <= 0 and key != 'number':
-                        raise ValueError(f'Setting \'{key}\' in {name} must be positive.')
-                elif isinstance(setting, float):
-                    # All floats in [.0, 1.0] except in species_settings
-                    if setting < 0 or (setting > 1 and name != 'species_settings'):
-                        raise ValueError(f'Setting \'{key}\' in {name} must in range [0.0, 1.0].')
-
-            except KeyError as e:
-                raise Exception(f'Setting \'{e.args[0]}\' must be included in settings.')
+    for key, type_value in types[name].items():
+
+        # Exists
+        try:
+            setting = settings_dict[key]
+
+            # Type
+            if not isinstance(setting, type_value):
+                raise TypeError(f'Setting \'{key}\' in {name} must be of type {type_value}.')
+            if isinstance(setting, list):
+                # All lists are lists of strings
+                for value in setting:
+                    if not isinstance(value, str):
+                        raise TypeError(f'Attribute in {name}[{key}] must be of type str.')
             
-    return settings
\ No newline at end of file
+            # Range
+            if key == 'fallback_fitness':
+                # Any fitness (int or float) can be given to Players whose simulations are interrupted
+                pass
+            elif isinstance(setting, int) and not isinstance(setting, bool):
+                # bools set to False would otherwise register as int = 0
+                # All ints > 0 except playback_settings['number'] and evaluation_settings['port'] (where 0 
+                # means any free port)
+                if setting <= 0 and key not in ['number', 'port']:
+                    raise ValueError(f'Setting \'{key}\' in {name} must be positive.')
+            elif isinstance(setting, float):
+                # All floats in [.0, 1.0] except in species_settings and evaluation_settings
+                if setting < 0 or (setting > 1 and name not in ['species_settings', 'evaluation_settings']):
+                    raise ValueError(f'Setting \'{key}\' in {name} must in range [0.0, 1.0].')
+
+        except KeyError as e:
+            raise Exception(f'Setting \'{e.args[0]}\' must be included in settings.')
@@ -0,0 +1,179 @@
+from __future__ import annotations
+from array import array
+import sys
+from multiprocessing import shared_memory, resource_tracker
+
+from neat.genome import Genome, CompactGenome
+
+
+# The CompactGenome columns held in the arena (all columns are laid out largest type first so that
+# every column stays aligned)
+NODE_COLUMNS = [('node_numbers', 'q'), ('node_layers', 'q'), ('node_activations', 'B')]
+CONNECTION_COLUMNS = [('connection_from', 'q'), ('connection_to', 'q'), ('connection_innovations', 'q'),
+                      ('connection_weights', 'd'), ('connection_enabled', 'b')]
+
+# The header holds (Genome count, result width, total Nodes, total Connections)
+HEADER_LENGTH = 4
+# Each Genome's info holds (input_count, output_count, layers, bias_node_idx)
+GENOME_INFO_WIDTH = 4
+
+
+class GenomeArena:
+    """A whole generation's Genomes packed into one block of shared memory as the flat typed arrays
+    of CompactGenomes, along with an array for each Genome's results.
+
+    The block starts with a header from which the position of every column can be worked out, so
+    a worker process only needs the block's name to attach to it. The CompactGenome at any index
+    can then be read as views into the block by offset without any copying or unpickling, and the
+    worker writes the results for that Genome straight back into the block.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory) -> None:
+        self.memory: shared_memory.SharedMemory = memory
+
+        header = memory.buf[:HEADER_LENGTH * 8].cast('q')
+        self.genome_count, self.result_width, node_total, connection_total = header.tolist()
+        header.release()
+
+        self._columns: dict[str, tuple[int, int, str]]
+        self._columns, _ = self.layout(self.genome_count, self.result_width, node_total, connection_total)
+
+    @property
+    def name(self) -> str:
+        """Return the name of the shared memory block, which worker processes attach to."""
+        return self.memory.name
+
+    @staticmethod
+    def layout(
+        genome_count: int,
+        result_width: int,
+        node_total: int,
+        connection_total: int,
+    ) -> tuple[dict[str, tuple[int, int, str]], int]:
+        """Return the (offset in bytes, length, typecode) of each column in an arena with the given 
+        dimensions, and the total number of bytes it needs."""
+
+        columns = dict()
+        offset = HEADER_LENGTH * 8
+        for name, length, typecode in sorted([
+            ('genome_info', genome_count * GENOME_INFO_WIDTH, 'q'),
+            ('node_offsets', genome_count + 1, 'q'),
+            ('connection_offsets', genome_count + 1, 'q'),
+            ('results', genome_count * result_width, 'd'),
+            *[(name, node_total, typecode) for name, typecode in NODE_COLUMNS],
+            *[(name, connection_total, typecode) for name, typecode in CONNECTION_COLUMNS],
+        ], key=lambda column: array(column[2]).itemsize, reverse=True):
+            columns[name] = (offset, length, typecode)
+            offset += length * array(typecode).itemsize
+
+        return columns, offset
+
+    @classmethod
+    def pack(cls, genomes: list[Genome | CompactGenome], result_width: int) -> GenomeArena:
+        """Return a new arena holding the given Genomes, with room for result_width floats of
+        results for each of them.
+
+        The process that packs the arena must unlink it once it is finished with.
+        """
+
+        compacts = [genome.compact() for genome in genomes]
+        header = array('q', [
+            len(compacts),
+            result_width,
+            sum(len(compact.node_numbers) for compact in compacts),
+            sum(len(compact.connection_innovations) for compact in compacts),
+        ])
+
+        _, size = cls.layout(*header)
+        memory = shared_memory.SharedMemory(create=True, size=size)
+        memory.buf[:HEADER_LENGTH * 8] = header.tobytes()
+        arena = cls(memory)
+
+        genome_info = arena.column('genome_info')
+        node_offsets = arena.column('node_offsets')
+        connection_offsets = arena.column('connection_offsets')
+        columns = {name: arena.column(name) for name, _ in NODE_COLUMNS + CONNECTION_COLUMNS}
+
+        node_offsets[0], connection_offsets[0] = 0, 0
+        for i, compact in enumerate(compacts):
+            info = array('q', [compact.input_count, compact.output_count, compact.layers, compact.bias_node_idx])
+            genome_info[i * GENOME_INFO_WIDTH:(i + 1) * GENOME_INFO_WIDTH] = info
+
+            node_start, connection_start = node_offsets[i], connection_offsets[i]
+            node_end = node_start + len(compact.node_numbers)
+            connection_end = connection_start + len(compact.connection_innovations)
+            for name, _ in NODE_COLUMNS:
+                columns[name][node_start:node_end] = getattr(compact, name)
+            for name, _ in CONNECTION_COLUMNS:
+                columns[name][connection_start:connection_end] = getattr(compact, name)
+            node_offsets[i + 1], connection_offsets[i + 1] = node_end, connection_end
+
+        for view in [genome_info, node_offsets, connection_offsets, *columns.values()]:
+            view.release()
+
+        return arena
+
+    @classmethod
+    def attach(cls, name: str) -> GenomeArena:
+        """Return the arena in the shared memory block with the given name, packed by another
+        process which is responsible for unlinking the block."""
+
+        # Stop this process' resource tracker from unlinking the block when this process exits
+        if sys.version_info >= (3, 13):
+            return cls(shared_memory.SharedMemory(name=name, track=False))
+        memory = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(memory._name, 'shared_memory')
+        return cls(memory)
+
+    def column(self, name: str) -> memoryview:
+        """Return a typed view of the column with the given name.
+
+        Views must be released (or garbage collected) before the arena is closed.
+        """
+
+        offset, length, typecode = self._columns[name]
+        return self.memory.buf[offset:offset + length * array(typecode).itemsize].cast(typecode)
+
+    def genome(self, index: int) -> CompactGenome:
+        """Return the CompactGenome at the given index, with columns that are views into the
+        arena."""
+
+        genome_info = self.column('genome_info')
+        node_offsets = self.column('node_offsets')
+        connection_offsets = self.column('connection_offsets')
+
+        input_count, output_count, layers, bias_node_idx = \
+            genome_info[index * GENOME_INFO_WIDTH:(index + 1) * GENOME_INFO_WIDTH].tolist()
+        compact = CompactGenome(input_count, output_count, layers)
+        compact.bias_node_idx = bias_node_idx
+
+        for name, _ in NODE_COLUMNS:
+            setattr(compact, name, self.column(name)[node_offsets[index]:node_offsets[index + 1]])
+        for name, _ in CONNECTION_COLUMNS:
+            setattr(compact, name, self.column(name)[connection_offsets[index]:connection_offsets[index + 1]])
+
+        return compact
+
+    def write_results(self, index: int, values: list[float]) -> None:
+        """Write the given results for the Genome at the given index."""
+
+        results = self.column('results')
+        results[index * self.result_width:(index + 1) * self.result_width] = array('d', values)
+        results.release()
+
+    def results(self) -> list[list[float]]:
+        """Return the results for every Genome."""
+
+        results = self.column('results')
+        values = results.tolist()
+        results.release()
+        return [values[i:i + self.result_width] for i in range(0, len(values), self.result_width)]
+
+    def close(self) -> None:
+        """Detach from the shared memory block."""
+        self.memory.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory block once every process has closed it (only to be called by the
+        process that packed it)."""
+        self.memory.unlink()
@@ -18,6 +18,7 @@ genome_settings = {
     # The number of options the Player has
     'output_count': None,
     # The activation to use for all Nodes in hidden layers i.e. all layers except input and output
+    # Any other name added with neat.genome.activation_functions.register_activation can also be used
     'hidden_activation': None,  # Options are ['sigmoid', 'relu', 'linear'], Default = 'sigmoid'
 
 }
@@ -33,6 +34,8 @@ population_settings = {
     'max_staleness': None,  # Default = 20
     # Folder to save each generation to (overwritten each time) so the program can be paused and resumed
     'save_folder': None,
+    # Choose whether to store Species reps and saved Genomes as (array-backed) CompactGenomes
+    'compact_genomes': None,    # Default = False
 
 }
 
@@ -47,6 +50,10 @@ species_settings = {
 
     # The number of generations a Species can go without improvement before being removed
     'max_staleness': None,  # Default = 15
+
+    # Choose whether to speciate with a matrix of distances to all Species at once (requires NumPy)
+    # Gives the same Species as the default one-pair-at-a-time comparisons, faster for large populations
+    'bulk_speciation': None,    # Default = False
 }
 
 
@@ -65,6 +72,10 @@ reproduction_settings = {
     'connection_rate': None,    # Default = 0.1
     # The rate at which a new Node will be added to a Genome
     'node_rate': None,  # Default = 0.03
+    # Choose whether crossovers are written straight into CompactGenomes, which stay compact until a Node or Connection is added
+    'compact_crossover': None,  # Default = False
+    # Choose whether to mutate all the offspring's weights at once with NumPy (requires NumPy)
+    'vectorized_mutation': None,    # Default = False
 
 }
 
@@ -84,6 +95,11 @@ progress_settings = {
     'averages': None,    # Default = ['fitness']
     # Choose whether to include the number of Species in the progress report
     'include_species': None, # Default = True
+    # Choose whether to time each phase of every generation (and count expensive operations), reporting them with the
+    # progress if print_progress is True
+    'timings': None,    # Default = False
+    # File to append each generation's timings to, either a .csv or a .jsonl file (None for no file)
+    'timings_filename': None,   # Default = None
 
 }
 
@@ -98,6 +114,67 @@ playback_settings = {
 }
 
 
+evaluation_settings = {
+
+    # How to simulate the Players: one after another in this process (useful for profiling), in a pool of threads
+    # (for simulations that release the GIL) or in a pool of processes (for pure Python simulations)
+    # With 'auto' a sample of the Players is timed with each of them and the fastest is used for the whole run
+    # With 'distributed' the Players are simulated by worker processes that connect over TCP, on this machine or others
+    'executor': None,   # Options are ['serial', 'thread', 'process', 'distributed', 'auto'], Default = 'process'
+    # The number of workers (threads or processes) to simulate the Players in, kept for the whole run
+    'workers': None,    # Default = half the number of CPUs (at least 1)
+    # The number of Players handed to a worker at a time
+    'chunksize': None,  # Default = 1
+    # Choose whether simulate is given a list of Players to simulate together (e.g. in a vectorized environment) and
+    # returns them, rather than one Player at a time
+    'batched': None,    # Default = False
+    # The number of Players in each list given to simulate when batched
+    'batch_size': None, # Default = None (split the Players evenly between the workers, or into 4 batches per worker
+                        # with 'dynamic' scheduling)
+    # With 'static' the Players are split between the workers up front, with 'dynamic' each Player is handed to the
+    # next worker to become free, starting with those expected to take longest (based on how long the Players bred
+    # from the same Species took last generation)
+    'scheduling': None, # Options are ['static', 'dynamic'], Default = 'static'
+    # Number of seconds a Player's simulation can run for before it is interrupted (None for no limit)
+    # Can't be used with the 'thread' executor
+    'budget': None, # Default = None
+    # The fitness given to Players whose simulation is interrupted
+    'fallback_fitness': None,   # Default = 0.0
+    # Choose whether the simulation always gives the same results for the same Genome, in which case the results are
+    # cached and Players with a Genome that has already been simulated (e.g. unchanged clones) aren't simulated again
+    'deterministic': None,  # Default = False
+    # The number of results to cache, the least recently used are discarded first
+    'cache_size': None, # Default = 10000
+
+    # For the 'distributed' executor, the address to serve work to workers at
+    # Workers on other machines join with neat.distributed.run_worker((host, port), authkey.encode())
+    'host': None,   # Default = 'localhost' (use '' to accept workers from other machines)
+    'port': None,   # Default = 0 (any free port, only for local workers)
+    # The key workers must present, required unless host is 'localhost' (otherwise a random key is used)
+    'authkey': None,    # Default = None
+    # Number of seconds after which a worker that hasn't been heard from is presumed dead and its work is given to others
+    'heartbeat_timeout': None,  # Default = 10.0
+    # For neat.run_async, the number of Players simulated at once on the event loop
+    'concurrency': None,    # Default = 100
+    # Function called once in each worker when it starts, e.g. to build the simulation environment
+    'initializer': None,    # Default = None
+    # Arguments to pass to the initializer
+    'initargs': None,   # Default = ()
+    # What is sent to the workers each generation, either whole Players or just their (compact) Genomes
+    # With 'genomes' each worker builds the Players itself and sends back only the fitness and the attributes
+    # in progress_settings, which is much less to copy between processes for Players that carry a lot of state
+    # With 'shared_memory' the whole generation's Genomes are packed into shared memory that the workers read
+    # from and write the results back into, so nothing is pickled at all (requires the 'process' executor)
+    'transport': None,  # Options are ['players', 'genomes', 'shared_memory'], Default = 'players'
+    # With 'genomes' or 'shared_memory', choose whether the Players built by the workers are given the CompactGenomes
+    # as they are rather than expanded into full Genomes, which saves rebuilding every Node and Connection
+    # Their Genomes can then be propagated and read but not mutated, and with 'shared_memory' are views into the
+    # shared memory, so the Players mustn't be kept after simulate returns
+    'compact_players': None,    # Default = False
+
+}
+
+
 settings = {
 
     # Choose whether to start a Population of Players with randomized Genomes or load a previous save
@@ -117,6 +194,7 @@ settings = {
     'reproduction_settings': reproduction_settings,
     'progress_settings': progress_settings,
     'playback_settings': playback_settings,
+    'evaluation_settings': evaluation_settings,
 
 }
 
@@ -0,0 +1,141 @@
+from __future__ import annotations
+from pathlib import Path
+import random
+
+from neat.base_player import BasePlayer
+from neat.genome import Genome, CompactGenome
+from neat.genome.activation_functions import sigmoid, relu
+from neat.evolution.mutation import add_connection, add_node, mutate_weights
+from neat.history import History
+
+
+class XorPlayer(BasePlayer):
+    """A Player that is only ever simulated on XOR."""
+
+    def __init__(self, player_args: dict) -> None:
+        super().__init__()
+
+    def look(self) -> None:
+        pass
+
+    def think(self) -> None:
+        pass
+
+    def move(self, move: None) -> None:
+        pass
+
+
+XOR = [((0, 0), 0), ((0, 1), 1), ((1, 0), 1), ((1, 1), 0)]
+
+def simulate_xor(player: XorPlayer) -> XorPlayer:
+    """Assign the Player a fitness for how close its Genome is to XOR."""
+
+    error = sum((player.genome.propagate(input)[0] - output) ** 2 for input, output in XOR)
+    player.fitness = (4 - error) ** 2
+    return player
+
+
+def players_with(genomes: list[Genome]) -> list[XorPlayer]:
+    """Return a Player with each of the given Genomes."""
+
+    players = []
+    for genome in genomes:
+        player = XorPlayer({})
+        player.genome = genome
+        players.append(player)
+    return players
+
+
+def engage(genome: Genome, input: tuple[float, ...]) -> tuple[float, ...]:
+    """Return the output of the given Genome by engaging each of its Nodes in turn, the way 
+    Genomes were propagated before they were compiled into EvaluationPlans."""
+
+    for node in genome.nodes:
+        node.input = 0
+    for i, value in enumerate(input):
+        genome.nodes[i].input = value
+    genome.nodes[genome.bias_node_idx].input = 1
+
+    for node in genome.nodes:
+        node.engage()
+
+    return tuple(node.output for node in genome.nodes[len(genome.nodes) - genome.output_count:])
+
+
+def structure(genome: Genome | CompactGenome) -> tuple[list[tuple], list[tuple]]:
+    """Return the Nodes and Connections of the given Genome or CompactGenome as plain values."""
+    return (
+        [(node.number, node.layer, node.activation) for node in genome.nodes],
+        [(connection.from_node.number, connection.to_node.number, connection.weight,
+          connection.innovation_number, connection.enabled) for connection in genome.connections],
+    )
+
+
+def random_genomes(count: int, input_count: int = 3, output_count: int = 2, mutations: int = 30,
+                   seed: int = 0) -> list[Genome]:
+    """Return count Genomes sharing one History, each grown by a random number of structural and
+    weight mutations (with some Connections disabled and some relu Nodes)."""
+
+    random.seed(seed)
+    history = History()
+    genomes = []
+    for _ in range(count):
+        genome = Genome.new(input_count, output_count, history)
+        for _ in range(random.randrange(mutations)):
+            match random.randrange(3):
+                case 0:
+                    add_connection(genome, history)
+                case 1:
+                    add_node(genome, random.choice([sigmoid, relu]), history)
+                case 2:
+                    mutate_weights(genome, 0.1)
+        for connection in genome.connections:
+            if random.random() < 0.1:
+                connection.enabled = False
+        genome.invalidate()
+        genomes.append(genome)
+
+    return genomes
+
+
+def run_settings(folder: Path, **evaluation_settings) -> dict:
+    """Return the settings for a short run of neat.run on XOR with the given evaluation_settings, 
+    saving into the given folder."""
+
+    return {
+        'creation_type': 'new',
+        'total_generations': 2,
+        'player_args': {},
+        'genome_settings': {'input_count': 2, 'output_count': 1, 'hidden_activation': 'sigmoid'},
+        'population_settings': {
+            'size': 20,
+            'save_folder': str(folder / 'population'),
+            'cull_percentage': 0.5,
+            'max_staleness': 20,
+        },
+        'progress_settings': {
+            'print_progress': False,
+            'record_progress': False,
+            'filename': 'progress',
+            'bests': ['fitness'],
+            'averages': ['fitness'],
+            'include_species': False,
+        },
+        'species_settings': {
+            'excess_coefficient': 1,
+            'disjoint_coefficient': 1,
+            'weight_difference_coefficient': 0.4,
+            'compatibility_threshold': 3,
+            'max_staleness': 15,
+        },
+        'reproduction_settings': {
+            'crossover_rate': 0.75,
+            'disabled_rate': 0.75,
+            'weights_rate': 0.8,
+            'weight_replacement_rate': 0.1,
+            'connection_rate': 0.1,
+            'node_rate': 0.03,
+        },
+        'playback_settings': {'number': 0, 'save_folder': str(folder / 'playback')},
+        'evaluation_settings': {'workers': 2, **evaluation_settings},
+    }
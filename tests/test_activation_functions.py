@@ -0,0 +1,76 @@
+import math
+
+import pytest
+
+from neat.genome.activation_functions import sigmoid, relu, linear, SigmoidTable, activation_by_name, \
+    activation_id, register_activation, vectorize
+import neat.genome.activation_functions as activation_functions
+from neat.population.player_factory import PlayerFactory
+from neat.settings import defaults
+
+np = pytest.importorskip('numpy')
+
+
+def tanh(x: float) -> float:
+    return math.tanh(x)
+
+def tanh_vector(x):
+    return np.tanh(x)
+
+
+@pytest.fixture
+def registered_tanh():
+    activations = activation_functions._activations.copy()
+    yield register_activation('tanh', tanh, tanh_vector)
+    activation_functions._activations[:] = activations
+
+
+X = np.linspace(-10, 10, 2001)
+
+
+@pytest.mark.parametrize('function', [sigmoid, relu, linear])
+def test_vectorized_matches_scalar(function):
+    np.testing.assert_allclose(vectorize(function)(X), [function(x) for x in X], atol=1e-15)
+
+
+def test_sigmoid_table_is_within_its_max_error():
+    table = SigmoidTable()
+    assert np.max(np.abs(table(X) - [sigmoid(x) for x in X])) <= table.max_error
+
+
+def test_ids_and_names_round_trip():
+    for name, function in [('sigmoid', sigmoid), ('relu', relu), ('linear', linear)]:
+        assert activation_id(name) == activation_id(function)
+        assert activation_by_name(name) is function
+        assert activation_by_name(activation_id(function)) is function
+    with pytest.raises(TypeError):
+        activation_by_name('unknown')
+
+
+def test_registered_activation_is_available_by_name(registered_tanh):
+    assert activation_id('tanh') == registered_tanh
+    assert activation_by_name('tanh') is tanh
+    assert vectorize(tanh) is tanh_vector
+    with pytest.raises(ValueError):
+        register_activation('tanh', tanh, tanh_vector)
+
+
+def test_genome_settings_save_the_registered_name():
+    activations = activation_functions._activations.copy()
+    register_activation('hyperbolic_tangent', tanh, tanh_vector)
+    try:
+        genome_settings = {'input_count': 2, 'output_count': 1, 'hidden_activation': 'hyperbolic_tangent'}
+        factory = PlayerFactory(object, {}, genome_settings, defaults['reproduction_settings'])
+        assert factory.genome_settings == genome_settings
+
+        # The saved settings can be loaded again
+        assert PlayerFactory(object, {}, factory.genome_settings, defaults['reproduction_settings']).genome_settings == \
+               genome_settings
+    finally:
+        activation_functions._activations[:] = activations
+
+
+def test_unregistered_functions_are_wrapped():
+    def square(x: float) -> float:
+        return x * x
+    np.testing.assert_allclose(vectorize(square)(X), X * X)
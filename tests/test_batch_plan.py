@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from tests.helpers import engage, random_genomes
+
+np = pytest.importorskip('numpy')
+
+
+INPUTS = np.array([[random.Random(i).uniform(-2, 2) for _ in range(3)] for i in range(16)])
+
+
+@pytest.fixture(scope='module')
+def genomes():
+    return random_genomes(40)
+
+
+def test_batch_matches_engage(genomes):
+    for genome in genomes:
+        expected = np.array([engage(genome, tuple(input)) for input in INPUTS])
+        np.testing.assert_allclose(genome.propagate_batch(INPUTS), expected, atol=1e-12)
+
+
+def test_batch_matches_propagate(genomes):
+    for genome in genomes:
+        expected = np.array([genome.propagate(tuple(input)) for input in INPUTS])
+        np.testing.assert_allclose(genome.propagate_batch(INPUTS), expected, atol=1e-12)
+
+
+def test_batch_is_rebuilt_after_invalidate(genomes):
+    genome = genomes[-1].clone()
+    genome.propagate_batch(INPUTS)
+    for connection in genome.connections:
+        connection.weight *= -2
+    genome.invalidate()
+
+    expected = np.array([engage(genome, tuple(input)) for input in INPUTS])
+    np.testing.assert_allclose(genome.propagate_batch(INPUTS), expected, atol=1e-12)
+
+
+def test_batch_rejects_the_wrong_shape(genomes):
+    with pytest.raises(ValueError):
+        genomes[0].propagate_batch(np.zeros((4, 2)))
@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+import neat
+from neat import evaluation
+from neat.evaluation import GenomeEvaluator, init_worker, split_batches, map_batches, evaluate_in_arena
+from neat.executors import SerialExecutor
+from neat.scheduler import Scheduler
+from tests.helpers import XorPlayer, players_with, random_genomes, run_settings, simulate_xor
+
+
+def double_all(items: list[float]) -> list[float]:
+    if any(item < 0 for item in items):
+        time.sleep(5)
+    return [2 * item for item in items]
+
+
+def test_split_batches():
+    assert split_batches(list(range(7)), 3) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert split_batches(list(range(6)), 3) == [[0, 1, 2], [3, 4, 5]]
+    assert split_batches([], 3) == []
+
+
+def test_map_batches_flattens_results():
+    scheduler = Scheduler(SerialExecutor(1))
+    assert map_batches(scheduler, double_all, list(range(7)), batch_size=3) == ([0, 2, 4, 6, 8, 10, 12], [])
+    assert map_batches(scheduler, abs, [-1, 2]) == ([1, 2], [])
+
+
+def test_map_batches_exceeding_budget_covers_the_whole_batch():
+    scheduler = Scheduler(SerialExecutor(1), budget=.1)
+    results, exceeded = map_batches(scheduler, double_all, [0, 1, 2, 3, -4, 5, 6], batch_size=3)
+
+    assert results == [0, 2, 4, None, None, None, 12]
+    assert exceeded == [3, 4, 5]
+
+
+@pytest.fixture
+def batch_evaluator():
+    batches = []
+    def simulate(players: list[XorPlayer]) -> list[XorPlayer]:
+        batches.append(len(players))
+        return [simulate_xor(player) for player in players]
+
+    init_worker(GenomeEvaluator(XorPlayer, {}, simulate, []))
+    yield batches
+    evaluation._evaluator = None
+    if evaluation._arena is not None:
+        evaluation._arena.close()
+        evaluation._arena = None
+
+
+def test_arena_batches_are_split(batch_evaluator):
+    genomes = random_genomes(7, input_count=2, output_count=1)
+    players = players_with(genomes)
+
+    exceeded = evaluate_in_arena(Scheduler(SerialExecutor(1)), players, [], batch_size=3)
+
+    assert exceeded == []
+    assert batch_evaluator == [3, 3, 1]
+    assert [player.fitness for player in players] == \
+           [simulate_xor(player).fitness for player in players_with(genomes)]
+
+
+def simulate_batch(players: list[XorPlayer]) -> list[XorPlayer]:
+    return [simulate_xor(player) for player in players]
+
+
+@pytest.mark.parametrize('executor, transport', [
+    ('serial', 'players'),
+    ('process', 'players'),
+    ('process', 'genomes'),
+    ('process', 'shared_memory'),
+])
+@pytest.mark.parametrize('scheduling', ['static', 'dynamic'])
+def test_batched_run_completes(tmp_path, executor, transport, scheduling):
+    settings = run_settings(tmp_path, executor=executor, transport=transport, scheduling=scheduling, batched=True)
+    neat.run(XorPlayer, simulate_batch, settings)
+
+
+def test_batch_size_is_used(tmp_path):
+    sizes = []
+    def simulate(players: list[XorPlayer]) -> list[XorPlayer]:
+        sizes.append(len(players))
+        return simulate_batch(players)
+
+    settings = run_settings(tmp_path, executor='serial', batched=True, batch_size=6)
+    neat.run(XorPlayer, simulate, settings)
+    assert max(sizes) == 6
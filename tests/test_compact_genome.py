@@ -0,0 +1,75 @@
+import pickle
+import random
+
+import pytest
+
+from neat.genome import Genome, CompactGenome
+from neat.genome.activation_functions import relu
+import neat.genome.activation_functions as activation_functions
+from tests.helpers import engage, random_genomes, structure
+
+
+INPUTS = [tuple(random.Random(i).uniform(-2, 2) for _ in range(3)) for i in range(8)]
+
+
+@pytest.fixture(scope='module')
+def genomes():
+    return random_genomes(40)
+
+
+def test_compact_matches_engage(genomes):
+    for genome in genomes:
+        compact = genome.compact()
+        for input in INPUTS:
+            assert compact.propagate(input) == pytest.approx(engage(genome, input), abs=1e-12)
+
+
+def test_round_trips_through_full_genome(genomes):
+    for genome in genomes:
+        compact = genome.compact()
+        assert structure(compact) == structure(genome)
+        assert structure(Genome.from_compact(compact)) == structure(genome)
+        assert compact.innovation_numbers == genome.innovation_numbers
+
+
+def test_pickles_and_clones(genomes, tmp_path):
+    for i, genome in enumerate(genomes):
+        compact = genome.compact()
+        compact.propagate(INPUTS[0])
+        compact.save(tmp_path, str(i))
+        loaded = Genome.load(tmp_path / f'{i}.pickle')
+        assert isinstance(loaded, CompactGenome)
+        for copy in (loaded, pickle.loads(pickle.dumps(compact)), compact.clone()):
+            assert structure(copy) == structure(genome)
+            assert copy.propagate(INPUTS[1]) == compact.propagate(INPUTS[1])
+
+
+def test_activations_are_pickled_by_name(genomes):
+    compact = next(genome for genome in genomes if any(node.activation is relu for node in genome.nodes)).compact()
+    pickled, expected = pickle.dumps(compact), structure(compact)
+
+    # Another process may have registered the activation functions in another order
+    activations = activation_functions._activations.copy()
+    activation_functions._activations.reverse()
+    try:
+        assert structure(pickle.loads(pickled)) == expected
+    finally:
+        activation_functions._activations[:] = activations
+
+
+def test_connection_views_write_through(genomes):
+    genome = genomes[-1].clone()
+    compact = genome.compact()
+    compact.propagate(INPUTS[0])
+    for view, connection in zip(compact.connections, genome.connections):
+        view.weight = connection.weight = connection.weight * -2
+        view.enabled = connection.enabled = not connection.enabled
+    genome.invalidate()
+
+    for input in INPUTS:
+        assert compact.propagate(input) == pytest.approx(engage(genome, input), abs=1e-12)
+
+
+def test_full_genomes_pickle_with_slots(genomes):
+    for genome in genomes:
+        assert structure(pickle.loads(pickle.dumps(genome))) == structure(genome)
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from neat.evolution.crossover import crossover, crossover_compact
+from neat.evolution.mutation import mutate
+from neat.genome import Genome, CompactGenome
+from neat.genome.activation_functions import sigmoid
+from neat.history import History
+from tests.helpers import engage, random_genomes
+
+
+def genes(genome):
+    """Return the (innovation number, from-Node number, to-Node number) of each Connection."""
+    return sorted((connection.innovation_number, connection.from_node.number, connection.to_node.number)
+                  for connection in genome.connections)
+
+
+def parents(seed):
+    genomes = random_genomes(20, seed=seed)
+    return [(genomes[i], genomes[j]) for i in range(len(genomes)) for j in range(len(genomes)) if i != j][::7]
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_same_genes_and_nodes_as_crossover(seed):
+    for genome1, genome2 in parents(seed):
+        child, compact_child = crossover(genome1, genome2, .5), crossover_compact(genome1, genome2, .5)
+        assert genes(compact_child) == genes(child) == genes(genome1)
+        assert [(node.number, node.layer, node.activation) for node in compact_child.nodes] == \
+               [(node.number, node.layer, node.activation) for node in child.nodes]
+        assert compact_child.layers == child.layers
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_weights_come_from_either_parent(seed):
+    for genome1, genome2 in parents(seed):
+        connections1, connections2 = genome1.connections_dict, genome2.connections_dict
+        for connection in crossover_compact(genome1, genome2, .5).connections:
+            weights = {connections1[connection.innovation_number].weight}
+            if connection.innovation_number in connections2:
+                weights.add(connections2[connection.innovation_number].weight)
+            assert connection.weight in weights
+
+
+@pytest.mark.parametrize('disabled_rate', [0, 1])
+def test_enabled_flags_match_crossover(disabled_rate):
+    # With a disabled_rate of 0 or 1 whether each Connection is enabled doesn't depend on the draws
+    for genome1, genome2 in parents(2):
+        child, compact_child = crossover(genome1, genome2, disabled_rate), \
+                               crossover_compact(genome1, genome2, disabled_rate)
+        assert {c.innovation_number: c.enabled for c in compact_child.connections} == \
+               {c.innovation_number: c.enabled for c in child.connections}
+
+
+def test_propagates_like_crossover_of_identical_parents():
+    for genome in random_genomes(20, seed=3):
+        child, compact_child = crossover(genome, genome.clone(), 0), crossover_compact(genome, genome.clone(), 0)
+        for input in [(0, 0, 0), (1, -1, .5), (2, .3, -4)]:
+            assert compact_child.propagate(input) == pytest.approx(engage(child, input), abs=1e-12)
+            assert Genome.from_compact(compact_child).propagate(input) == pytest.approx(child.propagate(input), abs=1e-12)
+
+
+def test_weight_inheritance_is_unbiased():
+    genome1, genome2 = random_genomes(2, seed=4, mutations=60)
+    for connection in genome2.connections:
+        connection.weight = 10.0
+    genome2.invalidate()
+    shared = genome1.innovation_numbers & genome2.innovation_numbers
+    assert shared
+
+    random.seed(5)
+    from_genome2 = 0
+    for _ in range(400):
+        child = crossover_compact(genome1, genome2, 0)
+        from_genome2 += sum(connection.weight == 10.0 for connection in child.connections
+                            if connection.innovation_number in shared)
+    assert from_genome2 / (400 * len(shared)) == pytest.approx(.5, abs=.05)
+
+
+def test_mutate_keeps_children_compact_unless_structure_is_added():
+    genome1, genome2 = random_genomes(2, seed=6)
+    weights_only = mutate(crossover_compact(genome1, genome2, .5), 1, .1, 0, 0, sigmoid, History())
+    assert isinstance(weights_only, CompactGenome)
+
+    child = crossover_compact(genome1, genome2, .5)
+    expanded = mutate(child, 0, .1, 1, 1, sigmoid, History())
+    assert isinstance(expanded, Genome)
+    assert len(expanded.nodes) == len(child.nodes) + 1
@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from neat.genome import Genome
+from neat.genome.activation_functions import sigmoid
+from neat.genome.derived_state import DerivedState
+from neat.evolution.mutation import add_connection, add_node
+from neat.history import History
+
+
+FIELDS = ['connection_count', 'innovation_numbers', 'connections_dict', 'nodes_dict', 'sorted_connections',
+          'layer_counts', 'targets', 'nodes_after', 'available_connections']
+
+
+def assert_up_to_date(genome):
+    """Assert that the Genome's (incrementally maintained) DerivedState is the same as one built
+    from scratch."""
+
+    fresh = DerivedState(genome.nodes, genome.layers)
+    for field in FIELDS:
+        assert getattr(genome.derived, field) == getattr(fresh, field), field
+
+    order = [(node.layer, node.number) for node in genome.nodes]
+    assert order == sorted(order)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_derived_state_is_kept_up_to_date(seed):
+    random.seed(seed)
+    history = History()
+    genome = Genome.new(3, 2, history)
+    genome.derived
+
+    for _ in range(60):
+        if random.random() < .5:
+            add_connection(genome, history)
+        else:
+            add_node(genome, sigmoid, history)
+        assert genome._derived is not None
+        assert_up_to_date(genome)
+
+
+def test_clones_and_invalidation_rebuild_derived_state():
+    random.seed(0)
+    history = History()
+    genome = Genome.new(3, 2, history)
+    for _ in range(20):
+        add_node(genome, sigmoid, history)
+        add_connection(genome, history)
+
+    assert_up_to_date(genome.clone())
+    genome.invalidate()
+    assert genome._derived is None
+    assert_up_to_date(genome)
+
+
+def test_fully_connected_genome_is_left_unchanged():
+    random.seed(0)
+    history = History()
+    genome = Genome.new(3, 2, history)
+    for _ in range(3):
+        add_node(genome, sigmoid, history)
+    while not genome.fully_connected:
+        add_connection(genome, history)
+    assert_up_to_date(genome)
+
+    connections = genome.connection_count
+    add_connection(genome, history)
+    assert genome.connection_count == connections
+    assert_up_to_date(genome)
+
+
+def test_topology_version_increases_with_structure():
+    random.seed(0)
+    history = History()
+    genome = Genome.new(3, 2, history)
+
+    versions = [genome.topology_version]
+    add_connection(genome, history)
+    versions.append(genome.topology_version)
+    add_node(genome, sigmoid, history)
+    versions.append(genome.topology_version)
+    genome.invalidate(weights_only=True)
+    versions.append(genome.topology_version)
+    genome.invalidate()
+    versions.append(genome.topology_version)
+
+    assert versions[0] < versions[1] < versions[2] == versions[3] < versions[4]
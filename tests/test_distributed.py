@@ -0,0 +1,107 @@
+import os
+from multiprocessing import Process
+
+import pytest
+
+from neat.distributed import DistributedExecutor, run_worker
+
+
+def double(value: int) -> int:
+    return value * 2
+
+
+def exit_once(task: tuple[str, int]) -> int:
+    """Kill the worker process the first time it is called with the given marker path."""
+
+    marker, value = task
+    if not os.path.exists(marker):
+        open(marker, 'w').close()
+        os._exit(1)
+    return value * 2
+
+
+def exit_always(value: int) -> int:
+    os._exit(1)
+
+
+class UnpicklableError(Exception):
+    def __reduce__(self):
+        raise TypeError('cannot pickle')
+
+
+def raise_error(value: int) -> int:
+    if value == 3:
+        raise ValueError('work failed')
+    return value
+
+
+def raise_unpicklable(value: int) -> int:
+    raise UnpicklableError('work failed')
+
+
+def test_results_come_back_in_order():
+    executor = DistributedExecutor(2, chunksize=3, authkey=b'test')
+    try:
+        assert executor.map(double, range(20)) == [value * 2 for value in range(20)]
+        assert sorted(executor.imap_unordered(double, range(20))) == [value * 2 for value in range(20)]
+        assert executor.map(double, []) == []
+    finally:
+        executor.shutdown()
+
+
+def test_other_workers_can_join():
+    executor = DistributedExecutor(0, authkey=b'test')
+    worker = Process(target=run_worker, args=(executor.manager.address, b'test'))
+    worker.start()
+    try:
+        assert executor.map(double, range(5)) == [0, 2, 4, 6, 8]
+    finally:
+        executor.shutdown()
+        worker.join()
+
+
+def test_batches_of_dead_workers_are_given_to_others(tmp_path):
+    executor = DistributedExecutor(2, chunksize=2, authkey=b'test', heartbeat_timeout=.5)
+    try:
+        marker = str(tmp_path / 'exited')
+        assert executor.map(exit_once, [(marker, i) for i in range(6)]) == [0, 2, 4, 6, 8, 10]
+    finally:
+        executor.shutdown(cancel=True)
+
+
+def test_worker_errors_are_raised():
+    executor = DistributedExecutor(2)
+    try:
+        with pytest.raises(ValueError, match='work failed'):
+            executor.map(raise_error, range(6))
+        with pytest.raises(Exception, match='UnpicklableError: work failed'):
+            executor.map(raise_unpicklable, [1])
+
+        # The workers survive errors
+        assert executor.map(double, range(3)) == [0, 2, 4]
+    finally:
+        executor.shutdown()
+
+
+def test_dead_workers_are_replaced(tmp_path):
+    executor = DistributedExecutor(1, chunksize=2, heartbeat_timeout=.5)
+    try:
+        marker = str(tmp_path / 'exited')
+        assert executor.map(exit_once, [(marker, i) for i in range(6)]) == [0, 2, 4, 6, 8, 10]
+        assert all(process.is_alive() for process in executor.local_workers)
+    finally:
+        executor.shutdown(cancel=True)
+
+
+def test_batch_killing_every_worker_fails():
+    executor = DistributedExecutor(1, heartbeat_timeout=.5, max_requeues=1)
+    try:
+        with pytest.raises(Exception, match='lost by 2 distributed workers'):
+            executor.map(exit_always, [1])
+    finally:
+        executor.shutdown(cancel=True)
+
+
+def test_authkey_is_required_off_localhost():
+    with pytest.raises(Exception, match='authkey must be given'):
+        DistributedExecutor(0, address=('0.0.0.0', 0))
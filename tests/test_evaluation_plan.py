@@ -0,0 +1,40 @@
+import pickle
+import random
+
+import pytest
+
+from tests.helpers import engage, random_genomes
+
+
+INPUTS = [tuple(random.Random(i).uniform(-2, 2) for _ in range(3)) for i in range(8)]
+
+
+@pytest.fixture(scope='module')
+def genomes():
+    return random_genomes(40)
+
+
+def test_plan_matches_engage(genomes):
+    for genome in genomes:
+        for input in INPUTS:
+            assert genome.propagate(input) == pytest.approx(engage(genome, input), abs=1e-12)
+
+
+def test_plan_is_rebuilt_after_invalidate(genomes):
+    genome = genomes[-1].clone()
+    genome.propagate(INPUTS[0])
+    for connection in genome.connections:
+        connection.weight *= -2
+        connection.enabled = not connection.enabled
+    genome.invalidate()
+
+    for input in INPUTS:
+        assert genome.propagate(input) == pytest.approx(engage(genome, input), abs=1e-12)
+
+
+def test_clones_and_pickles_propagate_the_same(genomes):
+    for genome in genomes:
+        genome.propagate(INPUTS[0])
+        for copy in (genome.clone(), pickle.loads(pickle.dumps(genome))):
+            for input in INPUTS:
+                assert copy.propagate(input) == genome.propagate(input)
@@ -0,0 +1,20 @@
+from neat.executors import SerialExecutor, ThreadExecutor, fastest_executor
+
+
+def increment(item: list[int]) -> int:
+    item[0] += 1
+    return item[0]
+
+
+def test_each_candidate_is_timed_on_a_new_sample():
+    samples = []
+    def sample() -> list[list[int]]:
+        samples.append([[0] for _ in range(4)])
+        return samples[-1]
+
+    executor = fastest_executor([SerialExecutor(1), ThreadExecutor(2)], increment, sample)
+    try:
+        assert len(samples) == 2
+        assert all(items == [[1]] * 4 for items in samples)
+    finally:
+        executor.shutdown()
@@ -0,0 +1,64 @@
+import pytest
+
+from neat.fitness_cache import FitnessCache, genome_hash
+from tests.helpers import players_with, random_genomes, simulate_xor
+
+
+def test_hash_depends_only_on_contents():
+    genomes = random_genomes(20)
+    hashes = [genome_hash(genome) for genome in genomes]
+    assert len(set(hashes)) == len(genomes)
+    for genome, hash in zip(genomes, hashes):
+        assert genome_hash(genome.clone()) == hash
+        assert genome_hash(genome.compact()) == hash
+
+    changed = genomes[0].clone()
+    next(changed.connections).weight += 1e-9
+    changed.invalidate()
+    assert genome_hash(changed) != hashes[0]
+
+
+def test_only_new_genomes_are_simulated():
+    genomes = random_genomes(10)
+    cache = FitnessCache(100, ['fitness'])
+
+    # The second half repeats the first, so only the first of each is simulated
+    players = players_with(genomes + [genome.clone() for genome in genomes])
+    keys = [genome_hash(player.genome) for player in players]
+    pending = cache.lookup(players, keys)
+    assert pending == list(range(10))
+    for i in pending:
+        simulate_xor(players[i])
+    assert cache.complete(players, keys, pending) == []
+    assert [player.fitness for player in players[10:]] == [player.fitness for player in players[:10]]
+
+    # Then none of them are
+    again = players_with([genome.clone() for genome in genomes])
+    assert cache.lookup(again, keys[:10]) == []
+    assert [player.fitness for player in again] == [player.fitness for player in players[:10]]
+    assert (cache.hits, cache.misses) == (20, 10)
+
+
+def test_least_recently_used_results_are_discarded():
+    genomes = random_genomes(6)
+    players = players_with(genomes)
+    keys = [genome_hash(genome) for genome in genomes]
+    cache = FitnessCache(4, [])
+
+    pending = cache.lookup(players, keys)
+    for i in pending:
+        simulate_xor(players[i])
+    cache.complete(players, keys, pending)
+
+    assert cache.lookup(players_with(genomes), keys) == [0, 1]
+
+
+def test_missing_results_are_reported():
+    players = players_with(random_genomes(3))
+    keys = [genome_hash(player.genome) for player in players]
+    cache = FitnessCache(10, [])
+    pending = cache.lookup(players, keys)
+    simulate_xor(players[0])
+
+    # Players that were never simulated (e.g. they exceeded their budget) have no result
+    assert cache.complete(players, keys, pending[:1]) == [1, 2]
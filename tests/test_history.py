@@ -0,0 +1,91 @@
+import pickle
+import random
+
+from neat.genome import Genome
+from neat.genome.activation_functions import sigmoid
+from neat.genome.connection import Connection
+from neat.history import History
+
+
+def scanned_innovation_number(history, genome, from_node, to_node):
+    """Return the innovation number the History used to give by checking every Innovation."""
+
+    for innovation in history.innovations:
+        if innovation.match(genome, from_node, to_node):
+            return innovation.number
+    return history.next_innovation_number
+
+
+class CheckedHistory(History):
+    """A History that checks every lookup against a scan of all its Innovations."""
+
+    def get_innovation_number(self, genome, from_node, to_node):
+        expected = scanned_innovation_number(self, genome, from_node, to_node)
+        number = super().get_innovation_number(genome, from_node, to_node)
+        assert number == expected
+        return number
+
+
+def test_index_matches_scan():
+    random.seed(0)
+    history = CheckedHistory()
+    genomes = [Genome.new(2, 1, history) for _ in range(10)]
+
+    # Grow copies of the same few Genomes so that many mutations repeat earlier Innovations
+    for _ in range(300):
+        genome = random.choice(genomes).clone()
+        connection = random.choice(list(genome.connections))
+        if random.random() < .5 or not connection.enabled:
+            nodes = sorted(random.sample(genome.nodes, 2), key=lambda node: node.layer)
+            if nodes[0].layer != nodes[1].layer and not nodes[0].connected_to(nodes[1]):
+                genome.add_connection(nodes[0], nodes[1], history)
+        else:
+            genome.add_node(connection, sigmoid, history)
+        genomes.append(genome)
+
+    assert len(history.innovations) < sum(len(genome.innovation_numbers) for genome in genomes)
+
+
+def test_repeated_innovation_numbers_fall_back_to_scan():
+    history = CheckedHistory()
+    genome = Genome.new(2, 1, history)
+    original = next(genome.connections)
+
+    # A Genome holding the same innovation number twice can't be looked up in the index
+    input_node = genome.nodes[0] if original.from_node is not genome.nodes[0] else genome.nodes[1]
+    output_node = genome.nodes[-1]
+    input_node.output_connections.append(Connection(input_node, output_node, 0.5, original.innovation_number))
+    genome.invalidate()
+
+    # The scan never matches such a Genome, so each lookup is a new Innovation
+    first = history.get_innovation_number(genome, genome.nodes[2], output_node)
+    assert history.get_innovation_number(genome, genome.nodes[2], output_node) == first + 1
+
+
+class RecordingHistory(History):
+    """A History that records the Genome (as it was), Nodes and result of every lookup."""
+
+    def __init__(self):
+        super().__init__()
+        self.lookups = []
+
+    def get_innovation_number(self, genome, from_node, to_node):
+        before = genome.clone()
+        number = super().get_innovation_number(genome, from_node, to_node)
+        self.lookups.append((before, from_node.number, to_node.number, number))
+        return number
+
+
+def test_index_is_rebuilt_on_load():
+    random.seed(1)
+    history = RecordingHistory()
+    for _ in range(20):
+        genome = Genome.new(3, 2, history)
+        for _ in range(5):
+            genome.add_node(random.choice([c for c in genome.connections if c.enabled]), sigmoid, history)
+
+    loaded = pickle.loads(pickle.dumps(history))
+    for before, from_number, to_number, number in history.lookups:
+        nodes = before.nodes_dict
+        assert loaded.get_innovation_number(before, nodes[from_number], nodes[to_number]) == number
+    assert len(loaded.innovations) == len(history.innovations)
@@ -0,0 +1,17 @@
+from neat.genome import Genome
+from neat.genome.activation_functions import sigmoid
+from neat.evolution.mutation import add_node
+from neat.history import History
+from tests.helpers import structure
+
+
+def test_add_node_leaves_genomes_without_enabled_connections_unchanged():
+    history = History()
+    genome = Genome.new(3, 2, history)
+    for connection in genome.connections:
+        connection.enabled = False
+    before = structure(genome)
+
+    add_node(genome, sigmoid, history)
+
+    assert structure(genome) == before
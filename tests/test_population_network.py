@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from neat.genome import Genome
+from neat.history import History
+from neat.population import PopulationNetwork
+from tests.helpers import engage, random_genomes
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.fixture(scope='module')
+def genomes():
+    return random_genomes(40)
+
+
+def test_matches_engage_for_every_genome(genomes):
+    network = PopulationNetwork(genomes)
+    for seed in range(8):
+        inputs = np.array([[random.Random(seed * 100 + i).uniform(-2, 2) for _ in range(3)]
+                           for i in range(len(genomes))])
+        expected = np.array([engage(genome, tuple(input)) for genome, input in zip(genomes, inputs)])
+        np.testing.assert_allclose(network.propagate(inputs), expected, atol=1e-12)
+
+
+def test_single_genome_matches_propagate(genomes):
+    for genome in genomes[:10]:
+        network = PopulationNetwork([genome])
+        np.testing.assert_allclose(network.propagate(np.array([[.5, -1, 2]]))[0],
+                                   genome.propagate((.5, -1, 2)), atol=1e-12)
+
+
+def test_rejects_mismatched_genomes():
+    history = History()
+    with pytest.raises(ValueError):
+        PopulationNetwork([Genome.new(3, 2, history), Genome.new(2, 2, history)])
+    with pytest.raises(ValueError):
+        PopulationNetwork([])
+
+
+def test_rejects_the_wrong_shape(genomes):
+    with pytest.raises(ValueError):
+        PopulationNetwork(genomes).propagate(np.zeros((len(genomes) - 1, 3)))
@@ -0,0 +1,127 @@
+import json
+import random
+import time
+
+import pytest
+
+import neat
+from neat.genome import Genome, CompactGenome
+from tests.helpers import XorPlayer, run_settings, simulate_xor
+
+
+EXECUTORS = [
+    ('serial', 'players'),
+    ('thread', 'players'),
+    ('process', 'players'),
+    ('process', 'genomes'),
+    ('process', 'shared_memory'),
+]
+
+
+def simulate_raising(player: XorPlayer) -> XorPlayer:
+    raise ValueError('simulation failed')
+
+
+@pytest.fixture(autouse=True)
+def seed():
+    random.seed(0)
+
+
+@pytest.mark.parametrize('executor, transport', EXECUTORS + [('auto', 'players'), ('distributed', 'players'), 
+                                                  ('distributed', 'genomes')])
+def test_run_completes(tmp_path, executor, transport):
+    settings = run_settings(tmp_path, executor=executor, transport=transport)
+    neat.run(XorPlayer, simulate_xor, settings)
+    assert (tmp_path / 'population').is_dir()
+
+
+@pytest.mark.parametrize('executor, transport', EXECUTORS + [('distributed', 'players'), ('distributed', 'genomes')])
+def test_simulate_raising_is_raised_by_run(tmp_path, executor, transport):
+    settings = run_settings(tmp_path, executor=executor, transport=transport)
+    with pytest.raises(ValueError, match='simulation failed'):
+        neat.run(XorPlayer, simulate_raising, settings)
+
+
+def simulate_sleeping(player: XorPlayer) -> XorPlayer:
+    time.sleep(10)
+    return simulate_xor(player)
+
+
+def simulate_hanging(player: XorPlayer) -> XorPlayer:
+    # Catching Exception mustn't be enough to survive the budget
+    while True:
+        try:
+            time.sleep(1)
+        except Exception:
+            pass
+
+
+@pytest.mark.parametrize('executor', ['serial', 'process'])
+def test_budget_interrupts_hanging_simulations_in_run(tmp_path, executor):
+    settings = run_settings(tmp_path, executor=executor, budget=.05, fallback_fitness=1)
+    settings['total_generations'] = 1
+
+    start = time.perf_counter()
+    neat.run(XorPlayer, simulate_hanging, settings)
+    assert time.perf_counter() - start < 20 * .05 + 5
+
+
+@pytest.mark.parametrize('scheduling', ['static', 'dynamic'])
+def test_budget_interrupts_simulations_in_run(tmp_path, scheduling):
+    settings = run_settings(tmp_path, executor='process', scheduling=scheduling, budget=.05, fallback_fitness=1)
+    settings['total_generations'] = 1
+
+    start = time.perf_counter()
+    neat.run(XorPlayer, simulate_sleeping, settings)
+    assert time.perf_counter() - start < 5
+
+
+@pytest.mark.parametrize('transport', ['players', 'genomes', 'shared_memory'])
+def test_deterministic_run_completes(tmp_path, transport):
+    settings = run_settings(tmp_path, executor='process', transport=transport, deterministic=True)
+    neat.run(XorPlayer, simulate_xor, settings)
+
+
+def simulate_full_genome(player: XorPlayer) -> XorPlayer:
+    assert type(player.genome) is Genome
+    return simulate_xor(player)
+
+
+def simulate_compact_genome(player: XorPlayer) -> XorPlayer:
+    assert isinstance(player.genome, CompactGenome)
+    return simulate_xor(player)
+
+
+@pytest.mark.parametrize('transport', ['genomes', 'shared_memory'])
+@pytest.mark.parametrize('compact_players', [False, True])
+def test_players_get_compact_genomes_only_if_chosen(tmp_path, transport, compact_players):
+    settings = run_settings(tmp_path, executor='process', transport=transport, compact_players=compact_players)
+    neat.run(XorPlayer, simulate_compact_genome if compact_players else simulate_full_genome, settings)
+
+
+
+def genomes_serialized(tmp_path, executor, transport) -> int:
+    """Return the genomes_serialized count of the first generation of a timed run."""
+
+    random.seed(0)
+    folder = tmp_path / executor / transport
+    folder.mkdir(parents=True)
+    settings = run_settings(folder, executor=executor, transport=transport)
+    settings['progress_settings'].update(timings=True, timings_filename=str(folder / 'timings.jsonl'))
+    neat.run(XorPlayer, simulate_xor, settings)
+    with (folder / 'timings.jsonl').open() as record:
+        return json.loads(record.readline())['genomes_serialized']
+
+
+@pytest.mark.parametrize('executor, transport', [
+    ('thread', 'players'),
+    ('thread', 'genomes'),
+    ('process', 'players'),
+    ('process', 'genomes'),
+    ('process', 'shared_memory'),
+])
+def test_only_genomes_sent_to_processes_are_counted(tmp_path, executor, transport):
+    # Saving the Population counts the same Genomes every time, so only those sent to processes differ
+    saved = genomes_serialized(tmp_path, 'serial', 'players')
+    sent = 20 if executor == 'process' else 0
+    assert genomes_serialized(tmp_path, executor, transport) == saved + sent
@@ -0,0 +1,68 @@
+import asyncio
+import random
+import time
+
+import pytest
+
+import neat
+from tests.helpers import XorPlayer, run_settings, simulate_xor
+
+
+@pytest.fixture(autouse=True)
+def seed():
+    random.seed(0)
+
+
+def test_players_are_simulated_concurrently(tmp_path):
+    running, most_running, simulated = 0, 0, 0
+    async def simulate(player: XorPlayer) -> None:
+        nonlocal running, most_running, simulated
+        running += 1
+        most_running = max(most_running, running)
+        await asyncio.sleep(.01)
+        simulate_xor(player)
+        running -= 1
+        simulated += 1
+
+    settings = run_settings(tmp_path, concurrency=5)
+    asyncio.run(neat.run_async(XorPlayer, simulate, settings))
+
+    assert simulated >= settings['population_settings']['size']
+    assert most_running == 5
+
+
+def test_budget_cancels_slow_simulations(tmp_path):
+    cancelled = 0
+    async def simulate(player: XorPlayer) -> None:
+        nonlocal cancelled
+        simulate_xor(player)
+        if random.random() < .5:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+
+    settings = run_settings(tmp_path, budget=.05, fallback_fitness=1)
+    start = time.perf_counter()
+    asyncio.run(neat.run_async(XorPlayer, simulate, settings))
+
+    assert time.perf_counter() - start < 5
+    assert cancelled > 0
+
+
+def test_simulate_raising_cancels_the_rest(tmp_path):
+    cancelled = 0
+    async def simulate(player: XorPlayer) -> None:
+        nonlocal cancelled
+        if random.random() < .2:
+            raise ValueError('simulation failed')
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+
+    with pytest.raises(ValueError, match='simulation failed'):
+        asyncio.run(neat.run_async(XorPlayer, simulate, run_settings(tmp_path)))
+    assert cancelled > 0
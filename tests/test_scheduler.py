@@ -0,0 +1,62 @@
+import time
+
+import pytest
+
+from neat.executors import SerialExecutor, ProcessExecutor
+from neat.scheduler import Scheduler
+
+
+def sleep_for(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+def sleep_stubbornly(seconds: float) -> float:
+    # Catching Exception mustn't be enough to survive the budget
+    try:
+        time.sleep(seconds)
+    except Exception:
+        time.sleep(seconds)
+    return seconds
+
+
+@pytest.mark.parametrize('ExecutorClass', [SerialExecutor, ProcessExecutor])
+@pytest.mark.parametrize('dynamic', [False, True])
+def test_budget_interrupts_long_calls(ExecutorClass, dynamic):
+    scheduler = Scheduler(ExecutorClass(2), dynamic=dynamic, budget=.2)
+    try:
+        results, exceeded = scheduler.map(sleep_for, [0, 5, .01, 5])
+    finally:
+        scheduler.shutdown()
+
+    assert results == [0, None, .01, None]
+    assert exceeded == [1, 3]
+
+
+@pytest.mark.parametrize('ExecutorClass', [SerialExecutor, ProcessExecutor])
+def test_catching_exception_does_not_survive_the_budget(ExecutorClass):
+    scheduler = Scheduler(ExecutorClass(2), budget=.2)
+    try:
+        start = time.perf_counter()
+        assert scheduler.map(sleep_stubbornly, [5, .01]) == ([None, .01], [0])
+        assert time.perf_counter() - start < 4
+    finally:
+        scheduler.shutdown()
+
+
+def test_dynamic_scheduling_starts_the_longest_first():
+    started = []
+    def record(seconds: float) -> float:
+        started.append(seconds)
+        return sleep_for(seconds)
+
+    scheduler = Scheduler(SerialExecutor(1), dynamic=True)
+    keys = ['short', 'long', 'medium']
+    assert scheduler.map(record, [.001, .03, .01], keys) == ([.001, .03, .01], [])
+    assert scheduler.expected_runtime('long') > scheduler.expected_runtime('medium') > \
+           scheduler.expected_runtime('short')
+
+    # Unknown keys are expected to take the average
+    started.clear()
+    assert scheduler.map(record, [.001, .01, .03, .02], keys + ['new'])[0] == [.001, .01, .03, .02]
+    assert started == [.01, .02, .03, .001]
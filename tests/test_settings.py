@@ -0,0 +1,22 @@
+import pytest
+
+from neat.settings import evaluation_settings_handler
+
+
+def test_none_defaults_are_not_announced(capsys):
+    evaluation_settings_handler({'evaluation_settings': {}})
+    output = capsys.readouterr().out
+
+    assert 'workers' in output
+    assert 'None' not in output
+
+
+@pytest.mark.parametrize('fallback_fitness', [-1, -.5, 0, 2.5])
+def test_any_fallback_fitness_is_accepted(fallback_fitness):
+    settings = evaluation_settings_handler({'evaluation_settings': {'fallback_fitness': fallback_fitness}}, silent=True)
+    assert settings['evaluation_settings']['fallback_fitness'] == fallback_fitness
+
+
+def test_invalid_evaluation_settings_are_rejected():
+    with pytest.raises(ValueError):
+        evaluation_settings_handler({'evaluation_settings': {'workers': -1}}, silent=True)
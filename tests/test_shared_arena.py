@@ -0,0 +1,108 @@
+import multiprocessing
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+from pathlib import Path
+import subprocess
+import sys
+import time
+
+import pytest
+
+from neat.shared_arena import GenomeArena
+from tests.helpers import random_genomes, structure
+
+
+@pytest.fixture
+def arena():
+    arena = GenomeArena.pack(random_genomes(30), 3)
+    yield arena
+    arena.close()
+    arena.unlink()
+
+
+def write_results(name: str, indices: list[int]) -> None:
+    arena = GenomeArena.attach(name)
+    for index in indices:
+        genome = arena.genome(index)
+        arena.write_results(index, [index, genome.propagate((1, 0, -1))[0], len(genome.node_numbers)])
+        del genome
+    arena.close()
+
+
+def test_genomes_read_back_unchanged(arena):
+    for index, genome in enumerate(random_genomes(30)):
+        compact = arena.genome(index)
+        assert structure(compact) == structure(genome)
+        assert compact.propagate((1, 0, -1)) == genome.propagate((1, 0, -1))
+        del compact
+
+
+def test_clones_of_views_outlive_the_arena():
+    genomes = random_genomes(5)
+    arena = GenomeArena.pack(genomes, 1)
+    clones = []
+    try:
+        for index in range(len(genomes)):
+            view = arena.genome(index)
+            clones.append(view.clone())
+            del view
+    finally:
+        arena.close()
+        arena.unlink()
+
+    for clone, genome in zip(clones, genomes):
+        assert structure(clone) == structure(genome)
+
+
+def test_workers_write_results_back():
+    genomes = random_genomes(30)
+    arena = GenomeArena.pack(genomes, 3)
+    try:
+        workers = [multiprocessing.Process(target=write_results, args=(arena.name, list(range(i, 30, 3))))
+                   for i in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            assert worker.exitcode == 0
+
+        assert arena.results() == [[index, genome.propagate((1, 0, -1))[0], len(genome.nodes)]
+                                   for index, genome in enumerate(genomes)]
+    finally:
+        arena.close()
+        arena.unlink()
+
+
+def attach_and_close(connection: Connection) -> None:
+    GenomeArena.attach(connection.recv()).close()
+
+
+def check_block_outlives_worker(start_method: str) -> None:
+    """Start a worker before any arena is packed (as neat.run does), and check that the block it
+    attaches to isn't unlinked when it exits."""
+
+    parent_end, worker_end = multiprocessing.Pipe()
+    worker = multiprocessing.get_context(start_method).Process(target=attach_and_close, args=(worker_end,))
+    worker.start()
+    arena = GenomeArena.pack(random_genomes(3), 1)
+    try:
+        parent_end.send(arena.name)
+        worker.join()
+        assert worker.exitcode == 0
+
+        # Give a resource tracker of the worker's own time to clean up after it
+        time.sleep(.5)
+        shared_memory.SharedMemory(name=arena.name).close()
+    finally:
+        arena.close()
+        arena.unlink()
+
+
+@pytest.mark.parametrize('start_method', ['fork', 'spawn', 'forkserver'])
+def test_blocks_outlive_workers_that_attach(start_method):
+    # In a new interpreter, so that no resource tracker has been started yet
+    check = f'from tests.test_shared_arena import check_block_outlives_worker; check_block_outlives_worker({start_method!r})'
+    result = subprocess.run([sys.executable, '-c', check], cwd=Path(__file__).parent.parent, capture_output=True,
+                            text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stderr == ''
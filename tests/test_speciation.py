@@ -0,0 +1,66 @@
+import pytest
+
+from neat.population.species import Species
+from neat.population.speciation import bulk_speciate
+from neat.instrumentation import instrumentation
+from tests.helpers import players_with, random_genomes
+
+pytest.importorskip('numpy')
+
+
+def sequential_speciate(players, species, settings, compact):
+    """Split the Players into the Species one pair at a time, as Population.speciate does without
+    bulk_speciation."""
+
+    for player in players:
+        for specie in species:
+            if specie.is_same_species(player):
+                specie.players.append(player)
+                break
+        else:
+            species.append(Species(player, settings, compact))
+
+
+def memberships(species, players):
+    return [[players.index(player) for player in specie.players] for specie in species]
+
+
+@pytest.mark.parametrize('weight_coefficient, threshold', [
+    (0.4, 0.5),
+    (0.4, 1.5),
+    (0.4, 3),
+    # Without the weight term distances are whole numbers, so many lie exactly on the threshold
+    (0, 2),
+    (0, 3),
+])
+@pytest.mark.parametrize('compact', [False, True])
+def test_bulk_matches_sequential(weight_coefficient, threshold, compact):
+    settings = {
+        'excess_coefficient': 1,
+        'disjoint_coefficient': 1,
+        'weight_difference_coefficient': weight_coefficient,
+        'compatibility_threshold': threshold,
+        'max_staleness': 15,
+    }
+    genomes = random_genomes(120, seed=1)
+    reps, rest = players_with(genomes[:5]), players_with(genomes[5:])
+
+    results, counters = [], []
+    instrumentation.enabled = True
+    try:
+        for speciate in (sequential_speciate, bulk_speciate):
+            species = [Species(rep, settings, compact) for rep in reps]
+            for specie in species:
+                specie.players = []
+            instrumentation.collect()
+            speciate(rest, species, settings, compact)
+            results.append(memberships(species, rest))
+            counters.append(instrumentation.collect()[1])
+    finally:
+        instrumentation.enabled = False
+
+    assert results[0] == results[1]
+    assert len(results[0]) > len(reps)
+
+    # Both count the distances checking each Species in turn computes
+    assert counters[0] == counters[1]
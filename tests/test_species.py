@@ -0,0 +1,51 @@
+import pytest
+
+from neat.population.species import Species
+from tests.helpers import players_with, random_genomes
+
+
+SETTINGS = {
+    'excess_coefficient': 1,
+    'disjoint_coefficient': 1,
+    'weight_difference_coefficient': 0.4,
+    'compatibility_threshold': 3,
+    'max_staleness': 15,
+}
+
+
+def scanned_comparison(rep, genome):
+    """Return the excess, disjoint and average weight difference of the Genome against the rep by
+    checking every pair of Connections, as Species used to."""
+
+    rep_innovations = {connection.innovation_number for connection in rep.connections}
+    excess, disjoint = 0, 0
+    for connection in genome.connections:
+        if connection.innovation_number not in rep_innovations:
+            if connection.innovation_number > max(rep_innovations):
+                excess += 1
+            else:
+                disjoint += 1
+
+    matching, total_difference = 0, .0
+    for connection1 in rep.connections:
+        for connection2 in genome.connections:
+            if connection1.innovation_number == connection2.innovation_number:
+                matching += 1
+                total_difference += abs(connection1.weight - connection2.weight)
+                break
+
+    return excess, disjoint, total_difference / matching if matching else 100
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_compare_matches_scan(compact):
+    genomes = random_genomes(30, seed=1)
+    players = players_with(genomes)
+    for rep in players[:10]:
+        specie = Species(rep, SETTINGS, compact)
+        for genome in genomes:
+            for compared in (genome, genome.compact()):
+                excess, disjoint, difference = specie.compare(compared)
+                expected_excess, expected_disjoint, expected_difference = scanned_comparison(rep.genome, genome)
+                assert (excess, disjoint) == (expected_excess, expected_disjoint)
+                assert difference == pytest.approx(expected_difference, abs=1e-12)
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+import neat
+from neat.evolution.mutation import mutate_population_weights
+from neat.genome import CompactGenome
+from tests.helpers import XorPlayer, engage, random_genomes, run_settings, simulate_xor, structure
+
+pytest.importorskip('numpy')
+
+
+def without_weights(genome):
+    nodes, connections = structure(genome)
+    return nodes, [connection[:2] + connection[3:] for connection in connections]
+
+
+def weights(genome):
+    return [connection.weight for connection in genome.connections]
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_only_weights_are_mutated(compact):
+    genomes = random_genomes(20)
+    if compact:
+        genomes = [CompactGenome.from_genome(genome) for genome in genomes]
+    before = [(without_weights(genome), weights(genome)) for genome in genomes]
+
+    mutate_population_weights(genomes, .1)
+
+    changed = total = 0
+    for genome, (genome_structure, genome_weights) in zip(genomes, before):
+        assert without_weights(genome) == genome_structure
+        assert all(-1 <= weight <= 1 for weight in weights(genome))
+        changed += sum(old != new for old, new in zip(genome_weights, weights(genome)))
+        total += len(genome_weights)
+    assert changed > .9 * total
+
+
+def test_plans_are_invalidated():
+    genomes = random_genomes(10)
+    outputs = [genome.propagate((1, 0, -1)) for genome in genomes]
+
+    mutate_population_weights(genomes, 1)
+
+    for genome, output in zip(genomes, outputs):
+        assert genome.propagate((1, 0, -1)) == pytest.approx(engage(genome, (1, 0, -1)), abs=1e-12)
+        assert genome.propagate((1, 0, -1)) != output
+
+
+def test_seeding_the_random_module_repeats_mutations():
+    mutated = []
+    for _ in range(2):
+        genomes = random_genomes(5)
+        random.seed(1)
+        mutate_population_weights(genomes, .1)
+        mutated.append([weights(genome) for genome in genomes])
+    assert mutated[0] == mutated[1]
+
+
+def test_replaced_weights_are_uniform():
+    genomes = random_genomes(50, mutations=60)
+    mutate_population_weights(genomes, 1)
+    all_weights = [weight for genome in genomes for weight in weights(genome)]
+    assert sum(all_weights) / len(all_weights) == pytest.approx(0, abs=.1)
+    assert sum(weight > .5 for weight in all_weights) / len(all_weights) == pytest.approx(.25, abs=.1)
+
+
+@pytest.mark.parametrize('compact_crossover', [False, True])
+def test_vectorized_run_completes(tmp_path, compact_crossover):
+    random.seed(0)
+    settings = run_settings(tmp_path)
+    settings['reproduction_settings'].update(vectorized_mutation=True, compact_crossover=compact_crossover)
+    neat.run(XorPlayer, simulate_xor, settings)